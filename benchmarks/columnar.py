@@ -0,0 +1,89 @@
+"""
+Converting search result pages into columns by hand from pydantic models and with
+bugout.columnar.
+
+Usage:
+    python benchmarks/columnar.py --items 1000 --pages 10 --calls 20
+"""
+
+import argparse
+import re
+from typing import Any, Dict, List
+
+from bugout.columnar import SearchResultColumns
+from bugout.data import BugoutSearchResults
+from bugout.views import SearchResultsView
+
+from common import measure, report
+from stub import StubRequest, StubServer, search
+
+TOKEN = "benchmark"
+
+
+def search_payload(server: StubServer, items: int) -> Dict[str, Any]:
+    journal_id = server.state.seed(entries=items)["id"]
+    match = re.match(r"journals/(?P<journal_id>[^/]+)", f"journals/{journal_id}")
+    assert match is not None
+    _, results = search(
+        server.state, StubRequest(match, {"limit": [str(items)]}, {}, TOKEN)
+    )
+    return results
+
+
+def by_hand(pages: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    columns: Dict[str, List[Any]] = {
+        "entry_url": [],
+        "title": [],
+        "tags": [],
+        "created_at": [],
+        "score": [],
+    }
+    for page in pages:
+        for result in BugoutSearchResults(**page).results:
+            columns["entry_url"].append(result.entry_url)
+            columns["title"].append(result.title)
+            columns["tags"].append(result.tags)
+            columns["created_at"].append(result.created_at)
+            columns["score"].append(result.score)
+    return columns
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bugout columnar decoding benchmark")
+    parser.add_argument("--items", type=int, default=1000, help="Results per page")
+    parser.add_argument("--pages", type=int, default=10, help="Pages per call")
+    parser.add_argument("--calls", type=int, default=20, help="Calls per case")
+    args = parser.parse_args()
+
+    with StubServer() as server:
+        pages = [search_payload(server, args.items)] * args.pages
+    rows = args.items * args.pages
+
+    report(
+        "models to lists by hand (rows)",
+        measure(lambda: by_hand(pages), args.calls),
+        operations=rows * args.calls,
+    )
+    report(
+        "SearchResultColumns (rows)",
+        measure(
+            lambda: SearchResultColumns.from_pages(
+                SearchResultsView(page) for page in pages
+            ),
+            args.calls,
+        ),
+        operations=rows * args.calls,
+    )
+    try:
+        columns = SearchResultColumns.from_pages(pages)
+        report(
+            "SearchResultColumns.to_arrow (rows)",
+            measure(columns.to_arrow, args.calls),
+            operations=rows * args.calls,
+        )
+    except ImportError as e:
+        print(f"Skipping Arrow conversion: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Timing helpers shared by benchmarks.
+"""
+
+import statistics
+import time
+from typing import Any, Callable, List, Optional
+
+
+def measure(call: Callable[[], Any], calls: int) -> List[float]:
+    latencies: List[float] = []
+    for _ in range(calls):
+        started_at = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - started_at)
+    return latencies
+
+
+def percentile(latencies_ms: List[float], percent: float) -> float:
+    index = max(int(len(latencies_ms) * percent / 100) - 1, 0)
+    return latencies_ms[index]
+
+
+def report(
+    name: str,
+    latencies: List[float],
+    elapsed: Optional[float] = None,
+    operations: Optional[int] = None,
+) -> None:
+    """
+    Prints latency percentiles of calls and throughput. Throughput is counted from
+    elapsed wall time when given (for concurrent cases) and from sum of latencies
+    otherwise, operations allows to count e.g. entries instead of calls.
+    """
+    latencies_ms = sorted(latency * 1000 for latency in latencies)
+    if elapsed is None:
+        elapsed = sum(latencies)
+    if operations is None:
+        operations = len(latencies)
+    ops = operations / elapsed if elapsed > 0 else 0.0
+    print(
+        f"{name:<40} ops/sec={ops:>10.1f} mean={statistics.mean(latencies_ms):.3f}ms "
+        f"p50={percentile(latencies_ms, 50):.3f}ms "
+        f"p99={percentile(latencies_ms, 99):.3f}ms"
+    )
@@ -0,0 +1,82 @@
+"""
+Response decoding cost with pydantic validation and with fast_decode.
+
+Decodes large BugoutJournalEntries and BugoutSearchResults payloads directly and
+measures search page calls through client against stub server.
+
+Usage:
+    python benchmarks/decode.py --items 1000 --calls 200
+"""
+
+import argparse
+import re
+from typing import Any, Dict
+
+from bugout.app import Bugout
+from bugout.data import BugoutJournalEntries, BugoutSearchResults
+from bugout.decode import decode
+
+from common import measure, report
+from stub import StubRequest, StubServer, get_entries, search
+
+TOKEN = "benchmark"
+
+
+def payloads(server: StubServer, items: int) -> Dict[str, Any]:
+    journal_id = server.state.seed(entries=items)["id"]
+    match = re.match(r"journals/(?P<journal_id>[^/]+)", f"journals/{journal_id}")
+    assert match is not None
+    _, entries = get_entries(server.state, StubRequest(match, {}, {}, TOKEN))
+    _, results = search(
+        server.state,
+        StubRequest(match, {"limit": [str(items)]}, {}, TOKEN),
+    )
+    return {"journal_id": journal_id, "entries": entries, "results": results}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bugout response decoding benchmark")
+    parser.add_argument("--items", type=int, default=1000, help="Items per payload")
+    parser.add_argument("--calls", type=int, default=200, help="Calls per case")
+    args = parser.parse_args()
+
+    with StubServer() as server:
+        data = payloads(server, args.items)
+        for validate in (True, False):
+            report(
+                f"decode BugoutJournalEntries (validate={validate})",
+                measure(
+                    lambda: decode(BugoutJournalEntries, data["entries"], validate),
+                    args.calls,
+                ),
+            )
+            report(
+                f"decode BugoutSearchResults (validate={validate})",
+                measure(
+                    lambda: decode(BugoutSearchResults, data["results"], validate),
+                    args.calls,
+                ),
+            )
+
+        for fast_decode in (False, True):
+            with Bugout(
+                brood_api_url=server.url,
+                spire_api_url=server.url,
+                fast_decode=fast_decode,
+            ) as bugout:
+                report(
+                    f"search page of {args.items} (fast_decode={fast_decode})",
+                    measure(
+                        lambda: bugout.search(
+                            token=TOKEN,
+                            journal_id=data["journal_id"],
+                            query="",
+                            limit=args.items,
+                        ),
+                        args.calls,
+                    ),
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Load of resources used as key/value store: single create_resource calls against bulk
+create, update and delete with bounded concurrency.
+
+Usage:
+    python benchmarks/resources.py --resources 100000 --concurrency 16
+    python benchmarks/resources.py --resources 10000 --latency 5
+"""
+
+import argparse
+import time
+import uuid
+
+from bugout.app import Bugout
+from bugout.resource_bulk import (
+    BulkResourceReport,
+    bulk_create_resources,
+    bulk_delete_resources,
+    bulk_update_resources,
+)
+
+from stub import StubServer
+
+TOKEN = "benchmark"
+
+
+def print_report(name: str, report: BulkResourceReport) -> None:
+    print(
+        f"{name:<40} ops/sec={report.total / report.elapsed_seconds:>10.1f} "
+        f"total={report.total} failed={report.failed}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bugout bulk resources benchmark")
+    parser.add_argument("--resources", type=int, default=100000, help="Resources")
+    parser.add_argument(
+        "--sequential", type=int, default=2000, help="Resources created one by one"
+    )
+    parser.add_argument("--concurrency", type=int, default=8, help="Requests in flight")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Stub response latency in ms"
+    )
+    args = parser.parse_args()
+
+    application_id = str(uuid.uuid4())
+    with StubServer(latency=args.latency / 1000) as server:
+        with Bugout(
+            brood_api_url=server.url,
+            spire_api_url=server.url,
+            pool_maxsize=max(args.concurrency, 10),
+        ) as bugout:
+            started_at = time.perf_counter()
+            for index in range(args.sequential):
+                bugout.create_resource(
+                    token=TOKEN,
+                    application_id=application_id,
+                    resource_data={"type": "sequential", "key": index},
+                )
+            elapsed = time.perf_counter() - started_at
+            print(
+                f"{'create_resource one by one':<40} "
+                f"ops/sec={args.sequential / elapsed:>10.1f} total={args.sequential}"
+            )
+
+            created = bulk_create_resources(
+                bugout.resource,
+                TOKEN,
+                application_id,
+                ({"type": "bulk", "key": index} for index in range(args.resources)),
+                concurrency=args.concurrency,
+                keep_results=True,
+            )
+            print_report("bulk_create_resources", created)
+
+            resource_ids = [
+                result.resource_id
+                for result in created.results
+                if result.resource_id is not None
+            ]
+            print_report(
+                "bulk_update_resources",
+                bulk_update_resources(
+                    bugout.resource,
+                    TOKEN,
+                    (
+                        (resource_id, {"value": index}, ["key"])
+                        for index, resource_id in enumerate(resource_ids)
+                    ),
+                    concurrency=args.concurrency,
+                ),
+            )
+            print_report(
+                "bulk_delete_resources",
+                bulk_delete_resources(
+                    bugout.resource,
+                    TOKEN,
+                    resource_ids,
+                    concurrency=args.concurrency,
+                ),
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Peak client memory and time of reading large journal with get_entries and with
+stream_entries.
+
+Stub runs in a child process, so tracemalloc counts allocations of the client only.
+
+Usage:
+    python benchmarks/streaming.py --entries 20000
+"""
+
+import argparse
+import multiprocessing
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from bugout.app import Bugout
+
+from stub import StubServer
+
+TOKEN = "benchmark"
+
+
+def serve(entries: int, content_size: int, connection: Any, stop: Any) -> None:
+    with StubServer() as server:
+        journal = server.state.seed(entries=0)
+        with server.state.lock:
+            for index in range(entries):
+                server.state.add_entry(
+                    journal["id"],
+                    {
+                        "title": f"Entry {index}",
+                        "content": f"{index} " + "x" * content_size,
+                        "tags": ["benchmark", f"index:{index}"],
+                    },
+                )
+        connection.send((server.url, journal["id"]))
+        stop.wait()
+
+
+def profile(name: str, read: Callable[[], int]) -> None:
+    tracemalloc.start()
+    started_at = time.perf_counter()
+    count = read()
+    elapsed = time.perf_counter() - started_at
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{name:<40} entries={count:>8} elapsed={elapsed:>7.2f}s "
+        f"peak={peak / 1024 / 1024:>8.1f}MiB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bugout streaming benchmark")
+    parser.add_argument("--entries", type=int, default=20000, help="Journal entries")
+    parser.add_argument(
+        "--content-size", type=int, default=1024, help="Entry content bytes"
+    )
+    args = parser.parse_args()
+
+    parent_connection, child_connection = multiprocessing.Pipe()
+    stop = multiprocessing.Event()
+    process = multiprocessing.Process(
+        target=serve, args=(args.entries, args.content_size, child_connection, stop)
+    )
+    process.start()
+    try:
+        url, journal_id = parent_connection.recv()
+        with Bugout(brood_api_url=url, spire_api_url=url) as bugout:
+            profile(
+                "get_entries",
+                lambda: len(
+                    bugout.get_entries(token=TOKEN, journal_id=journal_id).entries
+                ),
+            )
+            profile(
+                "stream_entries",
+                lambda: sum(
+                    1 for _ in bugout.stream_entries(token=TOKEN, journal_id=journal_id)
+                ),
+            )
+    finally:
+        stop.set()
+        process.join()
+
+
+if __name__ == "__main__":
+    main()
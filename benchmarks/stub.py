@@ -0,0 +1,1056 @@
+"""
+In-process stub of Bugout Brood and Spire APIs for offline benchmarks.
+
+Implements endpoints used by bugout.user, bugout.group, bugout.resource, bugout.journal
+and bugout.humbug with in-memory state. Any unknown bearer token is accepted and belongs
+to default stub user, so benchmarks do not need to create users first. GET responses
+carry ETag of body and are answered with 304 when If-None-Match matches it. Request
+bodies with Content-Encoding: gzip are accepted and responses of 1 KiB or more are
+compressed with gzip when client accepts it.
+"""
+
+from datetime import datetime, timezone
+import gzip
+import hashlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
+from urllib.parse import parse_qs, urlsplit
+import uuid
+
+JSONBody = Any
+Params = Dict[str, List[str]]
+Handler = Callable[["StubState", "StubRequest"], Tuple[int, JSONBody]]
+
+RANGE_TERM = re.compile(
+    r"^(?P<field>created_at|updated_at):(?P<op>>=|<=|>|<)(?P<value>\d+(\.\d+)?)$"
+)
+RANGE_OPS: Dict[str, Callable[[float, float], bool]] = {
+    ">=": lambda a, b: a >= b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    "<": lambda a, b: a < b,
+}
+
+
+def now() -> str:
+    return datetime.utcnow().isoformat()
+
+
+class StubError(Exception):
+    def __init__(self, status: int, detail: str) -> None:
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+class StubRequest:
+    def __init__(
+        self,
+        match: "re.Match[str]",
+        params: Params,
+        body: Dict[str, Any],
+        token: Optional[str],
+    ) -> None:
+        self.match = match
+        self.params = params
+        self.body = body
+        self.token = token
+
+    def path_param(self, name: str) -> str:
+        return self.match.group(name)
+
+    def param(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        values = self.params.get(name)
+        return values[0] if values else default
+
+
+class StubState:
+    """
+    In-memory Brood and Spire data.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.users: Dict[str, Dict[str, Any]] = {}
+        self.passwords: Dict[str, str] = {}
+        self.tokens: Dict[str, Dict[str, Any]] = {}
+        self.groups: Dict[str, Dict[str, Any]] = {}
+        self.group_members: Dict[str, Dict[str, str]] = {}
+        self.applications: Dict[str, Dict[str, Any]] = {}
+        self.resources: Dict[str, Dict[str, Any]] = {}
+        self.journals: Dict[str, Dict[str, Any]] = {}
+        self.journal_scopes: Dict[str, List[Dict[str, Any]]] = {}
+        self.entries: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.integrations: List[Dict[str, Any]] = []
+        self.default_user = self.add_user("stub", "stub@bugout.dev", "stub")
+
+    # Brood helpers
+    def add_user(
+        self,
+        username: str,
+        email: str,
+        password: str,
+        application_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        timestamp = now()
+        user_id = str(uuid.uuid4())
+        user: Dict[str, Any] = {
+            "user_id": user_id,
+            "username": username,
+            "email": email,
+            "normalized_email": email.lower(),
+            "verified": False,
+            "autogenerated": False,
+            "application_id": application_id,
+            "created_at": timestamp,
+            "updated_at": timestamp,
+        }
+        self.users[user_id] = user
+        self.passwords[user_id] = password
+        return user
+
+    def add_token(
+        self,
+        user: Dict[str, Any],
+        note: Optional[str] = None,
+        restricted: bool = False,
+        token_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        timestamp = now()
+        token = {
+            "id": token_id if token_id is not None else str(uuid.uuid4()),
+            "user_id": user["user_id"],
+            "active": True,
+            "token_type": "bugout",
+            "note": note,
+            "restricted": restricted,
+            "created_at": timestamp,
+            "updated_at": timestamp,
+        }
+        self.tokens[token["id"]] = token
+        return token
+
+    def user_by_token(self, token: Optional[str]) -> Dict[str, Any]:
+        if token is None:
+            raise StubError(401, "Access token not provided")
+        token_record = self.tokens.get(token)
+        if token_record is None:
+            token_record = self.add_token(self.default_user, token_id=token)
+        user = self.users.get(token_record["user_id"])
+        if user is None:
+            raise StubError(404, "User not found")
+        return user
+
+    def user_by_name_or_email(
+        self, username: Optional[str], email: Optional[str]
+    ) -> Dict[str, Any]:
+        for user in self.users.values():
+            if username is not None and user["username"] == username:
+                return user
+            if email is not None and user["email"] == email:
+                return user
+        raise StubError(404, "User not found")
+
+    def group(self, group_id: str) -> Dict[str, Any]:
+        group = self.groups.get(group_id)
+        if group is None:
+            raise StubError(404, "Group not found")
+        return group
+
+    def group_user(self, group: Dict[str, Any], user_id: str) -> Dict[str, Any]:
+        return {
+            "group_id": group["id"],
+            "user_id": user_id,
+            "user_type": self.group_members[group["id"]][user_id],
+            "autogenerated": group["autogenerated"],
+            "group_name": group["name"],
+        }
+
+    # Spire helpers
+    def journal(self, journal_id: str) -> Dict[str, Any]:
+        journal = self.journals.get(journal_id)
+        if journal is None:
+            raise StubError(404, "Journal not found")
+        return journal
+
+    def entry(self, journal_id: str, entry_id: str) -> Dict[str, Any]:
+        self.journal(journal_id)
+        entry = self.entries[journal_id].get(entry_id)
+        if entry is None:
+            raise StubError(404, "Entry not found")
+        return entry
+
+    def add_journal(
+        self, name: str, user: Dict[str, Any], journal_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        timestamp = now()
+        journal = {
+            "id": journal_id if journal_id is not None else str(uuid.uuid4()),
+            "bugout_user_id": user["user_id"],
+            "holder_ids": [user["user_id"]],
+            "name": name,
+            "created_at": timestamp,
+            "updated_at": timestamp,
+        }
+        self.journals[journal["id"]] = journal
+        self.entries[journal["id"]] = {}
+        self.journal_scopes[journal["id"]] = []
+        return journal
+
+    def add_entry(
+        self, journal_id: str, entry_request: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        timestamp = now()
+        entry_id = str(uuid.uuid4())
+        entry = {
+            "id": entry_id,
+            "journal_url": f"journals/{journal_id}",
+            "content_url": f"journals/{journal_id}/entries/{entry_id}/content",
+            "title": entry_request.get("title"),
+            "content": entry_request.get("content"),
+            "tags": list(entry_request.get("tags") or []),
+            "created_at": timestamp,
+            "updated_at": timestamp,
+            "context_url": entry_request.get("context_url"),
+            "context_type": entry_request.get("context_type"),
+        }
+        self.entries[journal_id][entry_id] = entry
+        return entry
+
+    def seed(self, entries: int, journal_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Adds entries to journal without HTTP requests. Journal is created when
+        journal_id is not given or does not exist yet.
+        """
+        with self.lock:
+            journal = self.journals.get(journal_id) if journal_id is not None else None
+            if journal is None:
+                journal = self.add_journal("Seed", self.default_user, journal_id)
+            for index in range(entries):
+                self.add_entry(
+                    journal["id"],
+                    {
+                        "title": f"Seed entry {index}",
+                        "content": f"Seed entry content {index}",
+                        "tags": ["seed", f"index:{index}"],
+                    },
+                )
+            return journal
+
+
+# Brood handlers
+def create_user(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    body = request.body
+    return 200, state.add_user(
+        body["username"], body["email"], body["password"], body.get("application_id")
+    )
+
+
+def get_user(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    return 200, state.user_by_token(request.token)
+
+
+def get_user_by_id(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    state.user_by_token(request.token)
+    user = state.users.get(request.path_param("user_id"))
+    if user is None:
+        raise StubError(404, "User not found")
+    return 200, user
+
+
+def find_user(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    return 200, state.user_by_name_or_email(request.param("username"), None)
+
+
+def confirm_email(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    user = state.user_by_token(request.token)
+    user["verified"] = True
+    return 200, user
+
+
+def restore_password(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    state.user_by_name_or_email(None, request.body.get("email"))
+    return 200, {"reset_id": str(uuid.uuid4())}
+
+
+def reset_password(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    return 200, state.default_user
+
+
+def change_password(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    user = state.user_by_token(request.token)
+    if state.passwords[user["user_id"]] != request.body.get("current_password"):
+        raise StubError(400, "Invalid current password")
+    state.passwords[user["user_id"]] = request.body["new_password"]
+    return 200, user
+
+
+def delete_user(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    state.user_by_token(request.token)
+    user = state.users.pop(request.path_param("user_id"), None)
+    if user is None:
+        raise StubError(404, "User not found")
+    return 200, user
+
+
+def create_token(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    user = state.user_by_name_or_email(request.body.get("username"), None)
+    if state.passwords[user["user_id"]] != request.body.get("password"):
+        raise StubError(403, "Invalid password")
+    return 200, state.add_token(user, note=request.body.get("token_note"))
+
+
+def create_token_restricted(
+    state: StubState, request: StubRequest
+) -> Tuple[int, JSONBody]:
+    return 200, state.add_token(state.user_by_token(request.token), restricted=True)
+
+
+def revoke_token(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    state.user_by_token(request.token)
+    target_token = request.body.get("target_token", request.token)
+    if target_token is not None:
+        state.tokens.pop(target_token, None)
+    return 200, target_token
+
+
+def revoke_token_by_id(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    token = request.path_param("token")
+    state.tokens.pop(token, None)
+    return 200, token
+
+
+def update_token(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    access_token = request.body["access_token"]
+    state.user_by_token(access_token)
+    token = state.tokens[access_token]
+    token["token_type"] = request.body.get("token_type", token["token_type"])
+    token["note"] = request.body.get("token_note", token["note"])
+    token["updated_at"] = now()
+    return 200, token
+
+
+def get_token_types(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    return 200, ["bugout", "slack", "github"]
+
+
+def get_user_tokens(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    user = state.user_by_token(request.token)
+    tokens = [
+        token for token in state.tokens.values() if token["user_id"] == user["user_id"]
+    ]
+    return 200, {
+        "user_id": user["user_id"],
+        "username": user["username"],
+        "token": tokens,
+    }
+
+
+def get_group(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    state.user_by_token(request.token)
+    return 200, state.group(request.path_param("group_id"))
+
+
+def find_group(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    state.user_by_token(request.token)
+    return 200, state.group(request.param("group_id") or "")
+
+
+def get_user_groups(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    user = state.user_by_token(request.token)
+    groups = [
+        state.group_user(state.groups[group_id], user["user_id"])
+        for group_id, members in state.group_members.items()
+        if user["user_id"] in members
+    ]
+    return 200, {"groups": groups}
+
+
+def create_group(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    user = state.user_by_token(request.token)
+    group = {
+        "id": str(uuid.uuid4()),
+        "name": request.body["group_name"],
+        "autogenerated": False,
+    }
+    state.groups[group["id"]] = group
+    state.group_members[group["id"]] = {user["user_id"]: "owner"}
+    return 200, group
+
+
+def set_user_group(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    state.user_by_token(request.token)
+    group = state.group(request.path_param("group_id"))
+    user = state.user_by_name_or_email(
+        request.body.get("username"), request.body.get("email")
+    )
+    state.group_members[group["id"]][user["user_id"]] = request.body["user_type"]
+    return 200, state.group_user(group, user["user_id"])
+
+
+def delete_user_group(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    state.user_by_token(request.token)
+    group = state.group(request.path_param("group_id"))
+    user = state.user_by_name_or_email(
+        request.body.get("username"), request.body.get("email")
+    )
+    group_user = state.group_user(group, user["user_id"])
+    del state.group_members[group["id"]][user["user_id"]]
+    return 200, group_user
+
+
+def get_group_members(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    state.user_by_token(request.token)
+    group = state.group(request.path_param("group_id"))
+    users = [
+        {
+            "id": user_id,
+            "username": state.users[user_id]["username"],
+            "email": state.users[user_id]["email"],
+            "user_type": user_type,
+        }
+        for user_id, user_type in state.group_members[group["id"]].items()
+        if user_id in state.users
+    ]
+    return 200, {"id": group["id"], "name": group["name"], "users": users}
+
+
+def update_group(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    state.user_by_token(request.token)
+    group = state.group(request.path_param("group_id"))
+    group["name"] = request.body["group_name"]
+    return 200, group
+
+
+def delete_group(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    state.user_by_token(request.token)
+    group = state.group(request.path_param("group_id"))
+    del state.groups[group["id"]]
+    del state.group_members[group["id"]]
+    return 200, group
+
+
+def create_application(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    state.user_by_token(request.token)
+    application = {
+        "id": str(uuid.uuid4()),
+        "name": request.body["name"],
+        "description": request.body.get("description"),
+        "group_id": request.body["group_id"],
+    }
+    state.applications[application["id"]] = application
+    return 200, application
+
+
+def get_application(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    state.user_by_token(request.token)
+    application = state.applications.get(request.path_param("application_id"))
+    if application is None:
+        raise StubError(404, "Application not found")
+    return 200, application
+
+
+def list_applications(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    state.user_by_token(request.token)
+    group_id = request.param("group_id")
+    applications = [
+        application
+        for application in state.applications.values()
+        if group_id is None or application["group_id"] == group_id
+    ]
+    return 200, {"applications": applications}
+
+
+def delete_application(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    _, application = get_application(state, request)
+    del state.applications[application["id"]]
+    return 200, application
+
+
+def create_resource(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    state.user_by_token(request.token)
+    timestamp = now()
+    resource = {
+        "id": str(uuid.uuid4()),
+        "application_id": str(request.body["application_id"]),
+        "resource_data": request.body["resource_data"],
+        "created_at": timestamp,
+        "updated_at": timestamp,
+    }
+    state.resources[resource["id"]] = resource
+    return 200, resource
+
+
+def get_resource(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    state.user_by_token(request.token)
+    resource = state.resources.get(request.path_param("resource_id"))
+    if resource is None:
+        raise StubError(404, "Resource not found")
+    return 200, resource
+
+
+def list_resources(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    state.user_by_token(request.token)
+    filters = {key: values[0] for key, values in request.params.items()}
+    application_id = filters.pop("application_id", None)
+    resources = [
+        resource
+        for resource in state.resources.values()
+        if (application_id is None or resource["application_id"] == application_id)
+        and all(
+            str(resource["resource_data"].get(key)) == value
+            for key, value in filters.items()
+        )
+    ]
+    return 200, {"resources": resources}
+
+
+def update_resource(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    _, resource = get_resource(state, request)
+    update = request.body.get("update", {})
+    for key in request.body.get("drop_keys", []):
+        resource["resource_data"].pop(key, None)
+    resource["resource_data"].update(update)
+    resource["updated_at"] = now()
+    return 200, resource
+
+
+def delete_resource(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    _, resource = get_resource(state, request)
+    del state.resources[resource["id"]]
+    return 200, resource
+
+
+# Spire handlers
+def list_scopes(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    scopes = [
+        {"api": "journals", "scope": scope, "description": f"Journal {scope}"}
+        for scope in ("journals.read", "journals.update", "journals.delete")
+    ]
+    return 200, {"scopes": scopes}
+
+
+def get_journal_permissions(
+    state: StubState, request: StubRequest
+) -> Tuple[int, JSONBody]:
+    journal = state.journal(request.path_param("journal_id"))
+    permissions: Dict[Tuple[str, str], List[str]] = {}
+    for scope in state.journal_scopes[journal["id"]]:
+        key = (scope["holder_type"], scope["holder_id"])
+        permissions.setdefault(key, []).append(scope["permission"])
+    return 200, {
+        "journal_id": journal["id"],
+        "permissions": [
+            {"holder_type": holder_type, "holder_id": holder_id, "permissions": items}
+            for (holder_type, holder_id), items in permissions.items()
+        ],
+    }
+
+
+def get_journal_scopes(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    journal = state.journal(request.path_param("journal_id"))
+    return 200, {"scopes": state.journal_scopes[journal["id"]]}
+
+
+def update_journal_scopes(
+    state: StubState, request: StubRequest
+) -> Tuple[int, JSONBody]:
+    journal = state.journal(request.path_param("journal_id"))
+    scopes = [
+        {
+            "journal_id": journal["id"],
+            "holder_type": request.body["holder_type"],
+            "holder_id": request.body["holder_id"],
+            "permission": permission,
+        }
+        for permission in request.body["permission_list"]
+    ]
+    state.journal_scopes[journal["id"]].extend(scopes)
+    return 200, {"scopes": scopes}
+
+
+def delete_journal_scopes(
+    state: StubState, request: StubRequest
+) -> Tuple[int, JSONBody]:
+    journal = state.journal(request.path_param("journal_id"))
+    removed = [
+        scope
+        for scope in state.journal_scopes[journal["id"]]
+        if scope["holder_id"] == request.body["holder_id"]
+        and scope["permission"] in request.body["permission_list"]
+    ]
+    state.journal_scopes[journal["id"]] = [
+        scope for scope in state.journal_scopes[journal["id"]] if scope not in removed
+    ]
+    return 200, {"scopes": removed}
+
+
+def create_journal(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    return 200, state.add_journal(
+        request.body["name"], state.user_by_token(request.token)
+    )
+
+
+def list_journals(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    state.user_by_token(request.token)
+    return 200, {"journals": list(state.journals.values())}
+
+
+def get_journal(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    return 200, state.journal(request.path_param("journal_id"))
+
+
+def update_journal(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    journal = state.journal(request.path_param("journal_id"))
+    journal["name"] = request.body["name"]
+    journal["updated_at"] = now()
+    return 200, journal
+
+
+def delete_journal(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    journal = state.journal(request.path_param("journal_id"))
+    del state.journals[journal["id"]]
+    del state.entries[journal["id"]]
+    return 200, journal
+
+
+def create_entry(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    journal = state.journal(request.path_param("journal_id"))
+    return 200, state.add_entry(journal["id"], request.body)
+
+
+def create_entries_pack(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    journal = state.journal(request.path_param("journal_id"))
+    entries = [
+        state.add_entry(journal["id"], entry_request)
+        for entry_request in request.body["entries"]
+    ]
+    return 200, {"entries": entries}
+
+
+def get_entry(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    return 200, state.entry(
+        request.path_param("journal_id"), request.path_param("entry_id")
+    )
+
+
+def get_entries(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    journal = state.journal(request.path_param("journal_id"))
+    return 200, {"entries": list(state.entries[journal["id"]].values())}
+
+
+def get_entry_content(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    _, entry = get_entry(state, request)
+    return 200, {"title": entry["title"], "content": entry["content"]}
+
+
+def update_entry_content(
+    state: StubState, request: StubRequest
+) -> Tuple[int, JSONBody]:
+    _, entry = get_entry(state, request)
+    entry["title"] = request.body["title"]
+    entry["content"] = request.body["content"]
+    if "tags" in request.body:
+        tags_action = request.param("tags_action", "merge")
+        if tags_action == "replace":
+            entry["tags"] = list(request.body["tags"])
+        elif tags_action == "merge":
+            entry["tags"] = entry["tags"] + [
+                tag for tag in request.body["tags"] if tag not in entry["tags"]
+            ]
+    entry["updated_at"] = now()
+    return 200, {"title": entry["title"], "content": entry["content"]}
+
+
+def delete_entry(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    _, entry = get_entry(state, request)
+    del state.entries[request.path_param("journal_id")][entry["id"]]
+    return 200, entry
+
+
+def get_most_used_tags(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    journal = state.journal(request.path_param("journal_id"))
+    counts: Dict[str, int] = {}
+    for entry in state.entries[journal["id"]].values():
+        for tag in entry["tags"]:
+            counts[tag] = counts.get(tag, 0) + 1
+    return 200, sorted(counts.items(), key=lambda item: item[1], reverse=True)[:10]
+
+
+def entry_tags(entry: Dict[str, Any], journal_id: str) -> Dict[str, Any]:
+    return {"journal_id": journal_id, "entry_id": entry["id"], "tags": entry["tags"]}
+
+
+def create_tags(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    _, entry = get_entry(state, request)
+    entry["tags"] = entry["tags"] + [
+        tag for tag in request.body["tags"] if tag not in entry["tags"]
+    ]
+    return 200, entry["tags"]
+
+
+def get_tags(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    _, entry = get_entry(state, request)
+    return 200, entry_tags(entry, request.path_param("journal_id"))
+
+
+def update_tags(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    _, entry = get_entry(state, request)
+    entry["tags"] = list(request.body["tags"])
+    return 200, entry["tags"]
+
+
+def delete_tag(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    _, entry = get_entry(state, request)
+    entry["tags"] = [tag for tag in entry["tags"] if tag != request.body["tag"]]
+    return 200, entry_tags(entry, request.path_param("journal_id"))
+
+
+def search(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    """
+    Supports tag:<tag> and !tag:<tag> terms, created_at and updated_at range terms with
+    unix timestamps like updated_at:>=1700000000 and plain words matched against title
+    and content, which is enough to exercise pagination of client.
+    """
+    journal = state.journal(request.path_param("journal_id"))
+    terms = (request.param("q", "") or "").split() + request.params.get("filters", [])
+    limit = int(request.param("limit", "10") or 10)
+    offset = int(request.param("offset", "0") or 0)
+    with_content = (request.param("content", "true") or "").lower() == "true"
+
+    def matches(entry: Dict[str, Any]) -> bool:
+        for term in terms:
+            range_term = RANGE_TERM.match(term)
+            if range_term is not None:
+                timestamp = (
+                    datetime.fromisoformat(entry[range_term["field"]])
+                    .replace(tzinfo=timezone.utc)
+                    .timestamp()
+                )
+                if not RANGE_OPS[range_term["op"]](
+                    timestamp, float(range_term["value"])
+                ):
+                    return False
+            elif term.startswith("tag:"):
+                if term[4:] not in entry["tags"]:
+                    return False
+            elif term.startswith("!tag:"):
+                if term[5:] in entry["tags"]:
+                    return False
+            elif ":" not in term:
+                text = f"{entry['title'] or ''} {entry['content'] or ''}"
+                if term.lower() not in text.lower():
+                    return False
+        return True
+
+    entries = [
+        entry for entry in state.entries[journal["id"]].values() if matches(entry)
+    ]
+    if request.param("order", "desc") == "desc":
+        entries.reverse()
+    page = entries[offset : offset + limit]
+    next_offset = offset + limit if offset + limit < len(entries) else None
+    results = [
+        {
+            "entry_url": f"journals/{journal['id']}/entries/{entry['id']}",
+            "content_url": entry["content_url"],
+            "title": entry["title"] or "",
+            "content": entry["content"] if with_content else None,
+            "tags": entry["tags"],
+            "created_at": entry["created_at"],
+            "updated_at": entry["updated_at"],
+            "score": 1.0,
+        }
+        for entry in page
+    ]
+    return 200, {
+        "total_results": len(entries),
+        "offset": offset,
+        "next_offset": next_offset,
+        "max_score": 1.0,
+        "results": results,
+    }
+
+
+def check_journal_public(
+    state: StubState, request: StubRequest
+) -> Tuple[int, JSONBody]:
+    return 200, False
+
+
+def get_humbug_integrations(
+    state: StubState, request: StubRequest
+) -> Tuple[int, JSONBody]:
+    state.user_by_token(request.token)
+    group_id = request.param("group_id")
+    integrations = [
+        integration
+        for integration in state.integrations
+        if group_id is None or integration["group_id"] == group_id
+    ]
+    return 200, {"integrations": integrations}
+
+
+def ping(state: StubState, request: StubRequest) -> Tuple[int, JSONBody]:
+    return 200, {"status": "ok"}
+
+
+UUID = r"[^/]+"
+ROUTES: List[Tuple[str, Pattern[str], Handler]] = [
+    (method, re.compile(f"^{path}$"), handler)
+    for method, path, handler in [
+        ("GET", "ping", ping),
+        # Brood
+        ("POST", "user", create_user),
+        ("GET", "user", get_user),
+        ("GET", "user/find", find_user),
+        ("GET", f"user/(?P<user_id>{UUID})", get_user_by_id),
+        ("DELETE", f"user/(?P<user_id>{UUID})", delete_user),
+        ("POST", "confirm", confirm_email),
+        ("POST", "password/restore", restore_password),
+        ("POST", "password/reset", reset_password),
+        ("POST", "password/change", change_password),
+        ("POST", "token", create_token),
+        ("POST", "token/restricted", create_token_restricted),
+        ("DELETE", "token", revoke_token),
+        ("PUT", "token", update_token),
+        ("GET", "token/types", get_token_types),
+        ("DELETE", f"token/(?P<token>{UUID})", revoke_token_by_id),
+        ("GET", "tokens", get_user_tokens),
+        ("GET", "groups", get_user_groups),
+        ("GET", "groups/find", find_group),
+        ("POST", "group", create_group),
+        ("GET", f"group/(?P<group_id>{UUID})", get_group),
+        ("DELETE", f"group/(?P<group_id>{UUID})", delete_group),
+        ("POST", f"group/(?P<group_id>{UUID})/role", set_user_group),
+        ("DELETE", f"group/(?P<group_id>{UUID})/role", delete_user_group),
+        ("GET", f"group/(?P<group_id>{UUID})/users", get_group_members),
+        ("PUT", f"group/(?P<group_id>{UUID})/name", update_group),
+        ("POST", "applications", create_application),
+        ("GET", "applications", list_applications),
+        ("GET", f"applications/(?P<application_id>{UUID})", get_application),
+        ("DELETE", f"applications/(?P<application_id>{UUID})", delete_application),
+        ("POST", "resources", create_resource),
+        ("GET", "resources", list_resources),
+        ("GET", f"resources/(?P<resource_id>{UUID})", get_resource),
+        ("PUT", f"resources/(?P<resource_id>{UUID})", update_resource),
+        ("DELETE", f"resources/(?P<resource_id>{UUID})", delete_resource),
+        # Spire
+        ("GET", "journals/scopes", list_scopes),
+        ("POST", "journals", create_journal),
+        ("GET", "journals", list_journals),
+        ("GET", f"journals/(?P<journal_id>{UUID})", get_journal),
+        ("PUT", f"journals/(?P<journal_id>{UUID})", update_journal),
+        ("DELETE", f"journals/(?P<journal_id>{UUID})", delete_journal),
+        (
+            "GET",
+            f"journals/(?P<journal_id>{UUID})/permissions",
+            get_journal_permissions,
+        ),
+        ("GET", f"journals/(?P<journal_id>{UUID})/scopes", get_journal_scopes),
+        ("POST", f"journals/(?P<journal_id>{UUID})/scopes", update_journal_scopes),
+        ("DELETE", f"journals/(?P<journal_id>{UUID})/scopes", delete_journal_scopes),
+        ("POST", f"journals/(?P<journal_id>{UUID})/entries", create_entry),
+        ("GET", f"journals/(?P<journal_id>{UUID})/entries", get_entries),
+        ("POST", f"journals/(?P<journal_id>{UUID})/bulk", create_entries_pack),
+        ("GET", f"journals/(?P<journal_id>{UUID})/tags", get_most_used_tags),
+        ("GET", f"journals/(?P<journal_id>{UUID})/search", search),
+        (
+            "GET",
+            f"journals/(?P<journal_id>{UUID})/entries/(?P<entry_id>{UUID})",
+            get_entry,
+        ),
+        (
+            "DELETE",
+            f"journals/(?P<journal_id>{UUID})/entries/(?P<entry_id>{UUID})",
+            delete_entry,
+        ),
+        (
+            "GET",
+            f"journals/(?P<journal_id>{UUID})/entries/(?P<entry_id>{UUID})/content",
+            get_entry_content,
+        ),
+        (
+            "PUT",
+            f"journals/(?P<journal_id>{UUID})/entries/(?P<entry_id>{UUID})/content",
+            update_entry_content,
+        ),
+        (
+            "POST",
+            f"journals/(?P<journal_id>{UUID})/entries/(?P<entry_id>{UUID})/tags",
+            create_tags,
+        ),
+        (
+            "GET",
+            f"journals/(?P<journal_id>{UUID})/entries/(?P<entry_id>{UUID})/tags",
+            get_tags,
+        ),
+        (
+            "PUT",
+            f"journals/(?P<journal_id>{UUID})/entries/(?P<entry_id>{UUID})/tags",
+            update_tags,
+        ),
+        (
+            "DELETE",
+            f"journals/(?P<journal_id>{UUID})/entries/(?P<entry_id>{UUID})/tags",
+            delete_tag,
+        ),
+        ("GET", "public/check", check_journal_public),
+        ("GET", "humbug/integrations", get_humbug_integrations),
+    ]
+]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "StubHTTPServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _respond(self, status: int, body: JSONBody) -> None:
+        payload = json.dumps(body).encode()
+        etag = None
+        if self.command == "GET" and status == 200:
+            etag = f'"{hashlib.sha1(payload).hexdigest()}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if len(payload) >= 1024 and "gzip" in self.headers.get("Accept-Encoding", ""):
+            payload = gzip.compress(payload, compresslevel=5)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(payload)))
+        if etag is not None:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(payload)
+        self.server.count_bytes(sent=len(payload))
+
+    def _read_body(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length", 0))
+        raw_body = self.rfile.read(length) if length else b""
+        self.server.count_bytes(received=len(raw_body))
+        if self.headers.get("Content-Encoding") == "gzip":
+            raw_body = gzip.decompress(raw_body)
+        if not raw_body:
+            return {}
+        if self.headers.get("Content-Type", "").startswith("application/json"):
+            return json.loads(raw_body)
+        return {key: values[0] for key, values in parse_qs(raw_body.decode()).items()}
+
+    def _token(self) -> Optional[str]:
+        authorization = self.headers.get("Authorization")
+        if authorization is None or not authorization.startswith("Bearer "):
+            return None
+        return authorization[len("Bearer ") :]
+
+    def _dispatch(self) -> None:
+        body = self._read_body()
+        if self.server.latency > 0:
+            time.sleep(self.server.latency)
+        url = urlsplit(self.path)
+        path = url.path.strip("/")
+        for method, pattern, handler in ROUTES:
+            if method != self.command:
+                continue
+            match = pattern.match(path)
+            if match is None:
+                continue
+            request = StubRequest(match, parse_qs(url.query), body, self._token())
+            try:
+                with self.server.state.lock:
+                    status, response = handler(self.server.state, request)
+            except StubError as e:
+                status, response = e.status, {"detail": e.detail}
+            except (KeyError, ValueError) as e:
+                status, response = 422, {"detail": f"Invalid request: {e}"}
+            self._respond(status, response)
+            return
+        self._respond(404, {"detail": "Not found"})
+
+    do_GET = _dispatch
+    do_POST = _dispatch
+    do_PUT = _dispatch
+    do_DELETE = _dispatch
+
+
+class StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        state: StubState,
+        latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+    ) -> None:
+        super().__init__(address, StubHandler)
+        self.state = state
+        self.latency = latency
+        self.bandwidth = bandwidth
+        # Body bytes on the wire, without headers
+        self.bytes_received = 0
+        self.bytes_sent = 0
+        self._bytes_lock = threading.Lock()
+
+    def count_bytes(self, received: int = 0, sent: int = 0) -> None:
+        with self._bytes_lock:
+            self.bytes_received += received
+            self.bytes_sent += sent
+        if self.bandwidth is not None:
+            time.sleep((received + sent) / self.bandwidth)
+
+
+class StubServer:
+    """
+    Runs a stub API on a random local port in a background thread.
+
+    latency seconds are added to every response to simulate network round trip, bandwidth
+    in bytes per second limits transfer of request and response bodies.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+    ) -> None:
+        self.state = StubState()
+        self.server = StubHTTPServer((host, port), self.state, latency, bandwidth)
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        host, port = self.server.server_address[:2]
+        return str(host), int(port)
+
+    @property
+    def url(self) -> str:
+        host, port = self.address
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubServer":
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
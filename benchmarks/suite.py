@@ -0,0 +1,558 @@
+"""
+Offline benchmark suite of Bugout client against local stub of Brood and Spire APIs.
+
+Cases:
+    latency  - single call latency of common user and journal calls
+    bulk     - bulk entry ingestion with create_entries_pack, JournalEntryWriter and
+               JournalEntrySpool
+    search   - paginated search over seeded journal, with and without prefetch
+    fanout   - search over several journals one by one and with search_journals
+    coalesce - bursts of identical concurrent reads with and without coalesce_gets
+    compression - bulk ingestion and content heavy search with and without compression
+    cache    - repeated get_entries of unchanged journal with and without
+               response_cache
+    metrics  - call latency without instrumentation and with phase histograms
+    mirror   - repeated tag searches against Spire and against local JournalMirror
+    sync     - incremental sync of journal after changing part of its entries against
+               full reconciliation
+    tags     - bulk tagging of entries with bounded concurrency
+    batch    - get_entry for many entry ids one by one and with Bugout.batch
+    mixed    - concurrent mixed workload of reads, writes and searches from threads
+
+Usage:
+    python benchmarks/suite.py --calls 1000 --threads 8
+    python benchmarks/suite.py --cases search mixed
+    python benchmarks/suite.py --cases tags --latency 20
+    python benchmarks/suite.py --cases batch --latency 20
+    python benchmarks/suite.py --cases fanout --journals 8 --latency 20
+    python benchmarks/suite.py --cases compression --latency 20 --bandwidth 100
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+import os
+import random
+import shutil
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+from bugout.app import Bugout
+from bugout.fanout import search_journals
+from bugout.httpcache import MemoryResponseCache
+from bugout.instrumentation import Instrumentation
+from bugout.incremental import sync_journal
+from bugout.journal import SearchOrder
+from bugout.mirror import JournalMirror
+from bugout.spool import JournalEntrySpool
+from bugout.tagging import TagAction, bulk_tag
+from bugout.writer import JournalEntryWriter
+
+from common import measure, report
+from stub import StubServer, now
+
+TOKEN = "benchmark"
+
+
+def entry_request(index: int) -> Dict[str, Any]:
+    return {
+        "title": f"Benchmark entry {index}",
+        "content": f"Benchmark entry content {index}",
+        "tags": ["benchmark", f"index:{index}"],
+    }
+
+
+def bench_latency(bugout: Bugout, server: StubServer, args: argparse.Namespace) -> None:
+    journal_id = server.state.seed(entries=args.page_size)["id"]
+    entry_id = next(iter(server.state.entries[journal_id]))
+
+    cases: Dict[str, Callable[[], Any]] = {
+        "get_user": lambda: bugout.get_user(token=TOKEN),
+        "get_entry": lambda: bugout.get_entry(
+            token=TOKEN, journal_id=journal_id, entry_id=entry_id
+        ),
+        "create_entry": lambda: bugout.create_entry(
+            token=TOKEN, journal_id=journal_id, title="Latency", content="Latency"
+        ),
+        "search (one page)": lambda: bugout.search(
+            token=TOKEN, journal_id=journal_id, query="", limit=args.page_size
+        ),
+    }
+    for name, call in cases.items():
+        report(name, measure(call, args.calls))
+
+
+def bench_bulk(bugout: Bugout, server: StubServer, args: argparse.Namespace) -> None:
+    journal_id = server.state.seed(entries=0)["id"]
+    requests_batches = [
+        [entry_request(index) for index in range(start, start + args.batch_size)]
+        for start in range(0, args.entries, args.batch_size)
+    ]
+    batches = iter(requests_batches)
+
+    def send_batch() -> None:
+        bugout.create_entries_pack(
+            token=TOKEN, journal_id=journal_id, entries=next(batches)
+        )
+
+    report(
+        f"create_entries_pack (batch={args.batch_size}, entries)",
+        measure(send_batch, len(requests_batches)),
+        operations=args.entries,
+    )
+
+    journal_id = server.state.seed(entries=0)["id"]
+    latencies: List[float] = []
+    started_at = time.perf_counter()
+    with JournalEntryWriter(
+        bugout.journal, TOKEN, batch_size=args.batch_size
+    ) as writer:
+        for index in range(args.entries):
+            write_started_at = time.perf_counter()
+            writer.write(
+                journal_id,
+                title=f"Writer entry {index}",
+                content=f"Writer entry content {index}",
+                tags=["benchmark"],
+            )
+            latencies.append(time.perf_counter() - write_started_at)
+    elapsed = time.perf_counter() - started_at
+    report("JournalEntryWriter.write (entries)", latencies, elapsed=elapsed)
+
+    journal_id = server.state.seed(entries=0)["id"]
+    latencies = []
+    started_at = time.perf_counter()
+    with tempfile.TemporaryDirectory() as directory:
+        with JournalEntrySpool(
+            bugout.journal, TOKEN, directory, batch_size=args.batch_size
+        ) as spool:
+            for index in range(args.entries):
+                write_started_at = time.perf_counter()
+                spool.write(
+                    journal_id,
+                    title=f"Spool entry {index}",
+                    content=f"Spool entry content {index}",
+                    tags=["benchmark"],
+                )
+                latencies.append(time.perf_counter() - write_started_at)
+            spool.flush()
+    elapsed = time.perf_counter() - started_at
+    report("JournalEntrySpool.write (entries)", latencies, elapsed=elapsed)
+
+
+def bench_search(bugout: Bugout, server: StubServer, args: argparse.Namespace) -> None:
+    journal_id = server.state.seed(entries=args.search_entries)["id"]
+    for prefetch in (False, True):
+        results = 0
+
+        def iterate() -> None:
+            nonlocal results
+            for _ in bugout.iter_search(
+                token=TOKEN,
+                journal_id=journal_id,
+                query="tag:seed",
+                page_size=args.page_size,
+                order=SearchOrder.ASCENDING,
+                prefetch=prefetch,
+            ):
+                results += 1
+
+        latencies = measure(iterate, args.search_rounds)
+        report(
+            f"iter_search (prefetch={prefetch}, results)",
+            latencies,
+            operations=results,
+        )
+
+
+def bench_fanout(bugout: Bugout, server: StubServer, args: argparse.Namespace) -> None:
+    per_journal = max(args.search_entries // args.journals, 1)
+    journal_ids = [
+        server.state.seed(entries=per_journal)["id"] for _ in range(args.journals)
+    ]
+    results = 0
+
+    def one_by_one() -> None:
+        nonlocal results
+        for journal_id in journal_ids:
+            for _ in bugout.iter_search(
+                token=TOKEN,
+                journal_id=journal_id,
+                query="tag:seed",
+                page_size=args.page_size,
+            ):
+                results += 1
+
+    latencies = measure(one_by_one, args.search_rounds)
+    report("iter_search per journal (results)", latencies, operations=results)
+
+    results = 0
+
+    def fanned_out() -> None:
+        nonlocal results
+        for _ in search_journals(
+            bugout.journal,
+            TOKEN,
+            journal_ids,
+            query="tag:seed",
+            page_size=args.page_size,
+            concurrency=args.threads,
+        ):
+            results += 1
+
+    latencies = measure(fanned_out, args.search_rounds)
+    report(
+        f"search_journals (concurrency={args.threads}, results)",
+        latencies,
+        operations=results,
+    )
+
+
+def bench_coalesce(
+    bugout: Bugout, server: StubServer, args: argparse.Namespace
+) -> None:
+    journal_ids = [server.state.seed(entries=1)["id"] for _ in range(4)]
+    for coalesce_gets in (False, True):
+        with Bugout(
+            brood_api_url=server.url,
+            spire_api_url=server.url,
+            pool_maxsize=max(args.threads, 10),
+            coalesce_gets=coalesce_gets,
+        ) as client:
+
+            def call(index: int) -> float:
+                started_at = time.perf_counter()
+                client.get_journal(
+                    token=TOKEN, journal_id=journal_ids[index % len(journal_ids)]
+                )
+                return time.perf_counter() - started_at
+
+            started_at = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=args.threads) as executor:
+                latencies = list(executor.map(call, range(args.calls)))
+            elapsed = time.perf_counter() - started_at
+            requests = (
+                client.transport.single_flight.calls
+                if client.transport.single_flight is not None
+                else args.calls
+            )
+            report(
+                f"get_journal (coalesce_gets={coalesce_gets}, requests={requests})",
+                latencies,
+                elapsed=elapsed,
+            )
+
+
+def log_content(index: int, lines: int = 40) -> str:
+    return "\n".join(
+        f"2023-01-01T00:00:{line % 60:02d}Z INFO worker-{index % 8} processed request "
+        f"{index * lines + line} status=200 duration_ms={(index + line) % 250}"
+        for line in range(lines)
+    )
+
+
+def bench_compression(
+    bugout: Bugout, server: StubServer, args: argparse.Namespace
+) -> None:
+    journal_id = server.state.seed(entries=0)["id"]
+    with server.state.lock:
+        for index in range(args.page_size * 5):
+            server.state.add_entry(
+                journal_id,
+                {"title": f"Log {index}", "content": log_content(index), "tags": []},
+            )
+    entries = [
+        {"title": f"Log {index}", "content": log_content(index), "tags": ["bulk"]}
+        for index in range(args.entries)
+    ]
+    batches = [
+        entries[start : start + args.batch_size]
+        for start in range(0, len(entries), args.batch_size)
+    ]
+
+    for compressed in (False, True):
+        with Bugout(
+            brood_api_url=server.url,
+            spire_api_url=server.url,
+            compress_requests_above=1024 if compressed else None,
+            accept_encoding=None if compressed else "identity",
+        ) as client:
+            received_before = server.server.bytes_received
+            started_at = time.perf_counter()
+            for batch in batches:
+                client.create_entries_pack(
+                    token=TOKEN, journal_id=journal_id, entries=batch
+                )
+            elapsed = time.perf_counter() - started_at
+            print(
+                f"{f'create_entries_pack (compressed={compressed})':<40} "
+                f"entries/sec={len(entries) / elapsed:>10.1f} "
+                f"uploaded={(server.server.bytes_received - received_before) / 1024:.0f}KiB"
+            )
+
+            sent_before = server.server.bytes_sent
+            latencies = measure(
+                lambda: client.search(
+                    token=TOKEN,
+                    journal_id=journal_id,
+                    query="",
+                    limit=args.page_size,
+                    content=True,
+                ),
+                args.search_rounds,
+            )
+            downloaded = (server.server.bytes_sent - sent_before) / args.search_rounds
+            report(
+                f"search content=True (compressed={compressed}, "
+                f"{downloaded / 1024:.0f}KiB/page)",
+                latencies,
+            )
+
+
+def bench_cache(bugout: Bugout, server: StubServer, args: argparse.Namespace) -> None:
+    journal_id = server.state.seed(entries=args.page_size)["id"]
+    for response_cache in (None, MemoryResponseCache()):
+        with Bugout(
+            brood_api_url=server.url,
+            spire_api_url=server.url,
+            response_cache=response_cache,
+        ) as client:
+            latencies = measure(
+                lambda: client.get_entries(token=TOKEN, journal_id=journal_id),
+                args.calls,
+            )
+            report(
+                f"get_entries (response_cache={response_cache is not None})",
+                latencies,
+            )
+
+
+def bench_metrics(bugout: Bugout, server: StubServer, args: argparse.Namespace) -> None:
+    journal_id = server.state.seed(entries=10)["id"]
+    for instrumentation in (None, Instrumentation()):
+        with Bugout(
+            brood_api_url=server.url,
+            spire_api_url=server.url,
+            instrumentation=instrumentation,
+        ) as client:
+            latencies = measure(
+                lambda: client.get_entries(token=TOKEN, journal_id=journal_id),
+                args.calls,
+            )
+            report(
+                f"get_entries (instrumentation={instrumentation is not None})",
+                latencies,
+            )
+    if instrumentation is not None:
+        for line in instrumentation.prometheus_text().splitlines():
+            if "_sum{" in line:
+                print(f"  {line}")
+
+
+def bench_mirror(bugout: Bugout, server: StubServer, args: argparse.Namespace) -> None:
+    journal_id = server.state.seed(entries=args.search_entries)["id"]
+    queries = [f"tag:index:{index}" for index in range(args.search_entries)]
+
+    latencies = measure(
+        lambda: bugout.search(
+            token=TOKEN, journal_id=journal_id, query=random.choice(queries)
+        ),
+        args.calls,
+    )
+    report("search (Spire)", latencies)
+
+    with tempfile.TemporaryDirectory() as directory:
+        with JournalMirror(
+            bugout.journal,
+            TOKEN,
+            journal_id,
+            os.path.join(directory, "mirror.db"),
+            refresh_interval=None,
+        ) as mirror:
+            started_at = time.perf_counter()
+            mirror.refresh()
+            print(
+                f"{'JournalMirror.refresh (initial)':<40} "
+                f"elapsed={(time.perf_counter() - started_at) * 1000:.1f}ms"
+            )
+            latencies = measure(
+                lambda: mirror.search(random.choice(queries)), args.calls
+            )
+            report("JournalMirror.search (local)", latencies)
+
+
+def bench_sync(bugout: Bugout, server: StubServer, args: argparse.Namespace) -> None:
+    journal_id = server.state.seed(entries=args.search_entries)["id"]
+    entry_ids = list(server.state.entries[journal_id])
+    # Range filters have second precision, spread entries over the past seconds so
+    # changes are past high water mark
+    started_at = datetime.utcnow() - timedelta(seconds=len(entry_ids) + 1)
+    for index, entry in enumerate(server.state.entries[journal_id].values()):
+        timestamp = (started_at + timedelta(seconds=index)).isoformat()
+        entry["created_at"] = entry["updated_at"] = timestamp
+    with tempfile.TemporaryDirectory() as directory:
+        state_path = os.path.join(directory, "state")
+        sync_journal(bugout.journal, TOKEN, journal_id, state_path)
+        changed = entry_ids[:: max(len(entry_ids) // 100, 1)]
+        for entry_id in changed:
+            server.state.entries[journal_id][entry_id]["updated_at"] = now()
+
+        sync_paths = [state_path, f"{state_path}.entries"]
+        for reconcile in (True, False):
+            # Each round sees the same changes
+            for path in sync_paths:
+                os.rename(path, f"{path}.base")
+            sync_report = None
+
+            def sync() -> None:
+                nonlocal sync_report
+                for path in sync_paths:
+                    shutil.copyfile(f"{path}.base", path)
+                sync_report = sync_journal(
+                    bugout.journal, TOKEN, journal_id, state_path, reconcile=reconcile
+                )
+
+            latencies = measure(sync, args.search_rounds)
+            assert sync_report is not None
+            report(
+                f"sync_journal (reconcile={reconcile}, "
+                f"fetched={sync_report.fetched}, "
+                f"changes={sync_report.created + sync_report.updated + sync_report.deleted})",
+                latencies,
+            )
+            for path in sync_paths:
+                os.replace(f"{path}.base", path)
+
+
+def bench_tags(bugout: Bugout, server: StubServer, args: argparse.Namespace) -> None:
+    journal_id = server.state.seed(entries=args.calls)["id"]
+    entry_ids = list(server.state.entries[journal_id])
+    for concurrency in (1, args.threads):
+        report_ = bulk_tag(
+            bugout.journal,
+            TOKEN,
+            journal_id,
+            [(entry_id, ["triaged"], TagAction.add) for entry_id in entry_ids],
+            concurrency=concurrency,
+        )
+        print(
+            f"{f'bulk_tag (concurrency={concurrency})':<40} "
+            f"ops/sec={report_.total / report_.elapsed_seconds:>10.1f} "
+            f"failed={report_.failed}"
+        )
+
+
+def bench_batch(bugout: Bugout, server: StubServer, args: argparse.Namespace) -> None:
+    journal_id = server.state.seed(entries=args.calls)["id"]
+    calls = [
+        {"token": TOKEN, "journal_id": journal_id, "entry_id": entry_id}
+        for entry_id in server.state.entries[journal_id]
+    ]
+    for concurrency in (1, args.threads):
+        started_at = time.perf_counter()
+        failed = sum(
+            not result.succeeded
+            for result in bugout.batch("get_entry", calls, concurrency=concurrency)
+        )
+        elapsed = time.perf_counter() - started_at
+        print(
+            f"{f'batch get_entry (concurrency={concurrency})':<40} "
+            f"ops/sec={len(calls) / elapsed:>10.1f} "
+            f"failed={failed}"
+        )
+
+
+def bench_mixed(bugout: Bugout, server: StubServer, args: argparse.Namespace) -> None:
+    journal_id = server.state.seed(entries=args.search_entries)["id"]
+    entry_ids = list(server.state.entries[journal_id])
+
+    operations: List[Callable[[], Any]] = [
+        lambda: bugout.get_user(token=TOKEN),
+        lambda: bugout.get_entry(
+            token=TOKEN, journal_id=journal_id, entry_id=random.choice(entry_ids)
+        ),
+        lambda: bugout.get_entry(
+            token=TOKEN, journal_id=journal_id, entry_id=random.choice(entry_ids)
+        ),
+        lambda: bugout.create_entry(
+            token=TOKEN, journal_id=journal_id, title="Mixed", content="Mixed"
+        ),
+        lambda: bugout.search(
+            token=TOKEN,
+            journal_id=journal_id,
+            query="tag:seed",
+            limit=args.page_size,
+            offset=random.randrange(0, args.search_entries, args.page_size),
+        ),
+    ]
+
+    def call(_: int) -> float:
+        operation = random.choice(operations)
+        started_at = time.perf_counter()
+        operation()
+        return time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as executor:
+        latencies = list(executor.map(call, range(args.calls)))
+    elapsed = time.perf_counter() - started_at
+    report(f"mixed workload (threads={args.threads})", latencies, elapsed=elapsed)
+
+
+CASES = {
+    "latency": bench_latency,
+    "bulk": bench_bulk,
+    "search": bench_search,
+    "fanout": bench_fanout,
+    "coalesce": bench_coalesce,
+    "compression": bench_compression,
+    "cache": bench_cache,
+    "metrics": bench_metrics,
+    "mirror": bench_mirror,
+    "sync": bench_sync,
+    "tags": bench_tags,
+    "batch": bench_batch,
+    "mixed": bench_mixed,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bugout client benchmark suite")
+    parser.add_argument(
+        "--cases", nargs="+", choices=list(CASES), default=list(CASES), help="Cases"
+    )
+    parser.add_argument("--calls", type=int, default=1000, help="Calls per case")
+    parser.add_argument("--entries", type=int, default=10000, help="Bulk entries")
+    parser.add_argument("--batch-size", type=int, default=100, help="Bulk batch size")
+    parser.add_argument(
+        "--search-entries", type=int, default=5000, help="Entries in searched journal"
+    )
+    parser.add_argument("--search-rounds", type=int, default=5, help="Full iterations")
+    parser.add_argument("--journals", type=int, default=8, help="Fan-out journals")
+    parser.add_argument("--page-size", type=int, default=100, help="Search page size")
+    parser.add_argument("--threads", type=int, default=8, help="Concurrent threads")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Stub response latency in ms"
+    )
+    parser.add_argument(
+        "--bandwidth", type=float, default=None, help="Stub bandwidth in Mbit/s"
+    )
+    args = parser.parse_args()
+
+    with StubServer(
+        latency=args.latency / 1000,
+        bandwidth=args.bandwidth * 1000 * 1000 / 8 if args.bandwidth else None,
+    ) as server:
+        with Bugout(
+            brood_api_url=server.url,
+            spire_api_url=server.url,
+            pool_maxsize=max(args.threads, 10),
+        ) as bugout:
+            for case in args.cases:
+                print(f"== {case}")
+                CASES[case](bugout, server, args)
+
+
+if __name__ == "__main__":
+    main()
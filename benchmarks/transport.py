@@ -0,0 +1,57 @@
+"""
+Per-call latency of Bugout client calls with and without pooled keep-alive sessions.
+
+Usage:
+    python benchmarks/transport.py --calls 2000
+"""
+
+import argparse
+
+from bugout.calls import make_request
+from bugout.data import Method
+from bugout.transport import Transport
+
+from common import measure, report
+from stub import StubServer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bugout transport benchmark")
+    parser.add_argument("--calls", type=int, default=1000, help="Calls per case")
+    args = parser.parse_args()
+
+    with StubServer() as server:
+        journal = server.state.seed(entries=1)
+        journal_id = journal["id"]
+        entry_id = next(iter(server.state.entries[journal_id]))
+        entry_url = f"{server.url}/journals/{journal_id}/entries/{entry_id}"
+        user_url = f"{server.url}/user"
+        headers = {"Authorization": "Bearer benchmark"}
+
+        report(
+            "get_entry (new connection)",
+            measure(lambda: make_request(Method.get, entry_url), args.calls),
+        )
+        report(
+            "get_user (new connection)",
+            measure(
+                lambda: make_request(Method.get, user_url, headers=headers), args.calls
+            ),
+        )
+
+        with Transport() as transport:
+            report(
+                "get_entry (pooled)",
+                measure(lambda: transport.request(Method.get, entry_url), args.calls),
+            )
+            report(
+                "get_user (pooled)",
+                measure(
+                    lambda: transport.request(Method.get, user_url, headers=headers),
+                    args.calls,
+                ),
+            )
+
+
+if __name__ == "__main__":
+    main()
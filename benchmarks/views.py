@@ -0,0 +1,78 @@
+"""
+Time and memory of scanning search results as pydantic models and as lightweight views.
+
+Each case decodes search page and reads entry_url and tags of every result, memory is
+measured with tracemalloc for one scanned page kept alive, so rows which views build
+lazily are counted.
+
+Usage:
+    python benchmarks/views.py --items 1000 --calls 200
+"""
+
+import argparse
+import re
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from bugout.data import BugoutSearchResults
+from bugout.decode import decode
+from bugout.views import SearchResultsView
+
+from common import measure, report
+from stub import StubRequest, StubServer, search
+
+TOKEN = "benchmark"
+
+
+def search_payload(server: StubServer, items: int) -> Dict[str, Any]:
+    journal_id = server.state.seed(entries=items)["id"]
+    match = re.match(r"journals/(?P<journal_id>[^/]+)", f"journals/{journal_id}")
+    assert match is not None
+    _, results = search(
+        server.state, StubRequest(match, {"limit": [str(items)]}, {}, TOKEN)
+    )
+    return results
+
+
+def scan(build: Callable[[], Any]) -> Any:
+    page = build()
+    for result in page.results:
+        result.entry_url
+        result.tags
+    return page
+
+
+def allocated(build: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    page = scan(build)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del page
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bugout result views benchmark")
+    parser.add_argument("--items", type=int, default=1000, help="Results per page")
+    parser.add_argument("--calls", type=int, default=200, help="Calls per case")
+    args = parser.parse_args()
+
+    with StubServer() as server:
+        payload = search_payload(server, args.items)
+
+    builders: Dict[str, Callable[[], Any]] = {
+        "BugoutSearchResults (validate)": lambda: decode(
+            BugoutSearchResults, payload, validate=True
+        ),
+        "BugoutSearchResults (fast_decode)": lambda: decode(
+            BugoutSearchResults, payload, validate=False
+        ),
+        "SearchResultsView": lambda: SearchResultsView(payload),
+    }
+    for name, build in builders.items():
+        report(f"scan {name}", measure(lambda: scan(build), args.calls))
+        print(f"{'':<40} memory per page={allocated(build) / 1024:.1f}KiB")
+
+
+if __name__ == "__main__":
+    main()
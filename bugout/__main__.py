@@ -8,8 +8,10 @@ def get_methods_list(args: argparse.Namespace) -> None:
     """
     Return list of all API methods.
     """
-    methods = [method for method in Bugout.__dict__.keys()]
-    print(methods[2:-3])
+    methods = [
+        method for method in Bugout.__dict__.keys() if not method.startswith("_")
+    ]
+    print(methods)
 
 
 def main() -> None:
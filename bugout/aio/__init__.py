@@ -0,0 +1,5 @@
+"""
+Asyncio Bugout API client built on httpx.
+
+Requires optional dependency: pip install bugout[async]
+"""
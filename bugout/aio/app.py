@@ -0,0 +1,1009 @@
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
+import uuid
+
+from .. import data
+from ..batch import BatchResult
+from ..cache import TTLCache, token_key
+from ..httpcache import ResponseCache
+from ..instrumentation import Instrumentation
+from ..journal import SearchOrder, TagsAction
+from ..ratelimit import RateLimiter
+from ..retry import RetryPolicy
+from ..settings import (
+    BUGOUT_BROOD_URL,
+    BUGOUT_SPIRE_URL,
+    REQUESTS_POOL_MAXSIZE,
+    REQUESTS_TIMEOUT,
+)
+from ..views import JournalEntriesView, SearchResultsView, SearchResultView
+from .batch import run_batch
+from .calls import ping
+from .group import AsyncGroup
+from .humbug import AsyncHumbug
+from .journal import AsyncJournal
+from .resource import AsyncResource
+from .transport import AsyncTransport
+from .user import AsyncUser
+
+
+class AsyncBugout:
+    """
+    Asyncio version of Bugout client with the same methods as coroutines.
+    """
+
+    def __init__(
+        self,
+        brood_api_url: str = BUGOUT_BROOD_URL,
+        spire_api_url: str = BUGOUT_SPIRE_URL,
+        pool_maxsize: int = REQUESTS_POOL_MAXSIZE,
+        retry_policy: Optional[RetryPolicy] = None,
+        brood_rate_limiter: Optional[RateLimiter] = None,
+        spire_rate_limiter: Optional[RateLimiter] = None,
+        auth_cache_ttl: Optional[float] = None,
+        auth_cache_maxsize: int = 1024,
+        fast_decode: bool = False,
+        coalesce_gets: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        compress_requests_above: Optional[int] = None,
+        accept_encoding: Optional[str] = None,
+    ) -> None:
+        self.brood_api_url = brood_api_url
+        self.spire_api_url = spire_api_url
+
+        self.transport = AsyncTransport(
+            pool_maxsize=pool_maxsize,
+            retry_policy=retry_policy,
+            coalesce_gets=coalesce_gets,
+            response_cache=response_cache,
+            instrumentation=instrumentation,
+            compress_requests_above=compress_requests_above,
+            accept_encoding=accept_encoding,
+        )
+        if brood_rate_limiter is not None:
+            self.transport.set_rate_limiter(self.brood_api_url, brood_rate_limiter)
+        if spire_rate_limiter is not None:
+            self.transport.set_rate_limiter(self.spire_api_url, spire_rate_limiter)
+
+        self.user = AsyncUser(
+            self.brood_api_url, transport=self.transport, fast_decode=fast_decode
+        )
+        self.group = AsyncGroup(
+            self.brood_api_url, transport=self.transport, fast_decode=fast_decode
+        )
+        self.humbug = AsyncHumbug(
+            self.spire_api_url, transport=self.transport, fast_decode=fast_decode
+        )
+        self.journal = AsyncJournal(
+            self.spire_api_url, transport=self.transport, fast_decode=fast_decode
+        )
+        self.resource = AsyncResource(
+            self.brood_api_url, transport=self.transport, fast_decode=fast_decode
+        )
+
+        # Opt-in cache of get_user and get_user_groups results by token
+        self.user_cache: Optional[TTLCache] = None
+        self.groups_cache: Optional[TTLCache] = None
+        if auth_cache_ttl is not None:
+            self.user_cache = TTLCache(maxsize=auth_cache_maxsize, ttl=auth_cache_ttl)
+            self.groups_cache = TTLCache(maxsize=auth_cache_maxsize, ttl=auth_cache_ttl)
+
+    def invalidate_token_cache(self, token: Union[str, uuid.UUID]) -> None:
+        if self.user_cache is not None:
+            self.user_cache.invalidate(token_key(token))
+        if self.groups_cache is not None:
+            self.groups_cache.invalidate(token_key(token))
+
+    def _clear_groups_cache(self) -> None:
+        if self.groups_cache is not None:
+            self.groups_cache.clear()
+
+    def clear_cache(self) -> None:
+        if self.user_cache is not None:
+            self.user_cache.clear()
+        self._clear_groups_cache()
+
+    @property
+    def brood_url(self):
+        return self.brood_api_url
+
+    @property
+    def spire_url(self):
+        return self.spire_api_url
+
+    async def close(self) -> None:
+        await self.transport.close()
+
+    async def __aenter__(self) -> "AsyncBugout":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    def batch(
+        self,
+        method: Union[str, Callable[..., Awaitable[Any]]],
+        calls: Iterable[Dict[str, Any]],
+        concurrency: int = 8,
+        ordered: bool = True,
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Asyncio version of Bugout.batch, calls above pool_maxsize wait for free
+        connection.
+        """
+        fn = getattr(self, method) if isinstance(method, str) else method
+        return run_batch(fn, calls, concurrency=concurrency, ordered=ordered)
+
+    async def brood_ping(self) -> Dict[str, str]:
+        return await ping(self.brood_api_url, client=self.transport.client)
+
+    async def spire_ping(self) -> Dict[str, str]:
+        return await ping(self.spire_api_url, client=self.transport.client)
+
+    # User handlers
+    async def create_user(
+        self,
+        username: str,
+        email: str,
+        password: str,
+        application_id: Optional[Union[str, uuid.UUID]] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+        **kwargs: Dict[str, Any],
+    ) -> data.BugoutUser:
+        return await self.user.create_user(
+            username=username,
+            email=email,
+            password=password,
+            application_id=application_id,
+            timeout=timeout,
+            **kwargs,
+        )
+
+    async def get_user(
+        self, token: Union[str, uuid.UUID], timeout: float = REQUESTS_TIMEOUT
+    ) -> data.BugoutUser:
+        if self.user_cache is not None:
+            cached_user = self.user_cache.get(token_key(token))
+            if cached_user is not None:
+                return cached_user
+        user = await self.user.get_user(token=token, timeout=timeout)
+        if self.user_cache is not None:
+            self.user_cache.set(token_key(token), user)
+        return user
+
+    async def get_user_by_id(
+        self,
+        token: Union[str, uuid.UUID],
+        user_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutUser:
+        return await self.user.get_user_by_id(
+            token=token, user_id=user_id, timeout=timeout
+        )
+
+    async def find_user(
+        self,
+        username: str,
+        token: Optional[Union[str, uuid.UUID]] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+        **kwargs: Dict[str, Any],
+    ) -> data.BugoutUser:
+        return await self.user.find_user(
+            username=username, token=token, timeout=timeout, **kwargs
+        )
+
+    async def confirm_email(
+        self,
+        token: Union[str, uuid.UUID],
+        verification_code: str,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutUser:
+        return await self.user.confirm_email(
+            token=token, verification_code=verification_code, timeout=timeout
+        )
+
+    async def restore_password(
+        self, email: str, timeout: float = REQUESTS_TIMEOUT
+    ) -> Dict[str, str]:
+        return await self.user.restore_password(email=email, timeout=timeout)
+
+    async def reset_password(
+        self,
+        reset_id: Union[str, uuid.UUID],
+        new_password: str,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutUser:
+        return await self.user.reset_password(
+            reset_id=reset_id, new_password=new_password, timeout=timeout
+        )
+
+    async def change_password(
+        self,
+        token: Union[str, uuid.UUID],
+        current_password: str,
+        new_password: str,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutUser:
+        return await self.user.change_password(
+            token=token,
+            current_password=current_password,
+            new_password=new_password,
+            timeout=timeout,
+        )
+
+    async def delete_user(
+        self,
+        token: Union[str, uuid.UUID],
+        user_id: Union[str, uuid.UUID],
+        password: Optional[str] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+        **kwargs: Dict[str, Any],
+    ) -> data.BugoutUser:
+        result = await self.user.delete_user(
+            token=token, user_id=user_id, password=password, timeout=timeout, **kwargs
+        )
+        # Tokens of deleted user are unknown, so all cached lookups are dropped
+        self.clear_cache()
+        return result
+
+    # Token handlers
+    async def create_token(
+        self,
+        username: str,
+        password: str,
+        application_id: Optional[Union[str, uuid.UUID]] = None,
+        token_note: Optional[str] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutToken:
+        return await self.user.create_token(
+            username=username,
+            password=password,
+            application_id=application_id,
+            token_note=token_note,
+            timeout=timeout,
+        )
+
+    async def create_token_restricted(
+        self,
+        token: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutToken:
+        return await self.user.create_token_restricted(token=token, timeout=timeout)
+
+    async def revoke_token(
+        self,
+        token: Union[str, uuid.UUID],
+        target_token: Optional[Union[str, uuid.UUID]] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> uuid.UUID:
+        result = await self.user.revoke_token(
+            token=token, target_token=target_token, timeout=timeout
+        )
+        self.invalidate_token_cache(target_token if target_token is not None else token)
+        return result
+
+    async def revoke_token_by_id(
+        self, token: Union[str, uuid.UUID], timeout: float = REQUESTS_TIMEOUT
+    ) -> uuid.UUID:
+        result = await self.user.revoke_token_by_id(token=token, timeout=timeout)
+        self.invalidate_token_cache(token)
+        return result
+
+    async def update_token(
+        self,
+        token: Union[str, uuid.UUID],
+        token_type: Optional[Union[str, data.TokenType]] = None,
+        token_note: Optional[str] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutToken:
+        return await self.user.update_token(
+            token=token,
+            token_type=data.TokenType(token_type) if token_type is not None else None,
+            token_note=token_note,
+            timeout=timeout,
+        )
+
+    async def get_token_types(
+        self, token: Union[str, uuid.UUID], timeout: float = REQUESTS_TIMEOUT
+    ) -> List[str]:
+        return await self.user.get_token_types(token=token, timeout=timeout)
+
+    async def get_user_tokens(
+        self,
+        token: Union[str, uuid.UUID],
+        active: Optional[bool] = None,
+        token_type: Optional[Union[str, data.TokenType]] = None,
+        restricted: Optional[bool] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutUserTokens:
+        return await self.user.get_user_tokens(
+            token=token,
+            active=active,
+            token_type=data.TokenType(token_type) if token_type is not None else None,
+            restricted=restricted,
+            timeout=timeout,
+        )
+
+    # Group handlers
+    async def get_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutGroup:
+        return await self.group.get_group(
+            token=token, group_id=group_id, timeout=timeout
+        )
+
+    async def find_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutGroup:
+        return await self.group.find_group(
+            token=token, group_id=group_id, timeout=timeout
+        )
+
+    async def get_user_groups(
+        self, token: Union[str, uuid.UUID], timeout: float = REQUESTS_TIMEOUT
+    ) -> data.BugoutUserGroups:
+        if self.groups_cache is not None:
+            cached_groups = self.groups_cache.get(token_key(token))
+            if cached_groups is not None:
+                return cached_groups
+        groups = await self.group.get_user_groups(token=token, timeout=timeout)
+        if self.groups_cache is not None:
+            self.groups_cache.set(token_key(token), groups)
+        return groups
+
+    async def create_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_name: str,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutGroup:
+        result = await self.group.create_group(
+            token=token, group_name=group_name, timeout=timeout
+        )
+        self._clear_groups_cache()
+        return result
+
+    async def set_user_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        user_type: Union[str, data.Role],
+        username: Optional[str] = None,
+        email: Optional[str] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutGroupUser:
+        result = await self.group.set_user_group(
+            token=token,
+            group_id=group_id,
+            user_type=data.Role(user_type),
+            username=username,
+            email=email,
+            timeout=timeout,
+        )
+        self._clear_groups_cache()
+        return result
+
+    async def delete_user_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        username: Optional[str] = None,
+        email: Optional[str] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutGroupUser:
+        result = await self.group.delete_user_group(
+            token=token,
+            group_id=group_id,
+            username=username,
+            email=email,
+            timeout=timeout,
+        )
+        self._clear_groups_cache()
+        return result
+
+    async def get_group_members(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutGroupMembers:
+        return await self.group.get_group_members(
+            token=token, group_id=group_id, timeout=timeout
+        )
+
+    async def update_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        group_name: str,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutGroup:
+        result = await self.group.update_group(
+            token=token, group_id=group_id, group_name=group_name, timeout=timeout
+        )
+        self._clear_groups_cache()
+        return result
+
+    async def delete_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutGroup:
+        result = await self.group.delete_group(
+            token=token, group_id=group_id, timeout=timeout
+        )
+        self._clear_groups_cache()
+        return result
+
+    # Application handlers
+    async def create_application(
+        self,
+        token: Union[str, uuid.UUID],
+        name: str,
+        description: str,
+        group_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutApplication:
+        return await self.group.create_application(
+            token=token,
+            name=name,
+            description=description,
+            group_id=group_id,
+            timeout=timeout,
+        )
+
+    async def get_application(
+        self,
+        token: Union[str, uuid.UUID],
+        application_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutApplication:
+        return await self.group.get_application(
+            token=token, application_id=application_id, timeout=timeout
+        )
+
+    async def list_applications(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Optional[Union[str, uuid.UUID]] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutApplications:
+        return await self.group.list_applications(
+            token=token, group_id=group_id, timeout=timeout
+        )
+
+    async def delete_application(
+        self,
+        token: Union[str, uuid.UUID],
+        application_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutApplication:
+        return await self.group.delete_application(
+            token=token, application_id=application_id, timeout=timeout
+        )
+
+    # Resource handlers
+    async def create_resource(
+        self,
+        token: Union[str, uuid.UUID],
+        application_id: Union[str, uuid.UUID],
+        resource_data: Dict[str, Any],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutResource:
+        return await self.resource.create_resource(
+            token=token,
+            application_id=application_id,
+            resource_data=resource_data,
+            timeout=timeout,
+        )
+
+    async def get_resource(
+        self,
+        token: Union[str, uuid.UUID],
+        resource_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutResource:
+        return await self.resource.get_resource(
+            token=token, resource_id=resource_id, timeout=timeout
+        )
+
+    async def list_resources(
+        self,
+        token: Union[str, uuid.UUID],
+        params: Optional[Dict[str, Any]] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutResources:
+        return await self.resource.list_resources(
+            token=token, params=params, timeout=timeout
+        )
+
+    def stream_resources(
+        self,
+        token: Union[str, uuid.UUID],
+        params: Optional[Dict[str, Any]] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> AsyncIterator[data.BugoutResource]:
+        return self.resource.stream_resources(
+            token=token, params=params, timeout=timeout
+        )
+
+    async def update_resource(
+        self,
+        token: Union[str, uuid.UUID],
+        resource_id: Union[str, uuid.UUID],
+        resource_data: Dict[str, Any],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutResource:
+        return await self.resource.update_resource(
+            token=token,
+            resource_id=resource_id,
+            resource_data_update=resource_data,
+            timeout=timeout,
+        )
+
+    async def delete_resource(
+        self,
+        token: Union[str, uuid.UUID],
+        resource_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutResource:
+        return await self.resource.delete_resource(
+            token=token, resource_id=resource_id, timeout=timeout
+        )
+
+    # Journal scopes handlers
+    async def list_scopes(
+        self, token: Union[str, uuid.UUID], api: str, timeout: float = REQUESTS_TIMEOUT
+    ) -> data.BugoutScopes:
+        return await self.journal.list_scopes(token=token, api=api, timeout=timeout)
+
+    async def get_journal_permissions(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        holder_ids: Optional[List[Union[str, uuid.UUID]]] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutJournalPermissions:
+        return await self.journal.get_journal_permissions(
+            token=token, journal_id=journal_id, holder_ids=holder_ids, timeout=timeout
+        )
+
+    async def get_journal_scopes(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutJournalScopeSpecs:
+        return await self.journal.get_journal_scopes(
+            token=token, journal_id=journal_id, timeout=timeout
+        )
+
+    async def update_journal_scopes(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        holder_type: Union[str, data.HolderType],
+        holder_id: Union[str, uuid.UUID],
+        permission_list: List[str],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutJournalScopeSpecs:
+        return await self.journal.update_journal_scopes(
+            token=token,
+            journal_id=journal_id,
+            holder_type=data.HolderType(holder_type),
+            holder_id=holder_id,
+            permission_list=permission_list,
+            timeout=timeout,
+        )
+
+    async def delete_journal_scopes(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        holder_type: Union[str, data.HolderType],
+        holder_id: Union[str, uuid.UUID],
+        permission_list: List[str],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutJournalScopeSpecs:
+        return await self.journal.delete_journal_scopes(
+            token=token,
+            journal_id=journal_id,
+            holder_type=data.HolderType(holder_type),
+            holder_id=holder_id,
+            permission_list=permission_list,
+            timeout=timeout,
+        )
+
+    # Journal handlers
+    async def create_journal(
+        self,
+        token: Union[str, uuid.UUID],
+        name: str,
+        journal_type: Optional[Union[str, data.JournalTypes]] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutJournal:
+        if journal_type is None:
+            journal_type = data.JournalTypes.DEFAULT
+        return await self.journal.create_journal(
+            token=token,
+            name=name,
+            journal_type=data.JournalTypes(journal_type),
+            timeout=timeout,
+        )
+
+    async def list_journals(
+        self, token: Union[str, uuid.UUID], timeout: float = REQUESTS_TIMEOUT
+    ) -> data.BugoutJournals:
+        return await self.journal.list_journals(token=token, timeout=timeout)
+
+    def stream_journals(
+        self, token: Union[str, uuid.UUID], timeout: float = REQUESTS_TIMEOUT
+    ) -> AsyncIterator[data.BugoutJournal]:
+        return self.journal.stream_journals(token=token, timeout=timeout)
+
+    async def get_journal(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutJournal:
+        return await self.journal.get_journal(
+            token=token, journal_id=journal_id, timeout=timeout
+        )
+
+    async def update_journal(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        name: str,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutJournal:
+        return await self.journal.update_journal(
+            token=token, journal_id=journal_id, name=name, timeout=timeout
+        )
+
+    async def delete_journal(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutJournal:
+        return await self.journal.delete_journal(
+            token=token, journal_id=journal_id, timeout=timeout
+        )
+
+    # Journal entries
+    async def create_entry(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        title: str,
+        content: str,
+        tags: List[str] = [],
+        context_url: Optional[str] = None,
+        context_id: Optional[str] = None,
+        context_type: Optional[str] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutJournalEntry:
+        return await self.journal.create_entry(
+            token=token,
+            journal_id=journal_id,
+            title=title,
+            content=content,
+            tags=tags,
+            context_url=context_url,
+            context_id=context_id,
+            context_type=context_type,
+            timeout=timeout,
+        )
+
+    async def create_entries_pack(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        entries: List[Dict[str, Any]],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutJournalEntries:
+        entries_obj = data.BugoutJournalEntriesRequest(
+            entries=[data.BugoutJournalEntryRequest(**entry) for entry in entries]
+        )
+        return await self.journal.create_entries_pack(
+            token=token,
+            journal_id=journal_id,
+            entries=entries_obj,
+            timeout=timeout,
+        )
+
+    async def get_entry(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        entry_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutJournalEntry:
+        return await self.journal.get_entry(
+            token=token, journal_id=journal_id, entry_id=entry_id, timeout=timeout
+        )
+
+    async def get_entries(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutJournalEntries:
+        return await self.journal.get_entries(
+            token=token, journal_id=journal_id, timeout=timeout
+        )
+
+    def stream_entries(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> AsyncIterator[data.BugoutJournalEntry]:
+        return self.journal.stream_entries(
+            token=token, journal_id=journal_id, timeout=timeout
+        )
+
+    async def get_entries_view(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> JournalEntriesView:
+        return await self.journal.get_entries_view(
+            token=token, journal_id=journal_id, timeout=timeout
+        )
+
+    async def get_entry_content(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        entry_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutJournalEntryContent:
+        return await self.journal.get_entry_content(
+            token=token, journal_id=journal_id, entry_id=entry_id, timeout=timeout
+        )
+
+    async def update_entry_content(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        entry_id: Union[str, uuid.UUID],
+        title: str,
+        content: str,
+        timeout: float = REQUESTS_TIMEOUT,
+        tags: Optional[List[str]] = None,
+        tags_action: TagsAction = TagsAction.merge,
+    ) -> data.BugoutJournalEntryContent:
+        return await self.journal.update_entry_content(
+            token=token,
+            journal_id=journal_id,
+            entry_id=entry_id,
+            title=title,
+            content=content,
+            tags=tags,
+            tags_action=tags_action,
+            timeout=timeout,
+        )
+
+    async def delete_entry(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        entry_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutJournalEntry:
+        return await self.journal.delete_entry(
+            token=token, journal_id=journal_id, entry_id=entry_id, timeout=timeout
+        )
+
+    # Tags
+    async def get_most_used_tags(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> List[Any]:
+        return await self.journal.get_most_used_tags(
+            token=token, journal_id=journal_id, timeout=timeout
+        )
+
+    async def create_tags(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        entry_id: Union[str, uuid.UUID],
+        tags: List[str],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> List[Any]:
+        return await self.journal.create_tags(
+            token=token,
+            journal_id=journal_id,
+            entry_id=entry_id,
+            tags=tags,
+            timeout=timeout,
+        )
+
+    async def get_tags(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        entry_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutJournalEntryTags:
+        return await self.journal.get_tags(
+            token=token, journal_id=journal_id, entry_id=entry_id, timeout=timeout
+        )
+
+    async def update_tags(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        entry_id: Union[str, uuid.UUID],
+        tags: List[str],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> List[Any]:
+        return await self.journal.update_tags(
+            token=token,
+            journal_id=journal_id,
+            entry_id=entry_id,
+            tags=tags,
+            timeout=timeout,
+        )
+
+    async def delete_tag(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        entry_id: Union[str, uuid.UUID],
+        tag: str,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutJournalEntryTags:
+        return await self.journal.delete_tag(
+            token=token,
+            journal_id=journal_id,
+            entry_id=entry_id,
+            tag=tag,
+            timeout=timeout,
+        )
+
+    # Search
+    async def search(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        query: str,
+        filters: Optional[List[str]] = None,
+        limit: int = 10,
+        offset: int = 0,
+        content: bool = True,
+        timeout: float = REQUESTS_TIMEOUT,
+        order: SearchOrder = SearchOrder.DESCENDING,
+    ) -> data.BugoutSearchResults:
+        return await self.journal.search(
+            token,
+            journal_id,
+            query,
+            filters,
+            limit,
+            offset,
+            content,
+            order=order,
+            timeout=timeout,
+        )
+
+    async def search_view(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        query: str,
+        filters: Optional[List[str]] = None,
+        limit: int = 10,
+        offset: int = 0,
+        content: bool = True,
+        timeout: float = REQUESTS_TIMEOUT,
+        order: SearchOrder = SearchOrder.DESCENDING,
+    ) -> SearchResultsView:
+        return await self.journal.search_view(
+            token,
+            journal_id,
+            query,
+            filters,
+            limit,
+            offset,
+            content,
+            order=order,
+            timeout=timeout,
+        )
+
+    def iter_search(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        query: str,
+        filters: Optional[List[str]] = None,
+        page_size: int = 100,
+        offset: int = 0,
+        content: bool = True,
+        timeout: float = REQUESTS_TIMEOUT,
+        order: SearchOrder = SearchOrder.DESCENDING,
+        prefetch: bool = False,
+    ) -> AsyncIterator[data.BugoutSearchResult]:
+        return self.journal.iter_search(
+            token=token,
+            journal_id=journal_id,
+            query=query,
+            filters=filters,
+            page_size=page_size,
+            offset=offset,
+            content=content,
+            order=order,
+            prefetch=prefetch,
+            timeout=timeout,
+        )
+
+    def iter_search_view(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        query: str,
+        filters: Optional[List[str]] = None,
+        page_size: int = 100,
+        offset: int = 0,
+        content: bool = True,
+        timeout: float = REQUESTS_TIMEOUT,
+        order: SearchOrder = SearchOrder.DESCENDING,
+        prefetch: bool = False,
+    ) -> AsyncIterator[SearchResultView]:
+        return self.journal.iter_search_view(
+            token=token,
+            journal_id=journal_id,
+            query=query,
+            filters=filters,
+            page_size=page_size,
+            offset=offset,
+            content=content,
+            order=order,
+            prefetch=prefetch,
+            timeout=timeout,
+        )
+
+    # Public
+    async def check_journal_public(
+        self,
+        journal_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> bool:
+        return await self.journal.check_journal_public(
+            journal_id=journal_id, timeout=timeout
+        )
+
+    # Humbug
+    async def get_humbug_integrations(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Optional[Union[str, uuid.UUID]] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutHumbugIntegrationsList:
+        return await self.humbug.get_humbug_integrations(
+            token=token, group_id=group_id, timeout=timeout
+        )
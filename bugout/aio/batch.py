@@ -0,0 +1,85 @@
+import asyncio
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Optional,
+    Set,
+)
+
+from ..batch import BATCH_ERRORS, BatchResult
+
+
+async def call_batch_item(
+    fn: Callable[..., Awaitable[Any]], position: int, kwargs: Dict[str, Any]
+) -> BatchResult:
+    try:
+        return BatchResult(position=position, kwargs=kwargs, result=await fn(**kwargs))
+    except BATCH_ERRORS as e:
+        return BatchResult(position=position, kwargs=kwargs, error=e)
+
+
+async def run_batch(
+    fn: Callable[..., Awaitable[Any]],
+    calls: Iterable[Dict[str, Any]],
+    concurrency: int = 8,
+    ordered: bool = True,
+    window: Optional[int] = None,
+) -> AsyncIterator[BatchResult]:
+    """
+    Asyncio version of run_batch, calls run as tasks with up to concurrency of them in
+    flight and up to window of them started but not yielded.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency should be at least 1")
+    if window is None:
+        window = 2 * concurrency
+    elif window < concurrency:
+        raise ValueError("window should be at least concurrency")
+
+    # Calls are started only when there is free slot, as threads of sync run_batch
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited(index: int, kwargs: Dict[str, Any]) -> BatchResult:
+        async with semaphore:
+            return await call_batch_item(fn, index, kwargs)
+
+    if ordered:
+        # Results of ordered batch are awaited in order of calls
+        in_flight: Deque["asyncio.Task[BatchResult]"] = deque()
+        try:
+            for index, kwargs in enumerate(calls):
+                if len(in_flight) >= window:
+                    yield await in_flight.popleft()
+                in_flight.append(asyncio.ensure_future(limited(index, kwargs)))
+            while in_flight:
+                yield await in_flight.popleft()
+        finally:
+            for pending in in_flight:
+                pending.cancel()
+        return
+
+    running: Set["asyncio.Task[BatchResult]"] = set()
+    try:
+        for index, kwargs in enumerate(calls):
+            if len(running) >= window:
+                done, running = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for finished in done:
+                    yield finished.result()
+            running.add(asyncio.ensure_future(limited(index, kwargs)))
+        while running:
+            done, running = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
+            for finished in done:
+                yield finished.result()
+    finally:
+        for pending in running:
+            pending.cancel()
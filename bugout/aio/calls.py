@@ -0,0 +1,155 @@
+import asyncio
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+
+from ..data import Method
+from ..exceptions import BugoutResponseException, BugoutUnexpectedResponse
+from ..ratelimit import RateLimiter
+from ..retry import RetryPolicy
+from ..streaming import STREAM_CHUNK_SIZE, JSONArrayDecoder
+
+
+def _drop_none(values: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    requests skips None values in params and form data, httpx sends them as empty strings.
+    """
+    if values is None:
+        return None
+    return {key: value for key, value in values.items() if value is not None}
+
+
+async def send_request(
+    method: Method,
+    url: str,
+    client: Optional[httpx.AsyncClient] = None,
+    timeout: Optional[float] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    stream: bool = False,
+    **kwargs,
+) -> httpx.Response:
+    """
+    Sends request with retries and returns raw response. With stream response body is
+    not read, caller should close response. Token of rate_limiter is acquired before
+    every attempt.
+    """
+    if stream and client is None:
+        raise ValueError("Streaming requests require client")
+    if "params" in kwargs:
+        kwargs["params"] = _drop_none(kwargs["params"])
+    if "data" in kwargs:
+        kwargs["data"] = _drop_none(kwargs["data"])
+    request_timeout = httpx.Timeout(timeout, pool=None)
+
+    attempt = 0
+    while True:
+        if rate_limiter is not None:
+            await rate_limiter.acquire_async()
+        try:
+            if client is not None and stream:
+                r = await client.send(
+                    client.build_request(
+                        method.value, url=url, timeout=request_timeout, **kwargs
+                    ),
+                    stream=True,
+                )
+            elif client is not None:
+                r = await client.request(
+                    method.value, url=url, timeout=request_timeout, **kwargs
+                )
+            else:
+                async with httpx.AsyncClient() as one_time_client:
+                    r = await one_time_client.request(
+                        method.value, url=url, timeout=request_timeout, **kwargs
+                    )
+        except httpx.TransportError as e:
+            if retry_policy is not None and retry_policy.should_retry(method, attempt):
+                await asyncio.sleep(retry_policy.delay(attempt))
+                attempt += 1
+                continue
+            raise BugoutUnexpectedResponse(f"{str(e)}")
+        if retry_policy is not None and retry_policy.should_retry(
+            method, attempt, status_code=r.status_code
+        ):
+            await asyncio.sleep(
+                retry_policy.delay(attempt, r.headers.get("Retry-After"))
+            )
+            await r.aclose()
+            attempt += 1
+            continue
+        return r
+
+
+def parse_response(r: httpx.Response) -> Any:
+    """
+    Decodes response body, raises on error status.
+    """
+    response_body = None
+    try:
+        r.raise_for_status()
+        response_body = r.json()
+    except httpx.HTTPStatusError as e:
+        exception_detail = e.response.json()
+        raise BugoutResponseException(
+            "An exception occurred at Bugout API side",
+            status_code=e.response.status_code,
+            detail=(
+                exception_detail["detail"]
+                if exception_detail["detail"] is not None
+                else None
+            ),
+        )
+    except Exception as e:
+        raise BugoutUnexpectedResponse(f"{str(e)}")
+    return response_body
+
+
+async def iter_response_items(
+    r: httpx.Response, key: Optional[str]
+) -> AsyncIterator[Any]:
+    """
+    Decodes items of list under key of streamed response as they arrive, raises on error
+    status. Response is closed when iteration ends.
+    """
+    try:
+        if r.status_code >= 400:
+            await r.aread()
+            parse_response(r)
+        decoder = JSONArrayDecoder(key)
+        async for chunk in r.aiter_bytes(STREAM_CHUNK_SIZE):
+            for item in decoder.feed(chunk):
+                yield item
+        for item in decoder.close():
+            yield item
+    except httpx.HTTPError as e:
+        raise BugoutUnexpectedResponse(f"{str(e)}")
+    finally:
+        await r.aclose()
+
+
+async def make_request(
+    method: Method,
+    url: str,
+    client: Optional[httpx.AsyncClient] = None,
+    timeout: Optional[float] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    **kwargs,
+) -> Any:
+    return parse_response(
+        await send_request(
+            method,
+            url,
+            client=client,
+            timeout=timeout,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            **kwargs,
+        )
+    )
+
+
+async def ping(url: str, client: Optional[httpx.AsyncClient] = None) -> Dict[str, Any]:
+    url = f"{url.rstrip('/')}/ping"
+    return await make_request(Method.get, url, client=client)
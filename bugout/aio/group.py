@@ -0,0 +1,345 @@
+from typing import Any, Dict, Optional, Type, Union
+import uuid
+
+from pydantic import BaseModel
+
+from ..data import (
+    Method,
+    Role,
+    BugoutGroup,
+    BugoutGroupUser,
+    BugoutGroupMembers,
+    BugoutUserGroups,
+    BugoutApplication,
+    BugoutApplications,
+)
+from ..exceptions import InvalidUrlSpec, GroupInvalidParameters
+from ..settings import REQUESTS_TIMEOUT
+from .transport import AsyncTransport
+
+
+class AsyncGroup:
+    """
+    Represent a group from Bugout, asyncio version.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+        transport: Optional[AsyncTransport] = None,
+        fast_decode: bool = False,
+    ) -> None:
+        if url is None:
+            raise InvalidUrlSpec("Invalid brood url specified")
+        self.url = url
+        self.timeout = timeout
+        self.transport = transport if transport is not None else AsyncTransport()
+        self.fast_decode = fast_decode
+
+    async def _call(
+        self,
+        method: Method,
+        path: str,
+        timeout: Optional[float] = None,
+        model: Optional[Type[BaseModel]] = None,
+        **kwargs,
+    ):
+        url = f"{self.url.rstrip('/')}/{path.rstrip('/')}"
+        result = await self.transport.request(
+            method=method,
+            url=url,
+            model=model,
+            validate=not self.fast_decode,
+            timeout=timeout if timeout is not None else self.timeout,
+            **kwargs,
+        )
+        return result
+
+    async def get_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> BugoutGroup:
+        get_group_path = f"group/{group_id}"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.get,
+            path=get_group_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutGroup,
+        )
+
+    async def find_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> BugoutGroup:
+        find_group_path = f"groups/find"
+        query_params = {"group_id": group_id}
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.get,
+            path=find_group_path,
+            params=query_params,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutGroup,
+        )
+
+    async def get_user_groups(
+        self, token: Union[str, uuid.UUID], timeout: Optional[float] = None
+    ) -> BugoutUserGroups:
+        get_user_groups_path = "groups"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.get,
+            path=get_user_groups_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutUserGroups,
+        )
+
+    async def create_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_name: str,
+        timeout: Optional[float] = None,
+    ) -> BugoutGroup:
+        create_group_path = "group"
+        data = {
+            "group_name": group_name,
+        }
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.post,
+            path=create_group_path,
+            headers=headers,
+            data=data,
+            timeout=timeout,
+            model=BugoutGroup,
+        )
+
+    async def set_user_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        user_type: Role,
+        username: Optional[str] = None,
+        email: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> BugoutGroupUser:
+        set_user_group_path = f"group/{group_id}/role"
+
+        if username is None and email is None:
+            raise GroupInvalidParameters(
+                "In order to update group role, at least one of username, or email must be specified"
+            )
+
+        data: Dict[str, Any] = {
+            "user_type": user_type.value,
+        }
+        if username is not None:
+            data.update({"username": username})
+        if email is not None:
+            data.update({"email": email})
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.post,
+            path=set_user_group_path,
+            headers=headers,
+            data=data,
+            timeout=timeout,
+            model=BugoutGroupUser,
+        )
+
+    async def delete_user_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        username: Optional[str] = None,
+        email: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> BugoutGroupUser:
+        """
+        TODO(kompotkot): Merge with set_user_group()
+        """
+        delete_user_group_path = f"group/{group_id}/role"
+
+        if username is None and email is None:
+            raise GroupInvalidParameters(
+                "In order to update group role, at least one of username, or email must be specified"
+            )
+
+        data = {}
+        if username is not None:
+            data.update({"username": username})
+        if email is not None:
+            data.update({"email": email})
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.delete,
+            path=delete_user_group_path,
+            headers=headers,
+            data=data,
+            timeout=timeout,
+            model=BugoutGroupUser,
+        )
+
+    async def get_group_members(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> BugoutGroupMembers:
+        get_group_members_path = f"group/{group_id}/users"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.get,
+            path=get_group_members_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutGroupMembers,
+        )
+
+    async def update_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        group_name: str,
+        timeout: Optional[float] = None,
+    ) -> BugoutGroup:
+        update_group_path = f"group/{group_id}/name"
+        data = {
+            "group_name": group_name,
+        }
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.put,
+            path=update_group_path,
+            headers=headers,
+            data=data,
+            timeout=timeout,
+            model=BugoutGroup,
+        )
+
+    async def delete_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> BugoutGroup:
+        delete_group_path = f"group/{group_id}"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.delete,
+            path=delete_group_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutGroup,
+        )
+
+    async def create_application(
+        self,
+        token: Union[str, uuid.UUID],
+        name: str,
+        description: str,
+        group_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> BugoutApplication:
+        applications_path = "applications"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        data = {
+            "name": name,
+            "description": description,
+            "group_id": group_id,
+        }
+        return await self._call(
+            method=Method.post,
+            path=applications_path,
+            headers=headers,
+            data=data,
+            timeout=timeout,
+            model=BugoutApplication,
+        )
+
+    async def get_application(
+        self,
+        token: Union[str, uuid.UUID],
+        application_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> BugoutApplication:
+        applications_path = f"applications/{application_id}"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.get,
+            path=applications_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutApplication,
+        )
+
+    async def list_applications(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Optional[Union[str, uuid.UUID]] = None,
+        timeout: Optional[float] = None,
+    ) -> BugoutApplications:
+        applications_path = "applications"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        query_params = {
+            "group_id": group_id,
+        }
+        return await self._call(
+            method=Method.get,
+            path=applications_path,
+            params=query_params,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutApplications,
+        )
+
+    async def delete_application(
+        self,
+        token: Union[str, uuid.UUID],
+        application_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> BugoutApplication:
+        applications_path = f"applications/{application_id}"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.delete,
+            path=applications_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutApplication,
+        )
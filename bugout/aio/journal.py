@@ -0,0 +1,844 @@
+import asyncio
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Type,
+    Union,
+)
+import uuid
+
+from pydantic import BaseModel
+
+from ..data import (
+    BugoutJournal,
+    BugoutJournals,
+    BugoutJournalPermissions,
+    BugoutScopes,
+    BugoutJournalScopeSpecs,
+    BugoutJournalEntry,
+    BugoutJournalEntries,
+    BugoutJournalEntriesRequest,
+    BugoutJournalEntryContent,
+    BugoutJournalEntryTags,
+    BugoutSearchResult,
+    BugoutSearchResults,
+    HolderType,
+    Method,
+    JournalTypes,
+)
+from ..decode import decode
+from ..exceptions import InvalidUrlSpec
+from ..journal import SearchOrder, TagsAction
+from ..settings import REQUESTS_TIMEOUT
+from .transport import AsyncTransport
+from ..views import JournalEntriesView, SearchResultsView, SearchResultView
+
+
+class AsyncJournal:
+    """
+    Represent a journal from Bugout, asyncio version.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+        transport: Optional[AsyncTransport] = None,
+        fast_decode: bool = False,
+    ) -> None:
+        if url is None:
+            raise InvalidUrlSpec("Invalid spire url specified")
+        self.url = url
+        self.timeout = timeout
+        self.transport = transport if transport is not None else AsyncTransport()
+        self.fast_decode = fast_decode
+
+    async def _call(
+        self,
+        method: Method,
+        path: str,
+        timeout: Optional[float] = None,
+        model: Optional[Type[BaseModel]] = None,
+        **kwargs,
+    ):
+        url = f"{self.url.rstrip('/')}/{path.rstrip('/')}"
+        result = await self.transport.request(
+            method=method,
+            url=url,
+            model=model,
+            validate=not self.fast_decode,
+            timeout=timeout if timeout is not None else self.timeout,
+            **kwargs,
+        )
+        return result
+
+    async def _stream(
+        self,
+        method: Method,
+        path: str,
+        key: str,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        url = f"{self.url.rstrip('/')}/{path.rstrip('/')}"
+        async for item in self.transport.stream(
+            method=method,
+            url=url,
+            key=key,
+            timeout=timeout if timeout is not None else self.timeout,
+            **kwargs,
+        ):
+            yield item
+
+    # Scope module
+    async def list_scopes(
+        self, token: Union[str, uuid.UUID], api: str, timeout: Optional[float] = None
+    ) -> BugoutScopes:
+        scopes_path = f"journals/scopes"
+        json = {
+            "api": api,
+        }
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.get,
+            path=scopes_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
+            model=BugoutScopes,
+        )
+
+    async def get_journal_permissions(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        holder_ids: Optional[List[Union[str, uuid.UUID]]] = None,
+        timeout: Optional[float] = None,
+    ) -> BugoutJournalPermissions:
+        journal_scopes_path = f"journals/{journal_id}/permissions"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        query_params = {}
+        if holder_ids is not None:
+            holder_ids_string = [str(holder_id) for holder_id in holder_ids]
+            holder_ids_param = ",".join(holder_ids_string)
+            query_params = {"holder_ids": holder_ids_param}
+        return await self._call(
+            method=Method.get,
+            path=journal_scopes_path,
+            params=query_params,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutJournalPermissions,
+        )
+
+    async def get_journal_scopes(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> BugoutJournalScopeSpecs:
+        journal_scopes_path = f"journals/{journal_id}/scopes"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.get,
+            path=journal_scopes_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutJournalScopeSpecs,
+        )
+
+    async def update_journal_scopes(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        holder_type: HolderType,
+        holder_id: Union[str, uuid.UUID],
+        permission_list: List[str],
+        timeout: Optional[float] = None,
+    ) -> BugoutJournalScopeSpecs:
+        journal_scopes_path = f"journals/{journal_id}/scopes"
+        json = {
+            "holder_type": holder_type.value,
+            "holder_id": str(holder_id),
+            "permission_list": permission_list,
+        }
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.post,
+            path=journal_scopes_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
+            model=BugoutJournalScopeSpecs,
+        )
+
+    async def delete_journal_scopes(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        holder_type: HolderType,
+        holder_id: Union[str, uuid.UUID],
+        permission_list: List[str],
+        timeout: Optional[float] = None,
+    ) -> BugoutJournalScopeSpecs:
+        journal_scopes_path = f"journals/{journal_id}/scopes"
+        json = {
+            "holder_type": holder_type.value,
+            "holder_id": str(holder_id),
+            "permission_list": permission_list,
+        }
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.delete,
+            path=journal_scopes_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
+            model=BugoutJournalScopeSpecs,
+        )
+
+    # Journal module
+    async def create_journal(
+        self,
+        token: Union[str, uuid.UUID],
+        name: str,
+        journal_type: JournalTypes,
+        timeout: Optional[float] = None,
+    ) -> BugoutJournal:
+        journal_path = "journals/"
+        json = {"name": name, "journal_type": journal_type.value}
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.post,
+            path=journal_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
+            model=BugoutJournal,
+        )
+
+    async def list_journals(
+        self, token: Union[str, uuid.UUID], timeout: Optional[float] = None
+    ) -> BugoutJournals:
+        journal_path = "journals/"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.get,
+            path=journal_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutJournals,
+        )
+
+    async def stream_journals(
+        self, token: Union[str, uuid.UUID], timeout: Optional[float] = None
+    ) -> AsyncIterator[BugoutJournal]:
+        """
+        Same as list_journals, but decodes journals one by one as response arrives.
+        """
+        journal_path = "journals/"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        async for journal in self._stream(
+            method=Method.get,
+            path=journal_path,
+            key="journals",
+            headers=headers,
+            timeout=timeout,
+        ):
+            yield decode(BugoutJournal, journal, validate=not self.fast_decode)
+
+    async def get_journal(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> BugoutJournal:
+        journal_id_path = f"journals/{journal_id}"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.get,
+            path=journal_id_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutJournal,
+        )
+
+    async def update_journal(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        name: str,
+        timeout: Optional[float] = None,
+    ) -> BugoutJournal:
+        journal_id_path = f"journals/{journal_id}"
+        json = {
+            "name": name,
+        }
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.put,
+            path=journal_id_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
+            model=BugoutJournal,
+        )
+
+    async def delete_journal(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> BugoutJournal:
+        journal_id_path = f"journals/{journal_id}"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.delete,
+            path=journal_id_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutJournal,
+        )
+
+    # Entry module
+    async def create_entry(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        title: str,
+        content: str,
+        tags: List[str] = [],
+        context_url: Optional[str] = None,
+        context_id: Optional[str] = None,
+        context_type: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> BugoutJournalEntry:
+        entry_path = f"journals/{journal_id}/entries"
+        json = {
+            "title": title,
+            "content": content,
+            "tags": tags,
+            "context_url": context_url,
+            "context_id": context_id,
+            "context_type": context_type,
+        }
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.post,
+            path=entry_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
+            model=BugoutJournalEntry,
+        )
+
+    async def create_entries_pack(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        entries: BugoutJournalEntriesRequest,
+        timeout: Optional[float] = None,
+    ) -> BugoutJournalEntries:
+        entry_path = f"journals/{journal_id}/bulk"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        json = {
+            "entries": [
+                {
+                    "title": entry.title,
+                    "content": entry.content,
+                    "tags": entry.tags,
+                    "context_url": entry.context_url,
+                    "context_id": entry.context_id,
+                    "context_type": entry.context_type,
+                }
+                for entry in entries.entries
+            ]
+        }
+        return await self._call(
+            method=Method.post,
+            path=entry_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
+            model=BugoutJournalEntries,
+        )
+
+    async def get_entry(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        entry_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> BugoutJournalEntry:
+        entry_id_path = f"journals/{journal_id}/entries/{entry_id}"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.get,
+            path=entry_id_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutJournalEntry,
+        )
+
+    async def get_entries(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> BugoutJournalEntries:
+        entry_path = f"journals/{journal_id}/entries"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.get,
+            path=entry_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutJournalEntries,
+        )
+
+    async def stream_entries(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[BugoutJournalEntry]:
+        """
+        Same as get_entries, but decodes entries one by one as response arrives, so only
+        one entry is kept in memory at a time.
+        """
+        entry_path = f"journals/{journal_id}/entries"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        async for entry in self._stream(
+            method=Method.get,
+            path=entry_path,
+            key="entries",
+            headers=headers,
+            timeout=timeout,
+        ):
+            yield decode(BugoutJournalEntry, entry, validate=not self.fast_decode)
+
+    async def get_entries_view(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> JournalEntriesView:
+        """
+        Same as get_entries, but returns lightweight views over response.
+        """
+        entry_path = f"journals/{journal_id}/entries"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        result = await self._call(
+            method=Method.get, path=entry_path, headers=headers, timeout=timeout
+        )
+        return JournalEntriesView(result)
+
+    async def get_entry_content(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        entry_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> BugoutJournalEntryContent:
+        entry_id_content_path = f"journals/{journal_id}/entries/{entry_id}/content"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.get,
+            path=entry_id_content_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutJournalEntryContent,
+        )
+
+    async def update_entry_content(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        entry_id: Union[str, uuid.UUID],
+        title: str,
+        content: str,
+        tags: Optional[List[str]] = None,
+        tags_action: TagsAction = TagsAction.merge,
+        timeout: Optional[float] = None,
+    ) -> BugoutJournalEntryContent:
+        entry_id_content_path = f"journals/{journal_id}/entries/{entry_id}/content"
+        params: Dict[str, str] = {}
+        json: Dict[str, Any] = {
+            "title": title,
+            "content": content,
+        }
+        if tags is not None:
+            json["tags"] = tags
+            params["tags_action"] = tags_action.value
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.put,
+            path=entry_id_content_path,
+            headers=headers,
+            json=json,
+            params=params,
+            timeout=timeout,
+            model=BugoutJournalEntryContent,
+        )
+
+    async def delete_entry(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        entry_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> BugoutJournalEntry:
+        entry_id_path = f"journals/{journal_id}/entries/{entry_id}"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.delete,
+            path=entry_id_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutJournalEntry,
+        )
+
+    # Tags module
+    async def get_most_used_tags(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> List[Any]:
+        tags_path = f"journals/{journal_id}/tags"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        result = await self._call(
+            method=Method.get, path=tags_path, headers=headers, timeout=timeout
+        )
+        return result
+
+    async def create_tags(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        entry_id: Union[str, uuid.UUID],
+        tags: List[str],
+        timeout: Optional[float] = None,
+    ) -> List[Any]:
+        tags_path = f"journals/{journal_id}/entries/{entry_id}/tags"
+        json = {"tags": tags}
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        result = await self._call(
+            method=Method.post,
+            path=tags_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
+        )
+        return result
+
+    async def get_tags(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        entry_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> BugoutJournalEntryTags:
+        tags_path = f"journals/{journal_id}/entries/{entry_id}/tags"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.get,
+            path=tags_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutJournalEntryTags,
+        )
+
+    async def update_tags(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        entry_id: Union[str, uuid.UUID],
+        tags: List[str],
+        timeout: Optional[float] = None,
+    ) -> List[Any]:
+        tags_path = f"journals/{journal_id}/entries/{entry_id}/tags"
+        json = {"tags": tags}
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        result = await self._call(
+            method=Method.put,
+            path=tags_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
+        )
+        return result
+
+    async def delete_tag(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        entry_id: Union[str, uuid.UUID],
+        tag: str,
+        timeout: Optional[float] = None,
+    ) -> BugoutJournalEntryTags:
+        tags_path = f"journals/{journal_id}/entries/{entry_id}/tags"
+        json = {"tag": tag}
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.delete,
+            path=tags_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
+            model=BugoutJournalEntryTags,
+        )
+
+    # Search module
+    async def _search(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        query: str,
+        filters: Optional[List[str]] = None,
+        limit: int = 10,
+        offset: int = 0,
+        content: bool = True,
+        order: SearchOrder = SearchOrder.DESCENDING,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        search_path = f"journals/{journal_id}/search"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        query_params = {
+            "q": query,
+            "filters": filters if filters is not None else [],
+            "limit": limit,
+            "offset": offset,
+            "content": content,
+            "order": order.value,
+        }
+        result = await self._call(
+            method=Method.get,
+            path=search_path,
+            params=query_params,
+            headers=headers,
+            timeout=timeout,
+        )
+        return result
+
+    async def search(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        query: str,
+        filters: Optional[List[str]] = None,
+        limit: int = 10,
+        offset: int = 0,
+        content: bool = True,
+        order: SearchOrder = SearchOrder.DESCENDING,
+        timeout: Optional[float] = None,
+    ) -> BugoutSearchResults:
+        result = await self._search(
+            token=token,
+            journal_id=journal_id,
+            query=query,
+            filters=filters,
+            limit=limit,
+            offset=offset,
+            content=content,
+            order=order,
+            timeout=timeout,
+        )
+        return decode(BugoutSearchResults, result, validate=not self.fast_decode)
+
+    async def search_view(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        query: str,
+        filters: Optional[List[str]] = None,
+        limit: int = 10,
+        offset: int = 0,
+        content: bool = True,
+        order: SearchOrder = SearchOrder.DESCENDING,
+        timeout: Optional[float] = None,
+    ) -> SearchResultsView:
+        """
+        Same as search, but returns lightweight views over response.
+        """
+        result = await self._search(
+            token=token,
+            journal_id=journal_id,
+            query=query,
+            filters=filters,
+            limit=limit,
+            offset=offset,
+            content=content,
+            order=order,
+            timeout=timeout,
+        )
+        return SearchResultsView(result)
+
+    async def iter_search(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        query: str,
+        filters: Optional[List[str]] = None,
+        page_size: int = 100,
+        offset: int = 0,
+        content: bool = True,
+        order: SearchOrder = SearchOrder.DESCENDING,
+        prefetch: bool = False,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[BugoutSearchResult]:
+        """
+        Lazily yields search results page by page following next_offset.
+
+        With prefetch next page is requested in background task while current page
+        is consumed, so at most two pages are kept in memory.
+        """
+
+        async def fetch_page(page_offset: int) -> BugoutSearchResults:
+            return await self.search(
+                token=token,
+                journal_id=journal_id,
+                query=query,
+                filters=filters,
+                limit=page_size,
+                offset=page_offset,
+                content=content,
+                order=order,
+                timeout=timeout,
+            )
+
+        async for result in self._iter_pages(fetch_page, offset, prefetch):
+            yield result
+
+    async def iter_search_view(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        query: str,
+        filters: Optional[List[str]] = None,
+        page_size: int = 100,
+        offset: int = 0,
+        content: bool = True,
+        order: SearchOrder = SearchOrder.DESCENDING,
+        prefetch: bool = False,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[SearchResultView]:
+        """
+        Same as iter_search, but yields lightweight views over search results.
+        """
+
+        async def fetch_page(page_offset: int) -> SearchResultsView:
+            return await self.search_view(
+                token=token,
+                journal_id=journal_id,
+                query=query,
+                filters=filters,
+                limit=page_size,
+                offset=page_offset,
+                content=content,
+                order=order,
+                timeout=timeout,
+            )
+
+        async for result in self._iter_pages(fetch_page, offset, prefetch):
+            yield result
+
+    async def _iter_pages(
+        self,
+        fetch_page: Callable[[int], Awaitable[Any]],
+        offset: int,
+        prefetch: bool,
+    ) -> AsyncIterator[Any]:
+        if not prefetch:
+            next_offset: Optional[int] = offset
+            while next_offset is not None:
+                page = await fetch_page(next_offset)
+                if not page.results:
+                    return
+                next_offset = page.next_offset
+                for result in page.results:
+                    yield result
+            return
+
+        next_page: Optional["asyncio.Future[Any]"] = asyncio.ensure_future(
+            fetch_page(offset)
+        )
+        try:
+            while next_page is not None:
+                page = await next_page
+                next_page = None
+                if page.results and page.next_offset is not None:
+                    next_page = asyncio.ensure_future(fetch_page(page.next_offset))
+                for result in page.results:
+                    yield result
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    # Public module
+    async def check_journal_public(
+        self, journal_id: Union[str, uuid.UUID], timeout: Optional[float] = None
+    ) -> bool:
+        journal_path = "public/check"
+        query_params = {"journal_id": journal_id}
+        result = await self._call(
+            method=Method.get, path=journal_path, params=query_params, timeout=timeout
+        )
+        return result
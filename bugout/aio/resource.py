@@ -0,0 +1,189 @@
+from typing import Any, AsyncIterator, Dict, Optional, Type, Union
+import uuid
+
+from pydantic import BaseModel
+
+from ..data import Method, BugoutResource, BugoutResources
+from ..decode import decode
+from ..exceptions import InvalidUrlSpec
+from ..settings import REQUESTS_TIMEOUT
+from .transport import AsyncTransport
+
+
+class AsyncResource:
+    """
+    Represent a resources from Bugout, asyncio version.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+        transport: Optional[AsyncTransport] = None,
+        fast_decode: bool = False,
+    ) -> None:
+        if url is None:
+            raise InvalidUrlSpec("Invalid brood url specified")
+        self.url = url
+        self.timeout = timeout
+        self.transport = transport if transport is not None else AsyncTransport()
+        self.fast_decode = fast_decode
+
+    async def _call(
+        self,
+        method: Method,
+        path: str,
+        timeout: Optional[float] = None,
+        model: Optional[Type[BaseModel]] = None,
+        **kwargs,
+    ):
+        url = f"{self.url.rstrip('/')}/{path}"
+        result = await self.transport.request(
+            method=method,
+            url=url,
+            model=model,
+            validate=not self.fast_decode,
+            timeout=timeout if timeout is not None else self.timeout,
+            **kwargs,
+        )
+        return result
+
+    async def _stream(
+        self,
+        method: Method,
+        path: str,
+        key: str,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        url = f"{self.url.rstrip('/')}/{path}"
+        async for item in self.transport.stream(
+            method=method,
+            url=url,
+            key=key,
+            timeout=timeout if timeout is not None else self.timeout,
+            **kwargs,
+        ):
+            yield item
+
+    async def create_resource(
+        self,
+        token: Union[str, uuid.UUID],
+        application_id: Union[str, uuid.UUID],
+        resource_data: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ) -> BugoutResource:
+        resources_path = "resources/"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        json_data = {
+            "application_id": application_id,
+            "resource_data": resource_data,
+        }
+        return await self._call(
+            method=Method.post,
+            path=resources_path,
+            headers=headers,
+            json=json_data,
+            timeout=timeout,
+            model=BugoutResource,
+        )
+
+    async def get_resource(
+        self,
+        token: Union[str, uuid.UUID],
+        resource_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> BugoutResource:
+        resources_path = f"resources/{resource_id}"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.get,
+            path=resources_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutResource,
+        )
+
+    async def list_resources(
+        self,
+        token: Union[str, uuid.UUID],
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> BugoutResources:
+        resources_path = "resources/"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.get,
+            path=resources_path,
+            params=params,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutResources,
+        )
+
+    async def stream_resources(
+        self,
+        token: Union[str, uuid.UUID],
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[BugoutResource]:
+        """
+        Same as list_resources, but decodes resources one by one as response arrives.
+        """
+        resources_path = "resources/"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        async for resource in self._stream(
+            method=Method.get,
+            path=resources_path,
+            key="resources",
+            params=params,
+            headers=headers,
+            timeout=timeout,
+        ):
+            yield decode(BugoutResource, resource, validate=not self.fast_decode)
+
+    async def update_resource(
+        self,
+        token: Union[str, uuid.UUID],
+        resource_id: Union[str, uuid.UUID],
+        resource_data_update: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ) -> BugoutResource:
+        resources_path = f"resources/{resource_id}"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.put,
+            path=resources_path,
+            headers=headers,
+            json=resource_data_update,
+            timeout=timeout,
+            model=BugoutResource,
+        )
+
+    async def delete_resource(
+        self,
+        token: Union[str, uuid.UUID],
+        resource_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> BugoutResource:
+        resources_path = f"resources/{resource_id}"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.delete,
+            path=resources_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutResource,
+        )
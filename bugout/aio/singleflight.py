@@ -0,0 +1,42 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class AsyncSingleFlight:
+    """
+    Asyncio version of SingleFlight.
+
+    Call runs as separate task, so cancellation of the caller which started it does not
+    cancel it for the others.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.shared = 0
+
+        self._calls: Dict[str, "asyncio.Future[Any]"] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            self.calls += 1
+
+            def done(finished: "asyncio.Future[Any]") -> None:
+                del self._calls[key]
+                # Mark exception as retrieved when all callers were cancelled
+                if not finished.cancelled():
+                    finished.exception()
+
+            task.add_done_callback(done)
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def metrics(self) -> Dict[str, int]:
+        return {
+            "in_flight": len(self._calls),
+            "calls": self.calls,
+            "shared": self.shared,
+        }
@@ -0,0 +1,239 @@
+import time
+from typing import Any, AsyncIterator, Awaitable, Dict, Optional, Tuple, Type
+
+import httpx
+from pydantic import BaseModel
+
+from ..compression import compress_json_body
+from ..data import Method
+from ..httpcache import (
+    CachedResponse,
+    ResponseCache,
+    cache_key,
+    conditional_kwargs,
+    validators,
+)
+from ..instrumentation import (
+    PHASE_DECODE,
+    PHASE_REQUEST,
+    Instrumentation,
+    RequestInfo,
+    build_model,
+    httpx_timing_kwargs,
+)
+from ..ratelimit import RateLimiter, find_rate_limiter
+from ..retry import RetryPolicy
+from ..settings import REQUESTS_POOL_MAXSIZE
+from ..singleflight import request_key
+from .calls import iter_response_items, make_request, parse_response, send_request
+from .singleflight import AsyncSingleFlight
+
+
+class AsyncTransport:
+    """
+    Non-blocking HTTP connection pool shared by asyncio Bugout sub-clients.
+
+    httpx keeps keep-alive connections per host inside a single AsyncClient. Requests
+    above pool size wait for a free connection instead of failing.
+
+    coalesce_gets, response_cache, instrumentation, compress_requests_above,
+    accept_encoding and stream work the same as in Transport.
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int = REQUESTS_POOL_MAXSIZE,
+        retry_policy: Optional[RetryPolicy] = None,
+        coalesce_gets: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        compress_requests_above: Optional[int] = None,
+        accept_encoding: Optional[str] = None,
+    ) -> None:
+        self.pool_maxsize = pool_maxsize
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.rate_limiters: Dict[str, RateLimiter] = {}
+        self.single_flight: Optional[AsyncSingleFlight] = (
+            AsyncSingleFlight() if coalesce_gets else None
+        )
+        self.response_cache = response_cache
+        self.instrumentation = instrumentation
+        self.compress_requests_above = compress_requests_above
+        self.accept_encoding = accept_encoding
+        limits = httpx.Limits(
+            max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize
+        )
+        headers = (
+            {"Accept-Encoding": accept_encoding}
+            if accept_encoding is not None
+            else None
+        )
+        self.client = httpx.AsyncClient(limits=limits, headers=headers)
+
+    def set_rate_limiter(self, base_url: str, rate_limiter: RateLimiter) -> None:
+        self.rate_limiters[base_url.rstrip("/")] = rate_limiter
+
+    async def request(
+        self,
+        method: Method,
+        url: str,
+        model: Optional[Type[BaseModel]] = None,
+        validate: bool = True,
+        **kwargs,
+    ) -> Any:
+        """
+        Returns response body, or model built from it when model is given. Model is
+        built before request finishes, so its phase is seen by after_request hooks.
+        """
+        if self.single_flight is not None:
+            key = request_key(method, url, kwargs)
+            if key is not None:
+                led = False
+
+                def lead() -> Awaitable[Tuple[Any, Any]]:
+                    nonlocal led
+                    led = True
+                    return self._request(method, url, model, validate, kwargs)
+
+                # Coalesced callers share response body, each of them builds own model
+                body, result = await self.single_flight.do(key, lead)
+                if led:
+                    return result
+                return build_model(
+                    self.instrumentation, None, method, url, model, body, validate
+                )
+        return (await self._request(method, url, model, validate, kwargs))[1]
+
+    async def _request(
+        self,
+        method: Method,
+        url: str,
+        model: Optional[Type[BaseModel]],
+        validate: bool,
+        kwargs: Dict[str, Any],
+    ) -> Tuple[Any, Any]:
+        """
+        Returns response body and model built from it.
+        """
+        rate_limiter = find_rate_limiter(self.rate_limiters, url)
+        if self.compress_requests_above is not None:
+            kwargs = compress_json_body(
+                kwargs, self.compress_requests_above, body_kwarg="content"
+            )
+        key = (
+            cache_key(method, url, kwargs) if self.response_cache is not None else None
+        )
+        if key is None and self.instrumentation is None:
+            body = await make_request(
+                method=method,
+                url=url,
+                client=self.client,
+                retry_policy=self.retry_policy,
+                rate_limiter=rate_limiter,
+                **kwargs,
+            )
+            return body, build_model(None, None, method, url, model, body, validate)
+        return await self._observed_request(
+            method, url, model, validate, key, rate_limiter, kwargs
+        )
+
+    async def _observed_request(
+        self,
+        method: Method,
+        url: str,
+        model: Optional[Type[BaseModel]],
+        validate: bool,
+        key: Optional[str],
+        rate_limiter: Optional[RateLimiter],
+        kwargs: Dict[str, Any],
+    ) -> Tuple[Any, Any]:
+        """
+        Request through response cache or with instrumentation.
+        """
+        response_cache = self.response_cache if key is not None else None
+        cached: Optional[CachedResponse] = None
+        if response_cache is not None and key is not None:
+            cached = response_cache.get(key)
+            if cached is not None:
+                kwargs = conditional_kwargs(kwargs, cached)
+        instrumentation = self.instrumentation
+        info: Optional[RequestInfo] = None
+        if instrumentation is not None:
+            info = instrumentation.start(method, url)
+            kwargs = httpx_timing_kwargs(info, kwargs)
+
+        started_at = time.perf_counter()
+        try:
+            r = await send_request(
+                method=method,
+                url=url,
+                client=self.client,
+                retry_policy=self.retry_policy,
+                rate_limiter=rate_limiter,
+                **kwargs,
+            )
+            if info is not None:
+                info.timings[PHASE_REQUEST] = time.perf_counter() - started_at
+                info.status_code = r.status_code
+            if r.status_code == 304 and cached is not None:
+                assert response_cache is not None
+                response_cache.record_hit()
+                body = cached.body
+            else:
+                decode_started_at = time.perf_counter()
+                body = parse_response(r)
+                if info is not None:
+                    info.timings[PHASE_DECODE] = time.perf_counter() - decode_started_at
+                etag, last_modified = validators(r.headers)
+                if (
+                    response_cache is not None
+                    and key is not None
+                    and (etag is not None or last_modified is not None)
+                ):
+                    response_cache.set(
+                        key, CachedResponse(etag, last_modified, body, len(r.content))
+                    )
+            result = build_model(
+                instrumentation, info, method, url, model, body, validate
+            )
+        except Exception as e:
+            if instrumentation is not None and info is not None:
+                info.error = e
+                instrumentation.finish(info)
+            raise
+        if instrumentation is not None and info is not None:
+            instrumentation.finish(info)
+        return body, result
+
+    async def stream(
+        self, method: Method, url: str, key: Optional[str], **kwargs
+    ) -> AsyncIterator[Any]:
+        """
+        Lazily yields items of list under key of response body. Streamed requests are
+        never coalesced, cached or instrumented.
+        """
+        rate_limiter = find_rate_limiter(self.rate_limiters, url)
+        if self.compress_requests_above is not None:
+            kwargs = compress_json_body(
+                kwargs, self.compress_requests_above, body_kwarg="content"
+            )
+        r = await send_request(
+            method=method,
+            url=url,
+            client=self.client,
+            retry_policy=self.retry_policy,
+            rate_limiter=rate_limiter,
+            stream=True,
+            **kwargs,
+        )
+        async for item in iter_response_items(r, key):
+            yield item
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncTransport":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
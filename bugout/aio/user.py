@@ -0,0 +1,374 @@
+from typing import Any, Dict, List, Optional, Type, Union
+import uuid
+
+from pydantic import BaseModel
+
+from ..data import Method, TokenType, BugoutUser, BugoutToken, BugoutUserTokens
+from ..exceptions import InvalidUrlSpec, TokenInvalidParameters
+from ..settings import REQUESTS_TIMEOUT
+from .transport import AsyncTransport
+
+
+class AsyncUser:
+    """
+    Represent a user from Bugout, asyncio version.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+        transport: Optional[AsyncTransport] = None,
+        fast_decode: bool = False,
+    ) -> None:
+        if url is None:
+            raise InvalidUrlSpec("Invalid brood url specified")
+        self.url = url
+        self.timeout = timeout
+        self.transport = transport if transport is not None else AsyncTransport()
+        self.fast_decode = fast_decode
+
+    async def _call(
+        self,
+        method: Method,
+        path: str,
+        timeout: Optional[float] = None,
+        model: Optional[Type[BaseModel]] = None,
+        **kwargs,
+    ):
+        url = f"{self.url.rstrip('/')}/{path.rstrip('/')}"
+        result = await self.transport.request(
+            method=method,
+            url=url,
+            model=model,
+            validate=not self.fast_decode,
+            timeout=timeout if timeout is not None else self.timeout,
+            **kwargs,
+        )
+        return result
+
+    # User module
+    async def create_user(
+        self,
+        username: str,
+        email: str,
+        password: str,
+        application_id: Optional[Union[str, uuid.UUID]] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Dict[str, Any],
+    ) -> BugoutUser:
+        create_user_path = "user"
+        data = {
+            "username": username,
+            "email": email,
+            "password": password,
+            "application_id": application_id,
+        }
+        headers = {}
+        if "headers" in kwargs.keys():
+            headers.update(kwargs["headers"])
+        return await self._call(
+            method=Method.post,
+            path=create_user_path,
+            headers=headers,
+            data=data,
+            timeout=timeout,
+            model=BugoutUser,
+        )
+
+    async def get_user(
+        self, token: Union[str, uuid.UUID], timeout: Optional[float] = None
+    ) -> BugoutUser:
+        get_user_path = "user"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.get,
+            path=get_user_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutUser,
+        )
+
+    async def get_user_by_id(
+        self,
+        token: Union[str, uuid.UUID],
+        user_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> BugoutUser:
+        get_user_by_id_path = f"user/{user_id}"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.get,
+            path=get_user_by_id_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutUser,
+        )
+
+    async def find_user(
+        self,
+        username: str,
+        token: Optional[Union[str, uuid.UUID]] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Dict[str, Any],
+    ) -> BugoutUser:
+        find_user_path = f"user/find?username={username}"
+        headers = {}
+        if token is not None:
+            headers.update({"Authorization": f"Bearer {token}"})
+        if "headers" in kwargs.keys():
+            headers.update(kwargs["headers"])
+        return await self._call(
+            method=Method.get,
+            path=find_user_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutUser,
+        )
+
+    async def confirm_email(
+        self,
+        token: Union[str, uuid.UUID],
+        verification_code: str,
+        timeout: Optional[float] = None,
+    ) -> BugoutUser:
+        confirm_user_email_path = "confirm"
+        data = {
+            "verification_code": verification_code,
+        }
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.post,
+            path=confirm_user_email_path,
+            headers=headers,
+            data=data,
+            timeout=timeout,
+            model=BugoutUser,
+        )
+
+    async def restore_password(
+        self, email: str, timeout: Optional[float] = None
+    ) -> Dict[str, str]:
+        restore_password_path = "password/restore"
+        data = {
+            "email": email,
+        }
+        result = await self._call(
+            method=Method.post, path=restore_password_path, data=data, timeout=timeout
+        )
+        return result
+
+    async def reset_password(
+        self,
+        reset_id: Union[str, uuid.UUID],
+        new_password: str,
+        timeout: Optional[float] = None,
+    ) -> BugoutUser:
+        reset_password_path = "password/reset"
+        data = {
+            "reset_id": reset_id,
+            "new_password": new_password,
+        }
+        return await self._call(
+            method=Method.post,
+            path=reset_password_path,
+            data=data,
+            timeout=timeout,
+            model=BugoutUser,
+        )
+
+    async def change_password(
+        self,
+        token: Union[str, uuid.UUID],
+        current_password: str,
+        new_password: str,
+        timeout: Optional[float] = None,
+    ) -> BugoutUser:
+        change_password_path = "password/change"
+        data = {
+            "new_password": new_password,
+            "current_password": current_password,
+        }
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.post,
+            path=change_password_path,
+            headers=headers,
+            data=data,
+            timeout=timeout,
+            model=BugoutUser,
+        )
+
+    async def delete_user(
+        self,
+        token: Union[str, uuid.UUID],
+        user_id: Union[str, uuid.UUID],
+        password: Optional[str] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Dict[str, Any],
+    ) -> BugoutUser:
+        delete_user_path = f"user/{user_id}"
+        data = {}
+        if password is not None:
+            data.update({"password": password})
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        if "headers" in kwargs.keys():
+            headers.update(kwargs["headers"])
+        return await self._call(
+            method=Method.delete,
+            path=delete_user_path,
+            headers=headers,
+            data=data,
+            timeout=timeout,
+            model=BugoutUser,
+        )
+
+    # Token module
+    async def create_token(
+        self,
+        username: str,
+        password: str,
+        application_id: Optional[Union[str, uuid.UUID]] = None,
+        token_note: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> BugoutToken:
+        create_token_path = "token"
+        data = {
+            "username": username,
+            "password": password,
+            "application_id": application_id,
+            "token_note": token_note,
+        }
+        return await self._call(
+            method=Method.post,
+            path=create_token_path,
+            data=data,
+            timeout=timeout,
+            model=BugoutToken,
+        )
+
+    async def create_token_restricted(
+        self, token: Union[str, uuid.UUID], timeout: Optional[float] = None
+    ) -> BugoutToken:
+        create_token_path = "token/restricted"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        return await self._call(
+            method=Method.post,
+            path=create_token_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutToken,
+        )
+
+    async def revoke_token(
+        self,
+        token: Union[str, uuid.UUID],
+        target_token: Optional[Union[str, uuid.UUID]] = None,
+        timeout: Optional[float] = None,
+    ) -> uuid.UUID:
+        revoke_token_path = "token"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        data = {}
+        if target_token is not None:
+            data.update({"target_token": target_token})
+        result = await self._call(
+            method=Method.delete,
+            path=revoke_token_path,
+            headers=headers,
+            data=data,
+            timeout=timeout,
+        )
+        return result
+
+    async def revoke_token_by_id(
+        self, token: Union[str, uuid.UUID], timeout: Optional[float] = None
+    ) -> uuid.UUID:
+        revoke_token_path = f"token/{token}"
+        result = await self._call(
+            method=Method.delete, path=revoke_token_path, timeout=timeout
+        )
+        return result
+
+    async def update_token(
+        self,
+        token: Union[str, uuid.UUID],
+        token_type: Optional[TokenType] = None,
+        token_note: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> BugoutToken:
+        update_token_path = "token"
+
+        if token_type is None and token_note is None:
+            raise TokenInvalidParameters(
+                "In order to update token, at least one of token_type, or token_note must be specified"
+            )
+        data: Dict[str, Any] = {"access_token": token}
+        if token_type is not None:
+            data.update({"token_type": token_type.value})
+        if token_note is not None:
+            data.update({"token_note": token_note})
+
+        return await self._call(
+            method=Method.put,
+            path=update_token_path,
+            data=data,
+            timeout=timeout,
+            model=BugoutToken,
+        )
+
+    async def get_token_types(
+        self, token: Union[str, uuid.UUID], timeout: Optional[float] = None
+    ) -> List[str]:
+        get_token_types_path = "token/types"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        result = await self._call(
+            method=Method.get,
+            path=get_token_types_path,
+            headers=headers,
+            timeout=timeout,
+        )
+        return result
+
+    async def get_user_tokens(
+        self,
+        token: Union[str, uuid.UUID],
+        active: Optional[bool] = None,
+        token_type: Optional[TokenType] = None,
+        restricted: Optional[bool] = None,
+        timeout: Optional[float] = None,
+    ) -> BugoutUserTokens:
+        get_user_tokens_path = "tokens"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        query_params = {}
+        if active is not None:
+            query_params.update({"active": str(int(active))})
+        if token_type is not None:
+            query_params.update({"token_type": token_type.value})
+        if restricted is not None:
+            query_params.update({"restricted": str(int(restricted))})
+        return await self._call(
+            method=Method.get,
+            path=get_user_tokens_path,
+            params=query_params,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutUserTokens,
+        )
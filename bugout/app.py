@@ -1,14 +1,27 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Iterable, Iterator, Dict, List, Optional, Union
 import uuid
 
 from . import data
+from .batch import BatchResult, run_batch
+from .cache import TTLCache, token_key
 from .calls import ping
 from .group import Group
+from .httpcache import ResponseCache
 from .humbug import Humbug
+from .instrumentation import Instrumentation
 from .journal import Journal, SearchOrder, TagsAction
+from .ratelimit import RateLimiter
 from .resource import Resource
+from .retry import RetryPolicy
 from .user import User
-from .settings import BUGOUT_BROOD_URL, BUGOUT_SPIRE_URL, REQUESTS_TIMEOUT
+from .settings import (
+    BUGOUT_BROOD_URL,
+    BUGOUT_SPIRE_URL,
+    REQUESTS_POOL_MAXSIZE,
+    REQUESTS_TIMEOUT,
+)
+from .transport import Transport
+from .views import JournalEntriesView, SearchResultsView, SearchResultView
 
 
 class Bugout:
@@ -16,15 +29,73 @@ class Bugout:
         self,
         brood_api_url: str = BUGOUT_BROOD_URL,
         spire_api_url: str = BUGOUT_SPIRE_URL,
+        pool_maxsize: int = REQUESTS_POOL_MAXSIZE,
+        retry_policy: Optional[RetryPolicy] = None,
+        brood_rate_limiter: Optional[RateLimiter] = None,
+        spire_rate_limiter: Optional[RateLimiter] = None,
+        auth_cache_ttl: Optional[float] = None,
+        auth_cache_maxsize: int = 1024,
+        fast_decode: bool = False,
+        coalesce_gets: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        compress_requests_above: Optional[int] = None,
+        accept_encoding: Optional[str] = None,
     ) -> None:
         self.brood_api_url = brood_api_url
         self.spire_api_url = spire_api_url
 
-        self.user = User(self.brood_api_url)
-        self.group = Group(self.brood_api_url)
-        self.humbug = Humbug(self.spire_api_url)
-        self.journal = Journal(self.spire_api_url)
-        self.resource = Resource(self.brood_api_url)
+        self.transport = Transport(
+            pool_maxsize=pool_maxsize,
+            retry_policy=retry_policy,
+            coalesce_gets=coalesce_gets,
+            response_cache=response_cache,
+            instrumentation=instrumentation,
+            compress_requests_above=compress_requests_above,
+            accept_encoding=accept_encoding,
+        )
+        if brood_rate_limiter is not None:
+            self.transport.set_rate_limiter(self.brood_api_url, brood_rate_limiter)
+        if spire_rate_limiter is not None:
+            self.transport.set_rate_limiter(self.spire_api_url, spire_rate_limiter)
+
+        self.user = User(
+            self.brood_api_url, transport=self.transport, fast_decode=fast_decode
+        )
+        self.group = Group(
+            self.brood_api_url, transport=self.transport, fast_decode=fast_decode
+        )
+        self.humbug = Humbug(
+            self.spire_api_url, transport=self.transport, fast_decode=fast_decode
+        )
+        self.journal = Journal(
+            self.spire_api_url, transport=self.transport, fast_decode=fast_decode
+        )
+        self.resource = Resource(
+            self.brood_api_url, transport=self.transport, fast_decode=fast_decode
+        )
+
+        # Opt-in cache of get_user and get_user_groups results by token
+        self.user_cache: Optional[TTLCache] = None
+        self.groups_cache: Optional[TTLCache] = None
+        if auth_cache_ttl is not None:
+            self.user_cache = TTLCache(maxsize=auth_cache_maxsize, ttl=auth_cache_ttl)
+            self.groups_cache = TTLCache(maxsize=auth_cache_maxsize, ttl=auth_cache_ttl)
+
+    def invalidate_token_cache(self, token: Union[str, uuid.UUID]) -> None:
+        if self.user_cache is not None:
+            self.user_cache.invalidate(token_key(token))
+        if self.groups_cache is not None:
+            self.groups_cache.invalidate(token_key(token))
+
+    def _clear_groups_cache(self) -> None:
+        if self.groups_cache is not None:
+            self.groups_cache.clear()
+
+    def clear_cache(self) -> None:
+        if self.user_cache is not None:
+            self.user_cache.clear()
+        self._clear_groups_cache()
 
     @property
     def brood_url(self):
@@ -34,11 +105,42 @@ class Bugout:
     def spire_url(self):
         return self.spire_api_url
 
+    def close(self) -> None:
+        self.transport.close()
+
+    def __enter__(self) -> "Bugout":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def batch(
+        self,
+        method: Union[str, Callable[..., Any]],
+        calls: Iterable[Dict[str, Any]],
+        concurrency: int = 8,
+        ordered: bool = True,
+    ) -> Iterator[BatchResult]:
+        """
+        Calls method (name of Bugout method or any callable) with each of keyword
+        arguments from calls over shared connection pool with up to concurrency calls
+        in flight. Lazily yields BatchResult in order of calls, or as calls complete if
+        ordered is False. Errors returned by API are collected in results.
+
+        Calls above pool_maxsize open connections which are not kept alive.
+        """
+        fn = getattr(self, method) if isinstance(method, str) else method
+        return run_batch(fn, calls, concurrency=concurrency, ordered=ordered)
+
     def brood_ping(self) -> Dict[str, str]:
-        return ping(self.brood_api_url)
+        return ping(
+            self.brood_api_url, session=self.transport.session(self.brood_api_url)
+        )
 
     def spire_ping(self) -> Dict[str, str]:
-        return ping(self.spire_api_url)
+        return ping(
+            self.spire_api_url, session=self.transport.session(self.spire_api_url)
+        )
 
     # User handlers
     def create_user(
@@ -50,20 +152,26 @@ class Bugout:
         timeout: float = REQUESTS_TIMEOUT,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutUser:
-        self.user.timeout = timeout
         return self.user.create_user(
             username=username,
             email=email,
             password=password,
             application_id=application_id,
+            timeout=timeout,
             **kwargs,
         )
 
     def get_user(
         self, token: Union[str, uuid.UUID], timeout: float = REQUESTS_TIMEOUT
     ) -> data.BugoutUser:
-        self.user.timeout = timeout
-        return self.user.get_user(token=token)
+        if self.user_cache is not None:
+            cached_user = self.user_cache.get(token_key(token))
+            if cached_user is not None:
+                return cached_user
+        user = self.user.get_user(token=token, timeout=timeout)
+        if self.user_cache is not None:
+            self.user_cache.set(token_key(token), user)
+        return user
 
     def get_user_by_id(
         self,
@@ -71,18 +179,18 @@ class Bugout:
         user_id: Union[str, uuid.UUID],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutUser:
-        self.user.timeout = timeout
-        return self.user.get_user_by_id(token=token, user_id=user_id)
+        return self.user.get_user_by_id(token=token, user_id=user_id, timeout=timeout)
 
     def find_user(
         self,
         username: str,
-        token: Union[str, uuid.UUID] = None,
+        token: Optional[Union[str, uuid.UUID]] = None,
         timeout: float = REQUESTS_TIMEOUT,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutUser:
-        self.user.timeout = timeout
-        return self.user.find_user(username=username, token=token, **kwargs)
+        return self.user.find_user(
+            username=username, token=token, timeout=timeout, **kwargs
+        )
 
     def confirm_email(
         self,
@@ -90,14 +198,14 @@ class Bugout:
         verification_code: str,
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutUser:
-        self.user.timeout = timeout
-        return self.user.confirm_email(token=token, verification_code=verification_code)
+        return self.user.confirm_email(
+            token=token, verification_code=verification_code, timeout=timeout
+        )
 
     def restore_password(
         self, email: str, timeout: float = REQUESTS_TIMEOUT
     ) -> Dict[str, str]:
-        self.user.timeout = timeout
-        return self.user.restore_password(email=email)
+        return self.user.restore_password(email=email, timeout=timeout)
 
     def reset_password(
         self,
@@ -105,8 +213,9 @@ class Bugout:
         new_password: str,
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutUser:
-        self.user.timeout = timeout
-        return self.user.reset_password(reset_id=reset_id, new_password=new_password)
+        return self.user.reset_password(
+            reset_id=reset_id, new_password=new_password, timeout=timeout
+        )
 
     def change_password(
         self,
@@ -115,9 +224,11 @@ class Bugout:
         new_password: str,
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutUser:
-        self.user.timeout = timeout
         return self.user.change_password(
-            token=token, current_password=current_password, new_password=new_password
+            token=token,
+            current_password=current_password,
+            new_password=new_password,
+            timeout=timeout,
         )
 
     def delete_user(
@@ -128,10 +239,12 @@ class Bugout:
         timeout: float = REQUESTS_TIMEOUT,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutUser:
-        self.user.timeout = timeout
-        return self.user.delete_user(
-            token=token, user_id=user_id, password=password, **kwargs
+        result = self.user.delete_user(
+            token=token, user_id=user_id, password=password, timeout=timeout, **kwargs
         )
+        # Tokens of deleted user are unknown, so all cached lookups are dropped
+        self.clear_cache()
+        return result
 
     # Token handlers
     def create_token(
@@ -142,12 +255,12 @@ class Bugout:
         token_note: Optional[str] = None,
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutToken:
-        self.user.timeout = timeout
         return self.user.create_token(
             username=username,
             password=password,
             application_id=application_id,
             token_note=token_note,
+            timeout=timeout,
         )
 
     def create_token_restricted(
@@ -155,8 +268,7 @@ class Bugout:
         token: Union[str, uuid.UUID],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutToken:
-        self.user.timeout = timeout
-        return self.user.create_token_restricted(token=token)
+        return self.user.create_token_restricted(token=token, timeout=timeout)
 
     def revoke_token(
         self,
@@ -164,14 +276,18 @@ class Bugout:
         target_token: Optional[Union[str, uuid.UUID]] = None,
         timeout: float = REQUESTS_TIMEOUT,
     ) -> uuid.UUID:
-        self.user.timeout = timeout
-        return self.user.revoke_token(token=token, target_token=target_token)
+        result = self.user.revoke_token(
+            token=token, target_token=target_token, timeout=timeout
+        )
+        self.invalidate_token_cache(target_token if target_token is not None else token)
+        return result
 
     def revoke_token_by_id(
         self, token: Union[str, uuid.UUID], timeout: float = REQUESTS_TIMEOUT
     ) -> uuid.UUID:
-        self.user.timeout = timeout
-        return self.user.revoke_token_by_id(token=token)
+        result = self.user.revoke_token_by_id(token=token, timeout=timeout)
+        self.invalidate_token_cache(token)
+        return result
 
     def update_token(
         self,
@@ -180,18 +296,17 @@ class Bugout:
         token_note: Optional[str] = None,
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutToken:
-        self.user.timeout = timeout
         return self.user.update_token(
             token=token,
             token_type=data.TokenType(token_type) if token_type is not None else None,
             token_note=token_note,
+            timeout=timeout,
         )
 
     def get_token_types(
         self, token: Union[str, uuid.UUID], timeout: float = REQUESTS_TIMEOUT
     ) -> List[str]:
-        self.user.timeout = timeout
-        return self.user.get_token_types(token=token)
+        return self.user.get_token_types(token=token, timeout=timeout)
 
     def get_user_tokens(
         self,
@@ -201,12 +316,12 @@ class Bugout:
         restricted: Optional[bool] = None,
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutUserTokens:
-        self.user.timeout = timeout
         return self.user.get_user_tokens(
             token=token,
             active=active,
             token_type=data.TokenType(token_type) if token_type is not None else None,
             restricted=restricted,
+            timeout=timeout,
         )
 
     # Group handlers
@@ -216,8 +331,7 @@ class Bugout:
         group_id: Union[str, uuid.UUID],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutGroup:
-        self.group.timeout = timeout
-        return self.group.get_group(token=token, group_id=group_id)
+        return self.group.get_group(token=token, group_id=group_id, timeout=timeout)
 
     def find_group(
         self,
@@ -225,14 +339,19 @@ class Bugout:
         group_id: Union[str, uuid.UUID],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutGroup:
-        self.user.timeout = timeout
-        return self.group.find_group(token=token, group_id=group_id)
+        return self.group.find_group(token=token, group_id=group_id, timeout=timeout)
 
     def get_user_groups(
         self, token: Union[str, uuid.UUID], timeout: float = REQUESTS_TIMEOUT
     ) -> data.BugoutUserGroups:
-        self.group.timeout = timeout
-        return self.group.get_user_groups(token=token)
+        if self.groups_cache is not None:
+            cached_groups = self.groups_cache.get(token_key(token))
+            if cached_groups is not None:
+                return cached_groups
+        groups = self.group.get_user_groups(token=token, timeout=timeout)
+        if self.groups_cache is not None:
+            self.groups_cache.set(token_key(token), groups)
+        return groups
 
     def create_group(
         self,
@@ -240,8 +359,11 @@ class Bugout:
         group_name: str,
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutGroup:
-        self.group.timeout = timeout
-        return self.group.create_group(token=token, group_name=group_name)
+        result = self.group.create_group(
+            token=token, group_name=group_name, timeout=timeout
+        )
+        self._clear_groups_cache()
+        return result
 
     def set_user_group(
         self,
@@ -252,14 +374,16 @@ class Bugout:
         email: Optional[str] = None,
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutGroupUser:
-        self.group.timeout = timeout
-        return self.group.set_user_group(
+        result = self.group.set_user_group(
             token=token,
             group_id=group_id,
             user_type=data.Role(user_type),
             username=username,
             email=email,
+            timeout=timeout,
         )
+        self._clear_groups_cache()
+        return result
 
     def delete_user_group(
         self,
@@ -269,10 +393,15 @@ class Bugout:
         email: Optional[str] = None,
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutGroupUser:
-        self.group.timeout = timeout
-        return self.group.delete_user_group(
-            token=token, group_id=group_id, username=username, email=email
+        result = self.group.delete_user_group(
+            token=token,
+            group_id=group_id,
+            username=username,
+            email=email,
+            timeout=timeout,
         )
+        self._clear_groups_cache()
+        return result
 
     def get_group_members(
         self,
@@ -280,8 +409,9 @@ class Bugout:
         group_id: Union[str, uuid.UUID],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutGroupMembers:
-        self.group.timeout = timeout
-        return self.group.get_group_members(token=token, group_id=group_id)
+        return self.group.get_group_members(
+            token=token, group_id=group_id, timeout=timeout
+        )
 
     def update_group(
         self,
@@ -290,10 +420,11 @@ class Bugout:
         group_name: str,
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutGroup:
-        self.group.timeout = timeout
-        return self.group.update_group(
-            token=token, group_id=group_id, group_name=group_name
+        result = self.group.update_group(
+            token=token, group_id=group_id, group_name=group_name, timeout=timeout
         )
+        self._clear_groups_cache()
+        return result
 
     def delete_group(
         self,
@@ -301,8 +432,11 @@ class Bugout:
         group_id: Union[str, uuid.UUID],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutGroup:
-        self.group.timeout = timeout
-        return self.group.delete_group(token=token, group_id=group_id)
+        result = self.group.delete_group(
+            token=token, group_id=group_id, timeout=timeout
+        )
+        self._clear_groups_cache()
+        return result
 
     # Application handlers
     def create_application(
@@ -313,9 +447,12 @@ class Bugout:
         group_id: Union[str, uuid.UUID],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutApplication:
-        self.group.timeout = timeout
         return self.group.create_application(
-            token=token, name=name, description=description, group_id=group_id
+            token=token,
+            name=name,
+            description=description,
+            group_id=group_id,
+            timeout=timeout,
         )
 
     def get_application(
@@ -324,8 +461,9 @@ class Bugout:
         application_id: Union[str, uuid.UUID],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutApplication:
-        self.group.timeout = timeout
-        return self.group.get_application(token=token, application_id=application_id)
+        return self.group.get_application(
+            token=token, application_id=application_id, timeout=timeout
+        )
 
     def list_applications(
         self,
@@ -333,8 +471,9 @@ class Bugout:
         group_id: Optional[Union[str, uuid.UUID]] = None,
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutApplications:
-        self.group.timeout = timeout
-        return self.group.list_applications(token=token, group_id=group_id)
+        return self.group.list_applications(
+            token=token, group_id=group_id, timeout=timeout
+        )
 
     def delete_application(
         self,
@@ -342,8 +481,9 @@ class Bugout:
         application_id: Union[str, uuid.UUID],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutApplication:
-        self.group.timeout = timeout
-        return self.group.delete_application(token=token, application_id=application_id)
+        return self.group.delete_application(
+            token=token, application_id=application_id, timeout=timeout
+        )
 
     # Resource handlers
     def create_resource(
@@ -353,9 +493,11 @@ class Bugout:
         resource_data: Dict[str, Any],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutResource:
-        self.resource.timeout = timeout
         return self.resource.create_resource(
-            token=token, application_id=application_id, resource_data=resource_data
+            token=token,
+            application_id=application_id,
+            resource_data=resource_data,
+            timeout=timeout,
         )
 
     def get_resource(
@@ -364,8 +506,9 @@ class Bugout:
         resource_id: Union[str, uuid.UUID],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutResource:
-        self.resource.timeout = timeout
-        return self.resource.get_resource(token=token, resource_id=resource_id)
+        return self.resource.get_resource(
+            token=token, resource_id=resource_id, timeout=timeout
+        )
 
     def list_resources(
         self,
@@ -373,8 +516,17 @@ class Bugout:
         params: Optional[Dict[str, Any]] = None,
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutResources:
-        self.resource.timeout = timeout
-        return self.resource.list_resources(token=token, params=params)
+        return self.resource.list_resources(token=token, params=params, timeout=timeout)
+
+    def stream_resources(
+        self,
+        token: Union[str, uuid.UUID],
+        params: Optional[Dict[str, Any]] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> Iterator[data.BugoutResource]:
+        return self.resource.stream_resources(
+            token=token, params=params, timeout=timeout
+        )
 
     def update_resource(
         self,
@@ -383,9 +535,11 @@ class Bugout:
         resource_data: Dict[str, Any],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutResource:
-        self.resource.timeout = timeout
         return self.resource.update_resource(
-            token=token, resource_id=resource_id, resource_data_update=resource_data
+            token=token,
+            resource_id=resource_id,
+            resource_data_update=resource_data,
+            timeout=timeout,
         )
 
     def delete_resource(
@@ -394,15 +548,15 @@ class Bugout:
         resource_id: Union[str, uuid.UUID],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutResource:
-        self.resource.timeout = timeout
-        return self.resource.delete_resource(token=token, resource_id=resource_id)
+        return self.resource.delete_resource(
+            token=token, resource_id=resource_id, timeout=timeout
+        )
 
     # Journal scopes handlers
     def list_scopes(
         self, token: Union[str, uuid.UUID], api: str, timeout: float = REQUESTS_TIMEOUT
     ) -> data.BugoutScopes:
-        self.journal.timeout = timeout
-        return self.journal.list_scopes(token=token, api=api)
+        return self.journal.list_scopes(token=token, api=api, timeout=timeout)
 
     def get_journal_permissions(
         self,
@@ -411,9 +565,8 @@ class Bugout:
         holder_ids: Optional[List[Union[str, uuid.UUID]]] = None,
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutJournalPermissions:
-        self.journal.timeout = timeout
         return self.journal.get_journal_permissions(
-            token=token, journal_id=journal_id, holder_ids=holder_ids
+            token=token, journal_id=journal_id, holder_ids=holder_ids, timeout=timeout
         )
 
     def get_journal_scopes(
@@ -422,8 +575,9 @@ class Bugout:
         journal_id: Union[str, uuid.UUID],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutJournalScopeSpecs:
-        self.journal.timeout = timeout
-        return self.journal.get_journal_scopes(token=token, journal_id=journal_id)
+        return self.journal.get_journal_scopes(
+            token=token, journal_id=journal_id, timeout=timeout
+        )
 
     def update_journal_scopes(
         self,
@@ -434,13 +588,13 @@ class Bugout:
         permission_list: List[str],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutJournalScopeSpecs:
-        self.journal.timeout = timeout
         return self.journal.update_journal_scopes(
             token=token,
             journal_id=journal_id,
             holder_type=data.HolderType(holder_type),
             holder_id=holder_id,
             permission_list=permission_list,
+            timeout=timeout,
         )
 
     def delete_journal_scopes(
@@ -452,13 +606,13 @@ class Bugout:
         permission_list: List[str],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutJournalScopeSpecs:
-        self.journal.timeout = timeout
         return self.journal.delete_journal_scopes(
             token=token,
             journal_id=journal_id,
             holder_type=data.HolderType(holder_type),
             holder_id=holder_id,
             permission_list=permission_list,
+            timeout=timeout,
         )
 
     # Journal handlers
@@ -469,18 +623,24 @@ class Bugout:
         journal_type: Optional[Union[str, data.JournalTypes]] = None,
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutJournal:
-        self.journal.timeout = timeout
         if journal_type is None:
             journal_type = data.JournalTypes.DEFAULT
         return self.journal.create_journal(
-            token=token, name=name, journal_type=data.JournalTypes(journal_type)
+            token=token,
+            name=name,
+            journal_type=data.JournalTypes(journal_type),
+            timeout=timeout,
         )
 
     def list_journals(
         self, token: Union[str, uuid.UUID], timeout: float = REQUESTS_TIMEOUT
     ) -> data.BugoutJournals:
-        self.journal.timeout = timeout
-        return self.journal.list_journals(token=token)
+        return self.journal.list_journals(token=token, timeout=timeout)
+
+    def stream_journals(
+        self, token: Union[str, uuid.UUID], timeout: float = REQUESTS_TIMEOUT
+    ) -> Iterator[data.BugoutJournal]:
+        return self.journal.stream_journals(token=token, timeout=timeout)
 
     def get_journal(
         self,
@@ -488,8 +648,9 @@ class Bugout:
         journal_id: Union[str, uuid.UUID],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutJournal:
-        self.journal.timeout = timeout
-        return self.journal.get_journal(token=token, journal_id=journal_id)
+        return self.journal.get_journal(
+            token=token, journal_id=journal_id, timeout=timeout
+        )
 
     def update_journal(
         self,
@@ -498,9 +659,8 @@ class Bugout:
         name: str,
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutJournal:
-        self.journal.timeout = timeout
         return self.journal.update_journal(
-            token=token, journal_id=journal_id, name=name
+            token=token, journal_id=journal_id, name=name, timeout=timeout
         )
 
     def delete_journal(
@@ -509,8 +669,9 @@ class Bugout:
         journal_id: Union[str, uuid.UUID],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutJournal:
-        self.journal.timeout = timeout
-        return self.journal.delete_journal(token=token, journal_id=journal_id)
+        return self.journal.delete_journal(
+            token=token, journal_id=journal_id, timeout=timeout
+        )
 
     # Journal entries
     def create_entry(
@@ -525,7 +686,6 @@ class Bugout:
         context_type: Optional[str] = None,
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutJournalEntry:
-        self.journal.timeout = timeout
         return self.journal.create_entry(
             token=token,
             journal_id=journal_id,
@@ -535,6 +695,7 @@ class Bugout:
             context_url=context_url,
             context_id=context_id,
             context_type=context_type,
+            timeout=timeout,
         )
 
     def create_entries_pack(
@@ -544,7 +705,6 @@ class Bugout:
         entries: List[Dict[str, Any]],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutJournalEntries:
-        self.journal.timeout = timeout
         entries_obj = data.BugoutJournalEntriesRequest(
             entries=[data.BugoutJournalEntryRequest(**entry) for entry in entries]
         )
@@ -552,6 +712,7 @@ class Bugout:
             token=token,
             journal_id=journal_id,
             entries=entries_obj,
+            timeout=timeout,
         )
 
     def get_entry(
@@ -561,9 +722,8 @@ class Bugout:
         entry_id: Union[str, uuid.UUID],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutJournalEntry:
-        self.journal.timeout = timeout
         return self.journal.get_entry(
-            token=token, journal_id=journal_id, entry_id=entry_id
+            token=token, journal_id=journal_id, entry_id=entry_id, timeout=timeout
         )
 
     def get_entries(
@@ -572,8 +732,29 @@ class Bugout:
         journal_id: Union[str, uuid.UUID],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutJournalEntries:
-        self.journal.timeout = timeout
-        return self.journal.get_entries(token=token, journal_id=journal_id)
+        return self.journal.get_entries(
+            token=token, journal_id=journal_id, timeout=timeout
+        )
+
+    def stream_entries(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> Iterator[data.BugoutJournalEntry]:
+        return self.journal.stream_entries(
+            token=token, journal_id=journal_id, timeout=timeout
+        )
+
+    def get_entries_view(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> JournalEntriesView:
+        return self.journal.get_entries_view(
+            token=token, journal_id=journal_id, timeout=timeout
+        )
 
     def get_entry_content(
         self,
@@ -582,9 +763,8 @@ class Bugout:
         entry_id: Union[str, uuid.UUID],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutJournalEntryContent:
-        self.journal.timeout = timeout
         return self.journal.get_entry_content(
-            token=token, journal_id=journal_id, entry_id=entry_id
+            token=token, journal_id=journal_id, entry_id=entry_id, timeout=timeout
         )
 
     def update_entry_content(
@@ -598,7 +778,6 @@ class Bugout:
         tags: Optional[List[str]] = None,
         tags_action: TagsAction = TagsAction.merge,
     ) -> data.BugoutJournalEntryContent:
-        self.journal.timeout = timeout
         return self.journal.update_entry_content(
             token=token,
             journal_id=journal_id,
@@ -607,6 +786,7 @@ class Bugout:
             content=content,
             tags=tags,
             tags_action=tags_action,
+            timeout=timeout,
         )
 
     def delete_entry(
@@ -616,9 +796,8 @@ class Bugout:
         entry_id: Union[str, uuid.UUID],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutJournalEntry:
-        self.journal.timeout = timeout
         return self.journal.delete_entry(
-            token=token, journal_id=journal_id, entry_id=entry_id
+            token=token, journal_id=journal_id, entry_id=entry_id, timeout=timeout
         )
 
     # Tags
@@ -628,8 +807,9 @@ class Bugout:
         journal_id: Union[str, uuid.UUID],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> List[Any]:
-        self.journal.timeout = timeout
-        return self.journal.get_most_used_tags(token=token, journal_id=journal_id)
+        return self.journal.get_most_used_tags(
+            token=token, journal_id=journal_id, timeout=timeout
+        )
 
     def create_tags(
         self,
@@ -639,9 +819,12 @@ class Bugout:
         tags: List[str],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> List[Any]:
-        self.journal.timeout = timeout
         return self.journal.create_tags(
-            token=token, journal_id=journal_id, entry_id=entry_id, tags=tags
+            token=token,
+            journal_id=journal_id,
+            entry_id=entry_id,
+            tags=tags,
+            timeout=timeout,
         )
 
     def get_tags(
@@ -651,9 +834,8 @@ class Bugout:
         entry_id: Union[str, uuid.UUID],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutJournalEntryTags:
-        self.journal.timeout = timeout
         return self.journal.get_tags(
-            token=token, journal_id=journal_id, entry_id=entry_id
+            token=token, journal_id=journal_id, entry_id=entry_id, timeout=timeout
         )
 
     def update_tags(
@@ -664,9 +846,12 @@ class Bugout:
         tags: List[str],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> List[Any]:
-        self.journal.timeout = timeout
         return self.journal.update_tags(
-            token=token, journal_id=journal_id, entry_id=entry_id, tags=tags
+            token=token,
+            journal_id=journal_id,
+            entry_id=entry_id,
+            tags=tags,
+            timeout=timeout,
         )
 
     def delete_tag(
@@ -677,9 +862,12 @@ class Bugout:
         tag: str,
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutJournalEntryTags:
-        self.journal.timeout = timeout
         return self.journal.delete_tag(
-            token=token, journal_id=journal_id, entry_id=entry_id, tag=tag
+            token=token,
+            journal_id=journal_id,
+            entry_id=entry_id,
+            tag=tag,
+            timeout=timeout,
         )
 
     # Search
@@ -695,9 +883,92 @@ class Bugout:
         timeout: float = REQUESTS_TIMEOUT,
         order: SearchOrder = SearchOrder.DESCENDING,
     ) -> data.BugoutSearchResults:
-        self.journal.timeout = timeout
         return self.journal.search(
-            token, journal_id, query, filters, limit, offset, content, order=order
+            token,
+            journal_id,
+            query,
+            filters,
+            limit,
+            offset,
+            content,
+            order=order,
+            timeout=timeout,
+        )
+
+    def search_view(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        query: str,
+        filters: Optional[List[str]] = None,
+        limit: int = 10,
+        offset: int = 0,
+        content: bool = True,
+        timeout: float = REQUESTS_TIMEOUT,
+        order: SearchOrder = SearchOrder.DESCENDING,
+    ) -> SearchResultsView:
+        return self.journal.search_view(
+            token,
+            journal_id,
+            query,
+            filters,
+            limit,
+            offset,
+            content,
+            order=order,
+            timeout=timeout,
+        )
+
+    def iter_search(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        query: str,
+        filters: Optional[List[str]] = None,
+        page_size: int = 100,
+        offset: int = 0,
+        content: bool = True,
+        timeout: float = REQUESTS_TIMEOUT,
+        order: SearchOrder = SearchOrder.DESCENDING,
+        prefetch: bool = False,
+    ) -> Iterator[data.BugoutSearchResult]:
+        return self.journal.iter_search(
+            token=token,
+            journal_id=journal_id,
+            query=query,
+            filters=filters,
+            page_size=page_size,
+            offset=offset,
+            content=content,
+            order=order,
+            prefetch=prefetch,
+            timeout=timeout,
+        )
+
+    def iter_search_view(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        query: str,
+        filters: Optional[List[str]] = None,
+        page_size: int = 100,
+        offset: int = 0,
+        content: bool = True,
+        timeout: float = REQUESTS_TIMEOUT,
+        order: SearchOrder = SearchOrder.DESCENDING,
+        prefetch: bool = False,
+    ) -> Iterator[SearchResultView]:
+        return self.journal.iter_search_view(
+            token=token,
+            journal_id=journal_id,
+            query=query,
+            filters=filters,
+            page_size=page_size,
+            offset=offset,
+            content=content,
+            order=order,
+            prefetch=prefetch,
+            timeout=timeout,
         )
 
     # Public
@@ -706,8 +977,7 @@ class Bugout:
         journal_id: Union[str, uuid.UUID],
         timeout: float = REQUESTS_TIMEOUT,
     ) -> bool:
-        self.journal.timeout = timeout
-        return self.journal.check_journal_public(journal_id=journal_id)
+        return self.journal.check_journal_public(journal_id=journal_id, timeout=timeout)
 
     # Humbug
     def get_humbug_integrations(
@@ -716,5 +986,6 @@ class Bugout:
         group_id: Optional[Union[str, uuid.UUID]] = None,
         timeout: float = REQUESTS_TIMEOUT,
     ) -> data.BugoutHumbugIntegrationsList:
-        self.humbug.timeout = timeout
-        return self.humbug.get_humbug_integrations(token=token, group_id=group_id)
+        return self.humbug.get_humbug_integrations(
+            token=token, group_id=group_id, timeout=timeout
+        )
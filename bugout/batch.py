@@ -0,0 +1,128 @@
+"""
+Concurrent execution of one client method for many sets of arguments.
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from pydantic import BaseModel, Field
+
+from .exceptions import BugoutResponseException, BugoutUnexpectedResponse
+
+# Failures of single call which are collected into results instead of stopping batch
+BATCH_ERRORS = (BugoutResponseException, BugoutUnexpectedResponse)
+
+
+class BatchResult(NamedTuple):
+    position: int
+    kwargs: Dict[str, Any]
+    result: Any = None
+    error: Optional[Exception] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+class BulkReport(BaseModel):
+    """
+    Counters of bulk operation, failures are counted by response status.
+    """
+
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    failures_by_reason: Dict[str, int] = Field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+    def record(self, succeeded: bool, status_code: Optional[int] = None) -> None:
+        self.total += 1
+        if succeeded:
+            self.succeeded += 1
+            return
+        self.failed += 1
+        reason = str(status_code) if status_code is not None else "error"
+        self.failures_by_reason[reason] = self.failures_by_reason.get(reason, 0) + 1
+
+
+def call_batch_item(
+    fn: Callable[..., Any], position: int, kwargs: Dict[str, Any]
+) -> BatchResult:
+    try:
+        return BatchResult(position=position, kwargs=kwargs, result=fn(**kwargs))
+    except BATCH_ERRORS as e:
+        return BatchResult(position=position, kwargs=kwargs, error=e)
+
+
+def run_batch(
+    fn: Callable[..., Any],
+    calls: Iterable[Dict[str, Any]],
+    concurrency: int = 8,
+    ordered: bool = True,
+    window: Optional[int] = None,
+) -> Generator[BatchResult, None, None]:
+    """
+    Calls fn with each of keyword arguments from calls with up to concurrency calls in
+    flight and lazily yields their results, in order of calls or as they complete.
+
+    API errors of single call are returned in its result, other exceptions stop the
+    batch. calls are consumed as results are yielded, at most window (2 * concurrency
+    by default) results are pending at a time. Close generator to stop batch early.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency should be at least 1")
+    if window is None:
+        window = 2 * concurrency
+    elif window < concurrency:
+        raise ValueError("window should be at least concurrency")
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        if ordered:
+            in_flight: Deque["Future[BatchResult]"] = deque()
+            try:
+                for index, kwargs in enumerate(calls):
+                    if len(in_flight) >= window:
+                        yield in_flight.popleft().result()
+                    in_flight.append(
+                        executor.submit(call_batch_item, fn, index, kwargs)
+                    )
+                while in_flight:
+                    yield in_flight.popleft().result()
+            finally:
+                for pending in in_flight:
+                    pending.cancel()
+            return
+
+        running: Set["Future[BatchResult]"] = set()
+        try:
+            for index, kwargs in enumerate(calls):
+                if len(running) >= window:
+                    done, running = _wait_first(running)
+                    for finished in done:
+                        yield finished.result()
+                running.add(executor.submit(call_batch_item, fn, index, kwargs))
+            while running:
+                done, running = _wait_first(running)
+                for finished in done:
+                    yield finished.result()
+        finally:
+            for pending in running:
+                pending.cancel()
+
+
+def _wait_first(
+    futures: Set["Future[BatchResult]"],
+) -> Tuple[Set["Future[BatchResult]"], Set["Future[BatchResult]"]]:
+    done, not_done = wait(futures, return_when=FIRST_COMPLETED)
+    return set(done), set(not_done)
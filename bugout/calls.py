@@ -1,15 +1,58 @@
-from typing import Any, Dict
+import time
+from typing import Any, Dict, Iterator, Optional
 
 import requests
 
 from .data import Method
 from .exceptions import BugoutResponseException, BugoutUnexpectedResponse
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .streaming import STREAM_CHUNK_SIZE, JSONArrayDecoder
 
 
-def make_request(method: Method, url: str, **kwargs) -> Any:
+def send_request(
+    method: Method,
+    url: str,
+    session: Optional[requests.Session] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    **kwargs,
+) -> requests.Response:
+    """
+    Sends request with retries and returns raw response. Token of rate_limiter is
+    acquired before every attempt, so retries are throttled as well.
+    """
+    attempt = 0
+    while True:
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        try:
+            if session is not None:
+                r = session.request(method.value, url=url, **kwargs)
+            else:
+                r = requests.request(method.value, url=url, **kwargs)
+        except requests.exceptions.RequestException as e:
+            if retry_policy is not None and retry_policy.should_retry(method, attempt):
+                time.sleep(retry_policy.delay(attempt))
+                attempt += 1
+                continue
+            raise BugoutUnexpectedResponse(f"{str(e)}")
+        if retry_policy is not None and retry_policy.should_retry(
+            method, attempt, status_code=r.status_code
+        ):
+            time.sleep(retry_policy.delay(attempt, r.headers.get("Retry-After")))
+            r.close()
+            attempt += 1
+            continue
+        return r
+
+
+def parse_response(r: requests.Response) -> Any:
+    """
+    Decodes response body, raises on error status.
+    """
     response_body = None
     try:
-        r = requests.request(method.value, url=url, **kwargs)
         r.raise_for_status()
         response_body = r.json()
     except requests.exceptions.RequestException as e:
@@ -17,15 +60,55 @@ def make_request(method: Method, url: str, **kwargs) -> Any:
         raise BugoutResponseException(
             "An exception occurred at Bugout API side",
             status_code=r.status_code,
-            detail=exception_detail["detail"]
-            if exception_detail["detail"] is not None
-            else None,
+            detail=(
+                exception_detail["detail"]
+                if exception_detail["detail"] is not None
+                else None
+            ),
         )
     except Exception as e:
         raise BugoutUnexpectedResponse(f"{str(e)}")
     return response_body
 
 
-def ping(url: str) -> Dict[str, Any]:
+def iter_response_items(r: requests.Response, key: Optional[str]) -> Iterator[Any]:
+    """
+    Decodes items of list under key of response sent with stream=True as they arrive,
+    raises on error status. Response is closed when iteration ends.
+    """
+    try:
+        if r.status_code >= 400:
+            parse_response(r)
+        decoder = JSONArrayDecoder(key)
+        for chunk in r.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+            yield from decoder.feed(chunk)
+        yield from decoder.close()
+    except requests.exceptions.RequestException as e:
+        raise BugoutUnexpectedResponse(f"{str(e)}")
+    finally:
+        r.close()
+
+
+def make_request(
+    method: Method,
+    url: str,
+    session: Optional[requests.Session] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    **kwargs,
+) -> Any:
+    return parse_response(
+        send_request(
+            method,
+            url,
+            session=session,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            **kwargs,
+        )
+    )
+
+
+def ping(url: str, session: Optional[requests.Session] = None) -> Dict[str, Any]:
     url = f"{url.rstrip('/')}/ping"
-    return make_request(Method.get, url)
+    return make_request(Method.get, url, session=session)
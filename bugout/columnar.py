@@ -0,0 +1,262 @@
+"""
+Column-oriented decoding of journal entries and search results.
+
+Rows are read from decoded JSON directly into column arrays, without per-row models.
+Arrow and Parquet conversion requires optional dependency: pip install bugout[arrow]
+"""
+
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Union
+import uuid
+
+try:
+    from pydantic.v1.datetime_parse import parse_datetime
+except ImportError:
+    # pydantic before 1.10.17 has no v1 namespace
+    from pydantic.datetime_parse import parse_datetime  # type: ignore
+
+from .data import BugoutJournalEntries, BugoutSearchResults
+from .journal import Journal, SearchOrder
+from .views import JournalEntriesView, SearchResultsView
+
+# Value of int64 timestamp column for missing timestamp, null in Arrow tables
+TIMESTAMP_NULL = -(2**63)
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+
+SearchResultsPage = Union[SearchResultsView, BugoutSearchResults, Dict[str, Any]]
+JournalEntriesPage = Union[JournalEntriesView, BugoutJournalEntries, Dict[str, Any]]
+
+
+def timestamp_us(value: Optional[Union[str, datetime]]) -> int:
+    """
+    Converts ISO 8601 timestamp to microseconds since epoch, naive timestamps are UTC.
+    """
+    if value is None:
+        return TIMESTAMP_NULL
+    if isinstance(value, datetime):
+        timestamp = value
+    else:
+        try:
+            timestamp = datetime.fromisoformat(value)
+        except ValueError:
+            timestamp = parse_datetime(value)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return (timestamp - EPOCH) // MICROSECOND
+
+
+def _require_pyarrow() -> Any:
+    try:
+        import pyarrow  # type: ignore
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for Arrow and Parquet export: pip install bugout[arrow]"
+        ) from e
+    return pyarrow
+
+
+def _int64_array(pa: Any, values: "array[int]") -> Any:
+    return pa.Array.from_buffers(pa.int64(), len(values), [None, pa.py_buffer(values)])
+
+
+def _timestamp_array(pa: Any, values: "array[int]") -> Any:
+    timestamps = _int64_array(pa, values)
+    if TIMESTAMP_NULL in values:
+        import pyarrow.compute as pc  # type: ignore
+
+        timestamps = pc.if_else(pc.equal(timestamps, TIMESTAMP_NULL), None, timestamps)
+    return timestamps.cast(pa.timestamp("us", tz="UTC"))
+
+
+def _tags_array(pa: Any, offsets: "array[int]", values: List[str]) -> Any:
+    return pa.LargeListArray.from_arrays(
+        _int64_array(pa, offsets), pa.array(values, type=pa.string())
+    )
+
+
+class _Columns:
+    """
+    Common part of column sets: timestamps and tags.
+
+    Tags of row i are tag_values[tag_offsets[i] : tag_offsets[i + 1]].
+    """
+
+    def __init__(self) -> None:
+        self.created_at = array("q")
+        self.updated_at = array("q")
+        self.tag_offsets = array("q", [0])
+        self.tag_values: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.tag_offsets) - 1
+
+    def _append_common(self, row: Dict[str, Any]) -> None:
+        self.created_at.append(timestamp_us(row.get("created_at")))
+        self.updated_at.append(timestamp_us(row.get("updated_at")))
+        tags = row.get("tags") or []
+        self.tag_values.extend(tags)
+        self.tag_offsets.append(self.tag_offsets[-1] + len(tags))
+
+    def tags(self, index: int) -> List[str]:
+        return self.tag_values[self.tag_offsets[index] : self.tag_offsets[index + 1]]
+
+    def to_arrow(self) -> Any:
+        raise NotImplementedError
+
+    def to_parquet(self, path: str, **kwargs: Any) -> None:
+        """
+        Writes columns to Parquet file, kwargs are passed to pyarrow.parquet.write_table.
+        """
+        _require_pyarrow()
+        import pyarrow.parquet as pq  # type: ignore
+
+        pq.write_table(self.to_arrow(), path, **kwargs)
+
+
+class SearchResultColumns(_Columns):
+    """
+    Search results as column arrays. entry_id is parsed from entry_url.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.entry_id: List[str] = []
+        self.entry_url: List[str] = []
+        self.title: List[str] = []
+        self.content: List[Optional[str]] = []
+        self.score = array("d")
+
+    @classmethod
+    def from_pages(cls, pages: Iterable[SearchResultsPage]) -> "SearchResultColumns":
+        columns = cls()
+        for page in pages:
+            columns.extend(page)
+        return columns
+
+    def append(self, result: Dict[str, Any]) -> None:
+        entry_url = result["entry_url"]
+        self.entry_id.append(entry_url.rstrip("/").rsplit("/", 1)[-1])
+        self.entry_url.append(entry_url)
+        self.title.append(result["title"])
+        self.content.append(result.get("content"))
+        self.score.append(result["score"])
+        self._append_common(result)
+
+    def extend(self, page: SearchResultsPage) -> None:
+        if isinstance(page, SearchResultsView):
+            results = page.raw_results()
+        elif isinstance(page, BugoutSearchResults):
+            results = [result.dict() for result in page.results]
+        else:
+            results = page["results"]
+        for result in results:
+            self.append(result)
+
+    def to_arrow(self) -> Any:
+        pa = _require_pyarrow()
+        return pa.table(
+            {
+                "entry_id": pa.array(self.entry_id, type=pa.string()),
+                "entry_url": pa.array(self.entry_url, type=pa.string()),
+                "title": pa.array(self.title, type=pa.string()),
+                "content": pa.array(self.content, type=pa.string()),
+                "tags": _tags_array(pa, self.tag_offsets, self.tag_values),
+                "created_at": _timestamp_array(pa, self.created_at),
+                "updated_at": _timestamp_array(pa, self.updated_at),
+                "score": pa.Array.from_buffers(
+                    pa.float64(), len(self.score), [None, pa.py_buffer(self.score)]
+                ),
+            }
+        )
+
+
+class JournalEntryColumns(_Columns):
+    """
+    Journal entries as column arrays.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.id: List[str] = []
+        self.title: List[Optional[str]] = []
+        self.content: List[Optional[str]] = []
+        self.context_url: List[Optional[str]] = []
+        self.context_type: List[Optional[str]] = []
+
+    @classmethod
+    def from_pages(cls, pages: Iterable[JournalEntriesPage]) -> "JournalEntryColumns":
+        columns = cls()
+        for page in pages:
+            columns.extend(page)
+        return columns
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        self.id.append(str(entry["id"]))
+        self.title.append(entry.get("title"))
+        self.content.append(entry.get("content"))
+        self.context_url.append(entry.get("context_url"))
+        self.context_type.append(entry.get("context_type"))
+        self._append_common(entry)
+
+    def extend(self, page: JournalEntriesPage) -> None:
+        if isinstance(page, JournalEntriesView):
+            entries = page.raw_entries()
+        elif isinstance(page, BugoutJournalEntries):
+            entries = [entry.dict() for entry in page.entries]
+        else:
+            entries = page["entries"]
+        for entry in entries:
+            self.append(entry)
+
+    def to_arrow(self) -> Any:
+        pa = _require_pyarrow()
+        return pa.table(
+            {
+                "id": pa.array(self.id, type=pa.string()),
+                "title": pa.array(self.title, type=pa.string()),
+                "content": pa.array(self.content, type=pa.string()),
+                "context_url": pa.array(self.context_url, type=pa.string()),
+                "context_type": pa.array(self.context_type, type=pa.string()),
+                "tags": _tags_array(pa, self.tag_offsets, self.tag_values),
+                "created_at": _timestamp_array(pa, self.created_at),
+                "updated_at": _timestamp_array(pa, self.updated_at),
+            }
+        )
+
+
+def search_columns(
+    journal: Journal,
+    token: Union[str, uuid.UUID],
+    journal_id: Union[str, uuid.UUID],
+    query: str = "",
+    filters: Optional[List[str]] = None,
+    content: bool = True,
+    page_size: int = 100,
+    order: SearchOrder = SearchOrder.DESCENDING,
+    timeout: Optional[float] = None,
+) -> SearchResultColumns:
+    """
+    Fetches all pages of search results and decodes them into columns.
+    """
+    columns = SearchResultColumns()
+    offset: Optional[int] = 0
+    while offset is not None:
+        page = journal.search_view(
+            token=token,
+            journal_id=journal_id,
+            query=query,
+            filters=filters,
+            limit=page_size,
+            offset=offset,
+            content=content,
+            order=order,
+            timeout=timeout,
+        )
+        if not page.raw_results():
+            break
+        columns.extend(page)
+        offset = page.next_offset
+    return columns
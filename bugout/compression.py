@@ -0,0 +1,38 @@
+"""
+Compression of request bodies.
+
+Responses are decoded by requests and httpx themselves, both advertise gzip and deflate
+and also br and zstd when brotli and zstandard are installed: pip install
+bugout[compression]
+"""
+
+import gzip
+import json
+from typing import Any, Dict
+
+CONTENT_ENCODING_GZIP = "gzip"
+
+
+def compress_json_body(
+    kwargs: Dict[str, Any],
+    threshold: int,
+    body_kwarg: str = "data",
+    level: int = 5,
+) -> Dict[str, Any]:
+    """
+    Serializes json body of request and compresses it with gzip if it is at least
+    threshold bytes long. body_kwarg is argument for raw body: data for requests,
+    content for httpx.
+    """
+    if kwargs.get("json") is None:
+        return kwargs
+    body = json.dumps(kwargs["json"], separators=(",", ":"), allow_nan=False).encode()
+    headers = dict(kwargs.get("headers") or {})
+    headers["Content-Type"] = "application/json"
+    if len(body) >= threshold:
+        body = gzip.compress(body, compresslevel=level)
+        headers["Content-Encoding"] = CONTENT_ENCODING_GZIP
+    body_kwargs = {key: value for key, value in kwargs.items() if key != "json"}
+    body_kwargs[body_kwarg] = body
+    body_kwargs["headers"] = headers
+    return body_kwargs
@@ -0,0 +1,139 @@
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+import pydantic
+from pydantic import BaseModel
+
+PYDANTIC_V2 = int(pydantic.VERSION.split(".")[0]) >= 2
+
+if not PYDANTIC_V2:
+    from pydantic.fields import SHAPE_LIST
+
+M = TypeVar("M", bound=BaseModel)
+
+# Field name, key in response, nested model (with list flag) and default of each field
+ModelPlan = List[Tuple[str, str, Optional[Type[BaseModel]], bool, Callable[[], Any]]]
+
+_plans: Dict[Type[BaseModel], ModelPlan] = {}
+
+
+def _nested_model(annotation: Any) -> Tuple[Optional[Type[BaseModel]], bool]:
+    """
+    Model of field annotated as model, list of models or optional of them (pydantic 2).
+    """
+    origin = getattr(annotation, "__origin__", None)
+    args = getattr(annotation, "__args__", None) or ()
+    if origin is Union:
+        not_none = [arg for arg in args if arg is not type(None)]
+        if len(not_none) == 1:
+            return _nested_model(not_none[0])
+        return None, False
+    if origin in (list, List):
+        if args and isinstance(args[0], type) and issubclass(args[0], BaseModel):
+            return args[0], True
+        return None, False
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, False
+    return None, False
+
+
+def _model_plan(model: Type[BaseModel]) -> ModelPlan:
+    plan = _plans.get(model)
+    if plan is None:
+        plan = []
+        if PYDANTIC_V2:
+            for name, info in model.model_fields.items():  # type: ignore
+                nested_model, is_list = _nested_model(info.annotation)
+                plan.append(
+                    (
+                        name,
+                        info.alias or name,
+                        nested_model,
+                        is_list,
+                        partial(info.get_default, call_default_factory=True),
+                    )
+                )
+        else:
+            for name, field in model.__fields__.items():
+                nested_model = None
+                if isinstance(field.type_, type) and issubclass(field.type_, BaseModel):
+                    nested_model = field.type_
+                plan.append(
+                    (
+                        name,
+                        field.alias,
+                        nested_model,
+                        field.shape == SHAPE_LIST,
+                        field.get_default,
+                    )
+                )
+        _plans[model] = plan
+    return plan
+
+
+def construct_model(model: Type[M], obj: Dict[str, Any]) -> M:
+    """
+    Builds model and its nested models from decoded JSON without validation.
+
+    Fields keep raw JSON values, so UUIDs, datetimes and enums stay strings.
+    """
+    values: Dict[str, Any] = {}
+    fields_set = set()
+    for name, alias, nested_model, is_list, get_default in _model_plan(model):
+        if alias not in obj:
+            values[name] = get_default()
+            continue
+        value = obj[alias]
+        if nested_model is not None and value is not None:
+            if is_list:
+                value = [construct_model(nested_model, item) for item in value]
+            else:
+                value = construct_model(nested_model, value)
+        values[name] = value
+        fields_set.add(name)
+    if PYDANTIC_V2:
+        return model.model_construct(_fields_set=fields_set, **values)  # type: ignore
+    # Same as BaseModel.construct, which is noticeably slower on large pages
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__fields_set__", fields_set)
+    instance._init_private_attributes()
+    return instance
+
+
+class MemoizedBody(dict):
+    """
+    Response body which keeps models decoded from it, used by in-memory response cache.
+    """
+
+    __slots__ = ("models",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.models: Dict[Tuple[type, bool], BaseModel] = {}
+
+
+def decode(model: Type[M], obj: Dict[str, Any], validate: bool = True) -> M:
+    """
+    Parses API response into model, skips validation if validate is False.
+    """
+    if isinstance(obj, MemoizedBody):
+        decoded = obj.models.get((model, validate))
+        if decoded is None:
+            decoded = model(**obj) if validate else construct_model(model, obj)
+            obj.models[(model, validate)] = decoded
+        return cast(M, decoded)
+    if validate:
+        return model(**obj)
+    return construct_model(model, obj)
@@ -41,3 +41,9 @@ class GroupInvalidParameters(ValueError):
     """
     Raised when operations are applied to a group but invalid parameters are provided.
     """
+
+
+class MirrorUnsupportedQuery(ValueError):
+    """
+    Raised when journal mirror can not answer search query locally.
+    """
@@ -0,0 +1,189 @@
+import json
+import os
+import time
+from typing import Callable, List, Optional, Union
+import uuid
+
+from pydantic import BaseModel
+
+from .batch import run_batch
+from .data import BugoutSearchResult
+from .journal import Journal, SearchOrder
+
+
+class JournalExportReport(BaseModel):
+    journal_id: str
+    total_results: int
+    shards: int
+    completed_shards: int
+    exported: int
+    elapsed_seconds: float
+    entries_per_second: float
+
+
+class JournalExportCheckpoint(BaseModel):
+    journal_id: str
+    query: str
+    filters: List[str]
+    shard_size: int
+    total_results: int
+    completed_shards: int = 0
+    exported: int = 0
+    output_size: int = 0
+
+
+def _load_checkpoint(checkpoint_path: str) -> Optional[JournalExportCheckpoint]:
+    if not os.path.exists(checkpoint_path):
+        return None
+    with open(checkpoint_path) as ifp:
+        return JournalExportCheckpoint(**json.load(ifp))
+
+
+def _save_checkpoint(checkpoint_path: str, checkpoint: JournalExportCheckpoint) -> None:
+    checkpoint_tmp_path = f"{checkpoint_path}.tmp"
+    with open(checkpoint_tmp_path, "w") as ofp:
+        ofp.write(checkpoint.json())
+        ofp.flush()
+        os.fsync(ofp.fileno())
+    os.replace(checkpoint_tmp_path, checkpoint_path)
+
+
+def export_journal(
+    journal: Journal,
+    token: Union[str, uuid.UUID],
+    journal_id: Union[str, uuid.UUID],
+    outfile: str,
+    query: str = "",
+    filters: Optional[List[str]] = None,
+    content: bool = True,
+    shard_size: int = 1000,
+    page_size: int = 100,
+    concurrency: int = 4,
+    on_progress: Optional[Callable[[JournalExportReport], None]] = None,
+) -> JournalExportReport:
+    """
+    Exports journal search results to outfile as JSON lines.
+
+    Offset range from total_results of the first page is split into shards of shard_size
+    entries. Up to concurrency shards are fetched in parallel and written to outfile in
+    order. Search is ordered from oldest entry to newest, so entries created during export
+    do not shift offsets of earlier shards.
+
+    Progress is stored in {outfile}.checkpoint after every written shard. If export fails,
+    running it again with the same arguments continues from the last completed shard.
+    Checkpoint is removed after successful export.
+    """
+    if shard_size < 1 or page_size < 1 or concurrency < 1:
+        raise ValueError("shard_size, page_size and concurrency must be positive")
+    filters = filters if filters is not None else []
+    checkpoint_path = f"{outfile}.checkpoint"
+
+    def fetch_shard(shard_start: int, shard_end: int) -> List[BugoutSearchResult]:
+        results: List[BugoutSearchResult] = []
+        offset = shard_start
+        while offset < shard_end:
+            page = journal.search(
+                token=token,
+                journal_id=journal_id,
+                query=query,
+                filters=filters,
+                limit=min(page_size, shard_end - offset),
+                offset=offset,
+                content=content,
+                order=SearchOrder.ASCENDING,
+            )
+            if not page.results:
+                break
+            results.extend(page.results)
+            offset += len(page.results)
+        return results
+
+    checkpoint = _load_checkpoint(checkpoint_path)
+    if checkpoint is not None and (
+        checkpoint.journal_id != str(journal_id)
+        or checkpoint.query != query
+        or checkpoint.filters != filters
+        or checkpoint.shard_size != shard_size
+    ):
+        raise ValueError(
+            f"Checkpoint {checkpoint_path} belongs to another export, remove it to start over"
+        )
+    if checkpoint is None:
+        first_page = journal.search(
+            token=token,
+            journal_id=journal_id,
+            query=query,
+            filters=filters,
+            limit=1,
+            offset=0,
+            content=False,
+            order=SearchOrder.ASCENDING,
+        )
+        checkpoint = JournalExportCheckpoint(
+            journal_id=str(journal_id),
+            query=query,
+            filters=filters,
+            shard_size=shard_size,
+            total_results=first_page.total_results,
+        )
+        _save_checkpoint(checkpoint_path, checkpoint)
+
+    shards = [
+        (shard_start, min(shard_start + shard_size, checkpoint.total_results))
+        for shard_start in range(0, checkpoint.total_results, shard_size)
+    ]
+    started_at = time.monotonic()
+    exported_before = checkpoint.exported
+
+    def report() -> JournalExportReport:
+        assert checkpoint is not None
+        elapsed_seconds = time.monotonic() - started_at
+        return JournalExportReport(
+            journal_id=str(journal_id),
+            total_results=checkpoint.total_results,
+            shards=len(shards),
+            completed_shards=checkpoint.completed_shards,
+            exported=checkpoint.exported,
+            elapsed_seconds=elapsed_seconds,
+            entries_per_second=(
+                (checkpoint.exported - exported_before) / elapsed_seconds
+                if elapsed_seconds > 0
+                else 0.0
+            ),
+        )
+
+    # Window is kept at concurrency, so at most concurrency fetched shards wait in memory
+    shard_batch = run_batch(
+        fetch_shard,
+        (
+            {"shard_start": shard_start, "shard_end": shard_end}
+            for shard_start, shard_end in shards[checkpoint.completed_shards :]
+        ),
+        concurrency=concurrency,
+        window=concurrency,
+    )
+    with open(outfile, "ab") as ofp:
+        # Drop part of shard which was written before failure
+        ofp.truncate(checkpoint.output_size)
+        try:
+            for shard in shard_batch:
+                if shard.error is not None:
+                    raise shard.error
+                results = shard.result
+                for result in results:
+                    ofp.write(result.json().encode())
+                    ofp.write(b"\n")
+                ofp.flush()
+                os.fsync(ofp.fileno())
+
+                checkpoint.completed_shards += 1
+                checkpoint.exported += len(results)
+                checkpoint.output_size = ofp.tell()
+                _save_checkpoint(checkpoint_path, checkpoint)
+                if on_progress is not None:
+                    on_progress(report())
+        finally:
+            shard_batch.close()
+
+    os.remove(checkpoint_path)
+    return report()
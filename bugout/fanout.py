@@ -0,0 +1,148 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import Enum
+import heapq
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+import uuid
+
+from .columnar import timestamp_us
+from .data import BugoutSearchResult, BugoutSearchResults
+from .journal import Journal, SearchOrder
+
+
+class MergeKey(Enum):
+    created_at = "created_at"
+    score = "score"
+
+
+def search_journals(
+    journal: Journal,
+    token: Union[str, uuid.UUID],
+    journal_ids: List[Union[str, uuid.UUID]],
+    query: str,
+    filters: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    page_size: int = 100,
+    content: bool = True,
+    order: SearchOrder = SearchOrder.DESCENDING,
+    merge_by: MergeKey = MergeKey.created_at,
+    concurrency: int = 8,
+    timeout: Optional[float] = None,
+) -> Iterator[BugoutSearchResult]:
+    """
+    Searches several journals concurrently and lazily yields their results merged into
+    one stream, offset and limit apply to merged stream.
+
+    First pages of all journals are requested at once, so first result arrives after
+    the slowest journal responds instead of after all of them in turn. Next page of
+    each journal is requested as soon as previous one is received.
+
+    Results are merged by created_at in given order, or by descending score. Merge by
+    score gives globally ordered results only if each journal returns its results
+    ordered by score.
+    """
+    if concurrency < 1 or page_size < 1:
+        raise ValueError("concurrency and page_size should be positive")
+    if not journal_ids:
+        return iter([])
+    # No journal contributes more than offset + limit results to merged stream
+    needed = offset + limit if limit is not None else None
+    if needed is not None:
+        page_size = max(min(page_size, needed), 1)
+    return _merged_results(
+        journal,
+        token,
+        journal_ids,
+        query,
+        filters,
+        limit,
+        offset,
+        page_size,
+        needed,
+        content,
+        order,
+        merge_by,
+        concurrency,
+        timeout,
+    )
+
+
+def _merge_key(
+    merge_by: MergeKey, order: SearchOrder
+) -> Callable[[BugoutSearchResult], Any]:
+    if merge_by == MergeKey.score:
+        return lambda result: -result.score
+    if order == SearchOrder.ASCENDING:
+        return lambda result: timestamp_us(result.created_at)
+    return lambda result: -timestamp_us(result.created_at)
+
+
+def _merged_results(
+    journal: Journal,
+    token: Union[str, uuid.UUID],
+    journal_ids: List[Union[str, uuid.UUID]],
+    query: str,
+    filters: Optional[List[str]],
+    limit: Optional[int],
+    offset: int,
+    page_size: int,
+    needed: Optional[int],
+    content: bool,
+    order: SearchOrder,
+    merge_by: MergeKey,
+    concurrency: int,
+    timeout: Optional[float],
+) -> Iterator[BugoutSearchResult]:
+    # Outstanding page of each journal by its position in journal_ids, finished pages
+    # are dropped as soon as they are taken so memory stays at a page per journal
+    outstanding: Dict[int, "Future[BugoutSearchResults]"] = {}
+
+    def fetch_page(
+        journal_id: Union[str, uuid.UUID], page_offset: int
+    ) -> BugoutSearchResults:
+        return journal.search(
+            token=token,
+            journal_id=journal_id,
+            query=query,
+            filters=filters,
+            limit=page_size,
+            offset=page_offset,
+            content=content,
+            order=order,
+            timeout=timeout,
+        )
+
+    def stream(
+        position: int, journal_id: Union[str, uuid.UUID]
+    ) -> Iterator[BugoutSearchResult]:
+        received = 0
+        while position in outstanding:
+            page = outstanding.pop(position).result()
+            received += len(page.results)
+            if (
+                page.results
+                and page.next_offset is not None
+                and (needed is None or received < needed)
+            ):
+                outstanding[position] = executor.submit(
+                    fetch_page, journal_id, page.next_offset
+                )
+            yield from page.results
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(journal_ids))) as executor:
+        try:
+            for position, journal_id in enumerate(journal_ids):
+                outstanding[position] = executor.submit(fetch_page, journal_id, 0)
+            merged = heapq.merge(
+                *[
+                    stream(position, journal_id)
+                    for position, journal_id in enumerate(journal_ids)
+                ],
+                key=_merge_key(merge_by, order),
+            )
+            stop = offset + limit if limit is not None else None
+            yield from islice(merged, offset, stop)
+        finally:
+            for page_future in outstanding.values():
+                page_future.cancel()
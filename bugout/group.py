@@ -1,7 +1,8 @@
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Type, Union
 import uuid
 
-from .calls import make_request
+from pydantic import BaseModel
+
 from .data import (
     Method,
     Role,
@@ -14,6 +15,7 @@ from .data import (
 )
 from .exceptions import InvalidUrlSpec, GroupInvalidParameters
 from .settings import REQUESTS_TIMEOUT
+from .transport import Transport
 
 
 class Group:
@@ -22,58 +24,96 @@ class Group:
     """
 
     def __init__(
-        self, url: Optional[str] = None, timeout: float = REQUESTS_TIMEOUT
+        self,
+        url: Optional[str] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+        transport: Optional[Transport] = None,
+        fast_decode: bool = False,
     ) -> None:
         if url is None:
             raise InvalidUrlSpec("Invalid brood url specified")
         self.url = url
         self.timeout = timeout
+        self.transport = transport if transport is not None else Transport()
+        self.fast_decode = fast_decode
 
-    def _call(self, method: Method, path: str, **kwargs):
+    def _call(
+        self,
+        method: Method,
+        path: str,
+        timeout: Optional[float] = None,
+        model: Optional[Type[BaseModel]] = None,
+        **kwargs,
+    ):
         url = f"{self.url.rstrip('/')}/{path.rstrip('/')}"
-        result = make_request(method=method, url=url, timeout=self.timeout, **kwargs)
+        result = self.transport.request(
+            method=method,
+            url=url,
+            model=model,
+            validate=not self.fast_decode,
+            timeout=timeout if timeout is not None else self.timeout,
+            **kwargs,
+        )
         return result
 
     def get_group(
-        self, token: Union[str, uuid.UUID], group_id: Union[str, uuid.UUID]
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
     ) -> BugoutGroup:
         get_group_path = f"group/{group_id}"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(method=Method.get, path=get_group_path, headers=headers)
-        return BugoutGroup(**result)
+        return self._call(
+            method=Method.get,
+            path=get_group_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutGroup,
+        )
 
     def find_group(
         self,
         token: Union[str, uuid.UUID],
         group_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
     ) -> BugoutGroup:
         find_group_path = f"groups/find"
         query_params = {"group_id": group_id}
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
+        return self._call(
             method=Method.get,
             path=find_group_path,
             params=query_params,
             headers=headers,
+            timeout=timeout,
+            model=BugoutGroup,
         )
-        return BugoutGroup(**result)
 
-    def get_user_groups(self, token: Union[str, uuid.UUID]) -> BugoutUserGroups:
+    def get_user_groups(
+        self, token: Union[str, uuid.UUID], timeout: Optional[float] = None
+    ) -> BugoutUserGroups:
         get_user_groups_path = "groups"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.get, path=get_user_groups_path, headers=headers
+        return self._call(
+            method=Method.get,
+            path=get_user_groups_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutUserGroups,
         )
-        return BugoutUserGroups(**result)
 
     def create_group(
-        self, token: Union[str, uuid.UUID], group_name: str
+        self,
+        token: Union[str, uuid.UUID],
+        group_name: str,
+        timeout: Optional[float] = None,
     ) -> BugoutGroup:
         create_group_path = "group"
         data = {
@@ -82,10 +122,14 @@ class Group:
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.post, path=create_group_path, headers=headers, data=data
+        return self._call(
+            method=Method.post,
+            path=create_group_path,
+            headers=headers,
+            data=data,
+            timeout=timeout,
+            model=BugoutGroup,
         )
-        return BugoutGroup(**result)
 
     def set_user_group(
         self,
@@ -94,6 +138,7 @@ class Group:
         user_type: Role,
         username: Optional[str] = None,
         email: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> BugoutGroupUser:
         set_user_group_path = f"group/{group_id}/role"
 
@@ -112,10 +157,14 @@ class Group:
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.post, path=set_user_group_path, headers=headers, data=data
+        return self._call(
+            method=Method.post,
+            path=set_user_group_path,
+            headers=headers,
+            data=data,
+            timeout=timeout,
+            model=BugoutGroupUser,
         )
-        return BugoutGroupUser(**result)
 
     def delete_user_group(
         self,
@@ -123,6 +172,7 @@ class Group:
         group_id: Union[str, uuid.UUID],
         username: Optional[str] = None,
         email: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> BugoutGroupUser:
         """
         TODO(kompotkot): Merge with set_user_group()
@@ -142,31 +192,39 @@ class Group:
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
+        return self._call(
             method=Method.delete,
             path=delete_user_group_path,
             headers=headers,
             data=data,
+            timeout=timeout,
+            model=BugoutGroupUser,
         )
-        return BugoutGroupUser(**result)
 
     def get_group_members(
-        self, token: Union[str, uuid.UUID], group_id: Union[str, uuid.UUID]
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
     ) -> BugoutGroupMembers:
         get_group_members_path = f"group/{group_id}/users"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.get, path=get_group_members_path, headers=headers
+        return self._call(
+            method=Method.get,
+            path=get_group_members_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutGroupMembers,
         )
-        return BugoutGroupMembers(**result)
 
     def update_group(
         self,
         token: Union[str, uuid.UUID],
         group_id: Union[str, uuid.UUID],
         group_name: str,
+        timeout: Optional[float] = None,
     ) -> BugoutGroup:
         update_group_path = f"group/{group_id}/name"
         data = {
@@ -175,22 +233,32 @@ class Group:
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.put, path=update_group_path, headers=headers, data=data
+        return self._call(
+            method=Method.put,
+            path=update_group_path,
+            headers=headers,
+            data=data,
+            timeout=timeout,
+            model=BugoutGroup,
         )
-        return BugoutGroup(**result)
 
     def delete_group(
-        self, token: Union[str, uuid.UUID], group_id: Union[str, uuid.UUID]
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
     ) -> BugoutGroup:
         delete_group_path = f"group/{group_id}"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.delete, path=delete_group_path, headers=headers
+        return self._call(
+            method=Method.delete,
+            path=delete_group_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutGroup,
         )
-        return BugoutGroup(**result)
 
     def create_application(
         self,
@@ -198,6 +266,7 @@ class Group:
         name: str,
         description: str,
         group_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
     ) -> BugoutApplication:
         applications_path = "applications"
         headers = {
@@ -208,27 +277,38 @@ class Group:
             "description": description,
             "group_id": group_id,
         }
-        result = self._call(
-            method=Method.post, path=applications_path, headers=headers, data=data
+        return self._call(
+            method=Method.post,
+            path=applications_path,
+            headers=headers,
+            data=data,
+            timeout=timeout,
+            model=BugoutApplication,
         )
-        return BugoutApplication(**result)
 
     def get_application(
         self,
         token: Union[str, uuid.UUID],
         application_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
     ) -> BugoutApplication:
         applications_path = f"applications/{application_id}"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(method=Method.get, path=applications_path, headers=headers)
-        return BugoutApplication(**result)
+        return self._call(
+            method=Method.get,
+            path=applications_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutApplication,
+        )
 
     def list_applications(
         self,
         token: Union[str, uuid.UUID],
         group_id: Optional[Union[str, uuid.UUID]] = None,
+        timeout: Optional[float] = None,
     ) -> BugoutApplications:
         applications_path = "applications"
         headers = {
@@ -237,24 +317,29 @@ class Group:
         query_params = {
             "group_id": group_id,
         }
-        result = self._call(
+        return self._call(
             method=Method.get,
             path=applications_path,
             params=query_params,
             headers=headers,
+            timeout=timeout,
+            model=BugoutApplications,
         )
-        return BugoutApplications(**result)
 
     def delete_application(
         self,
         token: Union[str, uuid.UUID],
         application_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
     ) -> BugoutApplication:
         applications_path = f"applications/{application_id}"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.delete, path=applications_path, headers=headers
+        return self._call(
+            method=Method.delete,
+            path=applications_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutApplication,
         )
-        return BugoutApplication(**result)
@@ -0,0 +1,236 @@
+"""
+Cache of GET response bodies revalidated with conditional requests.
+
+Responses with ETag or Last-Modified header are stored by request key. Next identical
+request is sent with If-None-Match or If-Modified-Since, and when server answers 304 Not
+Modified stored body is returned without downloading and decoding it again.
+"""
+
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from .data import Method
+from .decode import MemoizedBody
+from .singleflight import request_key
+
+
+class CachedResponse(NamedTuple):
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: Any
+    size: int
+
+
+def cache_key(method: Method, url: str, kwargs: Dict[str, Any]) -> Optional[str]:
+    """
+    Hash of request key, so raw tokens from headers are not kept in cache.
+    """
+    key = request_key(method, url, kwargs)
+    if key is None:
+        return None
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def conditional_kwargs(
+    kwargs: Dict[str, Any], cached: CachedResponse
+) -> Dict[str, Any]:
+    headers = dict(kwargs.get("headers") or {})
+    if cached.etag is not None:
+        headers["If-None-Match"] = cached.etag
+    if cached.last_modified is not None:
+        headers["If-Modified-Since"] = cached.last_modified
+    return {**kwargs, "headers": headers}
+
+
+def validators(headers: Any) -> Tuple[Optional[str], Optional[str]]:
+    return headers.get("ETag"), headers.get("Last-Modified")
+
+
+class ResponseCache:
+    """
+    Base class of response cache backends.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        raise NotImplementedError
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def record_hit(self) -> None:
+        with self._lock:
+            self.hits += 1
+
+    def metrics(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+class MemoryResponseCache(ResponseCache):
+    """
+    In-memory cache with least recently used eviction, bounded by number of responses and
+    total size of response bodies.
+
+    Object bodies are kept as MemoizedBody, so model decoded from cached body is reused
+    on next 304 as well. Bodies and models are shared between callers, do not mutate
+    results of cached requests.
+    """
+
+    def __init__(self, maxsize: int = 1024, max_bytes: int = 64 * 1024 * 1024) -> None:
+        super().__init__()
+        if maxsize < 1:
+            raise ValueError("maxsize should be at least 1")
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+
+        self._items: "OrderedDict[str, CachedResponse]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            response = self._items.get(key)
+            if response is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        if response.size > self.max_bytes:
+            return
+        if isinstance(response.body, dict) and not isinstance(
+            response.body, MemoizedBody
+        ):
+            response = response._replace(body=MemoizedBody(response.body))
+        with self._lock:
+            previous = self._items.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= previous.size
+            self._items[key] = response
+            self.total_bytes += response.size
+            while len(self._items) > self.maxsize or self.total_bytes > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self.total_bytes -= evicted.size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self.total_bytes = 0
+
+
+class DiskResponseCache(ResponseCache):
+    """
+    Cache of responses in directory, one JSON file per response, survives restarts.
+
+    Files are evicted in least recently used order when their total size exceeds
+    max_bytes. Body is read from file on every hit, so callers do not share it.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024) -> None:
+        super().__init__()
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+
+        os.makedirs(directory, exist_ok=True)
+        # Key -> file size in least recently used order
+        self._files: "OrderedDict[str, int]" = OrderedDict()
+        existing = []
+        for filename in os.listdir(directory):
+            if not filename.endswith(".json"):
+                continue
+            stat = os.stat(os.path.join(directory, filename))
+            existing.append((stat.st_mtime, filename[: -len(".json")], stat.st_size))
+        for _, key, size in sorted(existing):
+            self._files[key] = size
+            self.total_bytes += size
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            if key not in self._files:
+                self.misses += 1
+                return None
+            self._files.move_to_end(key)
+        try:
+            with open(self._path(key)) as ifp:
+                stored = json.load(ifp)
+            os.utime(self._path(key))
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+        return CachedResponse(
+            etag=stored["etag"],
+            last_modified=stored["last_modified"],
+            body=stored["body"],
+            size=self._files.get(key, 0),
+        )
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        payload = json.dumps(
+            {
+                "etag": response.etag,
+                "last_modified": response.last_modified,
+                "body": response.body,
+            }
+        ).encode()
+        if len(payload) > self.max_bytes:
+            return
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as ofp:
+            ofp.write(payload)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self.total_bytes += len(payload) - self._files.pop(key, 0)
+            self._files[key] = len(payload)
+            while self.total_bytes > self.max_bytes:
+                evicted_key, evicted_size = self._files.popitem(last=False)
+                self.total_bytes -= evicted_size
+                self.evictions += 1
+                try:
+                    os.remove(self._path(evicted_key))
+                except FileNotFoundError:
+                    pass
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in self._files:
+                try:
+                    os.remove(self._path(key))
+                except FileNotFoundError:
+                    pass
+            self._files.clear()
+            self.total_bytes = 0
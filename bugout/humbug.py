@@ -1,10 +1,12 @@
-from typing import Optional, Union
+from typing import Optional, Type, Union
 import uuid
 
-from .calls import make_request
+from pydantic import BaseModel
+
 from .data import Method, BugoutHumbugIntegrationsList
 from .exceptions import InvalidUrlSpec
 from .settings import REQUESTS_TIMEOUT
+from .transport import Transport
 
 
 class Humbug:
@@ -13,22 +15,43 @@ class Humbug:
     """
 
     def __init__(
-        self, url: Optional[str] = None, timeout: float = REQUESTS_TIMEOUT
+        self,
+        url: Optional[str] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+        transport: Optional[Transport] = None,
+        fast_decode: bool = False,
     ) -> None:
         if url is None:
             raise InvalidUrlSpec("Invalid spire url specified")
         self.url = url
         self.timeout = timeout
+        self.transport = transport if transport is not None else Transport()
+        self.fast_decode = fast_decode
 
-    def _call(self, method: Method, path: str, **kwargs):
+    def _call(
+        self,
+        method: Method,
+        path: str,
+        timeout: Optional[float] = None,
+        model: Optional[Type[BaseModel]] = None,
+        **kwargs,
+    ):
         url = f"{self.url.rstrip('/')}/{path.rstrip('/')}"
-        result = make_request(method=method, url=url, timeout=self.timeout, **kwargs)
+        result = self.transport.request(
+            method=method,
+            url=url,
+            model=model,
+            validate=not self.fast_decode,
+            timeout=timeout if timeout is not None else self.timeout,
+            **kwargs,
+        )
         return result
 
     def get_humbug_integrations(
         self,
         token: Union[str, uuid.UUID],
         group_id: Optional[Union[str, uuid.UUID]] = None,
+        timeout: Optional[float] = None,
     ) -> BugoutHumbugIntegrationsList:
         humbug_path = "humbug/integrations"
         headers = {
@@ -37,7 +60,11 @@ class Humbug:
         query_params = {}
         if group_id is not None:
             query_params.update({"group_id": group_id})
-        result = self._call(
-            method=Method.get, path=humbug_path, params=query_params, headers=headers
+        return self._call(
+            method=Method.get,
+            path=humbug_path,
+            params=query_params,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutHumbugIntegrationsList,
         )
-        return BugoutHumbugIntegrationsList(**result)
@@ -0,0 +1,286 @@
+from enum import Enum
+import json
+import os
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Set, TextIO, Tuple, Union
+import uuid
+
+from pydantic import BaseModel, Field
+
+from .columnar import timestamp_us
+from .data import BugoutSearchResult
+from .journal import Journal, SearchOrder
+
+
+class ChangeKind(Enum):
+    created = "created"
+    updated = "updated"
+    deleted = "deleted"
+
+
+class EntryChange(BaseModel):
+    kind: ChangeKind
+    journal_id: str
+    entry_id: str
+    updated_at: Optional[str] = None
+    entry: Optional[BugoutSearchResult] = None
+
+
+class JournalSyncState(BaseModel):
+    journal_id: str
+    query: str
+    filters: List[str]
+    high_water_mark: Optional[str] = None
+    # Entries updated exactly at high water mark, search returns them again next sync
+    high_water_mark_entries: List[str] = Field(default_factory=list)
+    last_reconciled_at: Optional[float] = None
+
+
+class JournalSyncReport(BaseModel):
+    journal_id: str
+    reconciled: bool
+    fetched: int = 0
+    created: int = 0
+    updated: int = 0
+    deleted: int = 0
+    high_water_mark: Optional[str] = None
+    elapsed_seconds: float = 0.0
+
+
+# Returns (entry_id, updated_at) of every entry delivered by previous syncs
+KnownEntries = Callable[[], Iterable[Tuple[str, str]]]
+
+
+def _load_state(state_path: str) -> Optional[JournalSyncState]:
+    if not os.path.exists(state_path):
+        return None
+    with open(state_path) as ifp:
+        return JournalSyncState(**json.load(ifp))
+
+
+def _save_state(state_path: str, state: JournalSyncState) -> None:
+    state_tmp_path = f"{state_path}.tmp"
+    with open(state_tmp_path, "w") as ofp:
+        ofp.write(state.json())
+        ofp.flush()
+        os.fsync(ofp.fileno())
+    os.replace(state_tmp_path, state_path)
+
+
+def _load_entries(entries_path: str) -> Dict[str, str]:
+    entries: Dict[str, str] = {}
+    if not os.path.exists(entries_path):
+        return entries
+    with open(entries_path) as ifp:
+        for line in ifp:
+            entry_id, _, updated_at = line.rstrip("\n").partition("\t")
+            if updated_at:
+                entries[entry_id] = updated_at
+    return entries
+
+
+def _save_entries(entries_path: str, entries: Dict[str, str]) -> None:
+    entries_tmp_path = f"{entries_path}.tmp"
+    with open(entries_tmp_path, "w") as ofp:
+        for entry_id, updated_at in entries.items():
+            ofp.write(f"{entry_id}\t{updated_at}\n")
+        ofp.flush()
+        os.fsync(ofp.fileno())
+    os.replace(entries_tmp_path, entries_path)
+
+
+def _entry_id(result: BugoutSearchResult) -> str:
+    return result.entry_url.rstrip("/").rsplit("/", 1)[-1]
+
+
+def sync_journal(
+    journal: Journal,
+    token: Union[str, uuid.UUID],
+    journal_id: Union[str, uuid.UUID],
+    state_path: str,
+    query: str = "",
+    filters: Optional[List[str]] = None,
+    content: bool = True,
+    page_size: int = 100,
+    reconcile_interval: float = 24 * 60 * 60,
+    reconcile: bool = False,
+    on_change: Optional[Callable[[EntryChange], None]] = None,
+    known_entries: Optional[KnownEntries] = None,
+    timeout: Optional[float] = None,
+) -> JournalSyncReport:
+    """
+    Fetches entries of journal created or updated since previous sync and passes them
+    to on_change as change events page by page, report only counts them.
+
+    Sync state in state_path is a cursor: high water mark of updated_at and ids of
+    entries updated exactly at it, so entries returned again at the high water mark
+    second are not reported twice. Only search results with
+    updated_at:>={high water mark} are requested, so regular sync costs O(changes)
+    instead of O(journal size). Entry is reported as created when it was created after
+    the high water mark, otherwise as updated.
+
+    Deleted entries are not returned by search, they are detected by reconciliation
+    which lists whole journal and compares it with known entries. It runs on the first
+    sync, when reconcile_interval seconds passed since the last one or when reconcile
+    is True. Reconciliation also catches changes missed by incremental syncs, for
+    example entries skipped because other entries were deleted during pagination.
+    Known entries are read from known_entries, or from {state_path}.entries log which
+    regular syncs append changes to and reconciliation compacts.
+
+    on_change is called for every change before state is saved, so changes are
+    delivered at least once if sync fails.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be positive")
+    filters = filters if filters is not None else []
+    started_at = time.monotonic()
+
+    state = _load_state(state_path)
+    if state is not None and (
+        state.journal_id != str(journal_id)
+        or state.query != query
+        or state.filters != filters
+    ):
+        raise ValueError(
+            f"Sync state {state_path} belongs to another sync, remove it to start over"
+        )
+    if state is None:
+        state = JournalSyncState(
+            journal_id=str(journal_id), query=query, filters=filters
+        )
+
+    reconciled = (
+        reconcile
+        or state.high_water_mark is None
+        or state.last_reconciled_at is None
+        or time.time() - state.last_reconciled_at >= reconcile_interval
+    )
+    reconcile_started_at = time.time()
+
+    search_filters = list(filters)
+    since_us = (
+        timestamp_us(state.high_water_mark)
+        if state.high_water_mark is not None
+        else None
+    )
+    since_entries = frozenset(state.high_water_mark_entries)
+    if not reconciled and since_us is not None:
+        # Spire range filters take unix timestamps in seconds
+        search_filters.append(f"updated_at:>={since_us // 1_000_000}")
+
+    entries_path = f"{state_path}.entries"
+    known: Optional[Dict[str, str]] = None
+    if reconciled:
+        known = (
+            dict(known_entries())
+            if known_entries is not None
+            else _load_entries(entries_path)
+        )
+    seen: Set[str] = set()
+    high_water_mark_us = since_us
+    high_water_mark_entries = set(since_entries)
+
+    report = JournalSyncReport(journal_id=str(journal_id), reconciled=reconciled)
+
+    def deliver(change: EntryChange) -> None:
+        if change.kind == ChangeKind.created:
+            report.created += 1
+        elif change.kind == ChangeKind.updated:
+            report.updated += 1
+        else:
+            report.deleted += 1
+        if on_change is not None:
+            on_change(change)
+
+    entries_log: Optional[TextIO] = None
+    if known is None and known_entries is None:
+        entries_log = open(entries_path, "a")
+    try:
+        offset: Optional[int] = 0
+        while offset is not None:
+            page = journal.search(
+                token=token,
+                journal_id=journal_id,
+                query=query,
+                filters=search_filters,
+                limit=page_size,
+                offset=offset,
+                content=content,
+                order=SearchOrder.ASCENDING,
+                timeout=timeout,
+            )
+            if not page.results:
+                break
+            report.fetched += len(page.results)
+            for result in page.results:
+                entry_id = _entry_id(result)
+                updated_at_us = timestamp_us(result.updated_at)
+                if high_water_mark_us is None or updated_at_us > high_water_mark_us:
+                    high_water_mark_us = updated_at_us
+                    state.high_water_mark = result.updated_at
+                    high_water_mark_entries = {entry_id}
+                elif updated_at_us == high_water_mark_us:
+                    high_water_mark_entries.add(entry_id)
+
+                if known is not None:
+                    seen.add(entry_id)
+                    known_updated_at = known.get(entry_id)
+                    if known_updated_at == result.updated_at:
+                        continue
+                    kind = (
+                        ChangeKind.created
+                        if known_updated_at is None
+                        else ChangeKind.updated
+                    )
+                    known[entry_id] = result.updated_at
+                else:
+                    assert since_us is not None
+                    if updated_at_us < since_us or (
+                        updated_at_us == since_us and entry_id in since_entries
+                    ):
+                        continue
+                    created_at_us = timestamp_us(result.created_at)
+                    kind = (
+                        ChangeKind.created
+                        if created_at_us > since_us
+                        or (created_at_us == since_us and entry_id not in since_entries)
+                        else ChangeKind.updated
+                    )
+                    if entries_log is not None:
+                        entries_log.write(f"{entry_id}\t{result.updated_at}\n")
+                deliver(
+                    EntryChange(
+                        kind=kind,
+                        journal_id=str(journal_id),
+                        entry_id=entry_id,
+                        updated_at=result.updated_at,
+                        entry=result,
+                    )
+                )
+            offset = page.next_offset
+
+        if known is not None:
+            for entry_id in [entry_id for entry_id in known if entry_id not in seen]:
+                deliver(
+                    EntryChange(
+                        kind=ChangeKind.deleted,
+                        journal_id=str(journal_id),
+                        entry_id=entry_id,
+                        updated_at=known.pop(entry_id),
+                    )
+                )
+            if known_entries is None:
+                _save_entries(entries_path, known)
+            state.last_reconciled_at = reconcile_started_at
+        elif entries_log is not None:
+            entries_log.flush()
+            os.fsync(entries_log.fileno())
+    finally:
+        if entries_log is not None:
+            entries_log.close()
+
+    state.high_water_mark_entries = sorted(high_water_mark_entries)
+    _save_state(state_path, state)
+    report.high_water_mark = state.high_water_mark
+    report.elapsed_seconds = time.monotonic() - started_at
+    return report
@@ -0,0 +1,366 @@
+"""
+Client-side instrumentation of Bugout API calls: request hooks and per-endpoint phase
+histograms.
+
+Phases of every request, in seconds:
+    connect  - TCP connect and TLS handshake of new connection, asyncio client only
+    ttfb     - from sending request until response headers are received
+    transfer - receiving response body
+    request  - whole request including retries, ttfb and transfer of the last attempt
+    decode   - JSON decoding of response body
+    model    - building response model from decoded body
+
+Endpoints are templated request paths, ids in path are replaced with {id}, for example
+journals/{id}/search.
+"""
+
+import bisect
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
+from urllib.parse import urlsplit
+
+from pydantic import BaseModel
+
+from .data import Method
+from .decode import decode
+
+PHASE_CONNECT = "connect"
+PHASE_TTFB = "ttfb"
+PHASE_TRANSFER = "transfer"
+PHASE_REQUEST = "request"
+PHASE_DECODE = "decode"
+PHASE_MODEL = "model"
+
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+ID_SEGMENT = re.compile(
+    r"^([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+    r"|[0-9a-fA-F]{32}|\d+)$"
+)
+
+_endpoints: Dict[str, str] = {}
+
+
+def endpoint_template(url: str) -> str:
+    """
+    Path of url with ids replaced by {id}.
+    """
+    path = urlsplit(url).path.strip("/")
+    endpoint = _endpoints.get(path)
+    if endpoint is None:
+        endpoint = "/".join(
+            "{id}" if ID_SEGMENT.match(segment) else segment
+            for segment in path.split("/")
+        )
+        if len(_endpoints) < 10000:
+            _endpoints[path] = endpoint
+    return endpoint
+
+
+class RequestInfo:
+    """
+    Request passed to hooks. timings are filled by the time after_request hooks run.
+    """
+
+    __slots__ = (
+        "method",
+        "url",
+        "endpoint",
+        "started_at",
+        "finished_at",
+        "timings",
+        "status_code",
+        "error",
+        "_headers_at",
+    )
+
+    def __init__(self, method: Method, url: str) -> None:
+        self.method = method.value.upper()
+        self.url = url
+        self.endpoint = endpoint_template(url)
+        # Wall clock time in nanoseconds, as used by tracing systems
+        self.started_at = time.time_ns()
+        self.finished_at: Optional[int] = None
+        self.timings: Dict[str, float] = {}
+        self.status_code: Optional[int] = None
+        self.error: Optional[BaseException] = None
+        self._headers_at: Optional[float] = None
+
+
+RequestHook = Callable[[RequestInfo], None]
+
+
+class Histogram:
+    """
+    Thread-safe cumulative histogram with fixed bucket upper bounds.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        with self._lock:
+            counts = list(self.counts)
+        result = []
+        total = 0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class Instrumentation:
+    """
+    Collects phase histograms per method and endpoint and calls request hooks.
+
+    before_request hooks are called before request is sent, after_request hooks after
+    response is decoded or request failed. Exceptions raised by hooks are propagated.
+    Transport without instrumentation does not measure anything.
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        histograms: bool = True,
+        before_request: Optional[List[RequestHook]] = None,
+        after_request: Optional[List[RequestHook]] = None,
+    ) -> None:
+        self.buckets = tuple(buckets)
+        self.histograms_enabled = histograms
+        self.before_request: List[RequestHook] = list(before_request or [])
+        self.after_request: List[RequestHook] = list(after_request or [])
+
+        self.histograms: Dict[Tuple[str, str, str], Histogram] = {}
+        self.requests: Dict[Tuple[str, str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def add_before_request_hook(self, hook: RequestHook) -> None:
+        self.before_request.append(hook)
+
+    def add_after_request_hook(self, hook: RequestHook) -> None:
+        self.after_request.append(hook)
+
+    def observe(self, phase: str, method: str, endpoint: str, seconds: float) -> None:
+        if not self.histograms_enabled:
+            return
+        key = (phase, method, endpoint)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(key, Histogram(self.buckets))
+        histogram.observe(seconds)
+
+    def start(self, method: Method, url: str) -> RequestInfo:
+        info = RequestInfo(method, url)
+        for hook in self.before_request:
+            hook(info)
+        return info
+
+    def finish(self, info: RequestInfo) -> None:
+        info.finished_at = time.time_ns()
+        if self.histograms_enabled:
+            status = str(info.status_code) if info.status_code is not None else "error"
+            key = (info.method, info.endpoint, status)
+            with self._lock:
+                self.requests[key] = self.requests.get(key, 0) + 1
+            for phase, seconds in info.timings.items():
+                self.observe(phase, info.method, info.endpoint, seconds)
+        for hook in self.after_request:
+            hook(info)
+
+    def observe_model(self, method: Method, url: str, seconds: float) -> None:
+        """
+        Model phase of caller which got response of request made by another caller.
+        """
+        self.observe(PHASE_MODEL, method.value.upper(), endpoint_template(url), seconds)
+
+    def prometheus_text(self, prefix: str = "bugout_client") -> str:
+        """
+        Histograms and request counters in Prometheus text exposition format.
+        """
+        with self._lock:
+            histograms = sorted(self.histograms.items())
+            requests = sorted(self.requests.items())
+
+        lines = [
+            f"# HELP {prefix}_requests_total Requests to Bugout API by response status.",
+            f"# TYPE {prefix}_requests_total counter",
+        ]
+        for (method, endpoint, status), count in requests:
+            labels = _labels(method=method, endpoint=endpoint, status=status)
+            lines.append(f"{prefix}_requests_total{{{labels}}} {count}")
+
+        name = f"{prefix}_request_phase_seconds"
+        lines.append(f"# HELP {name} Duration of Bugout API request phases.")
+        lines.append(f"# TYPE {name} histogram")
+        for (phase, method, endpoint), histogram in histograms:
+            labels = _labels(phase=phase, method=method, endpoint=endpoint)
+            for bound, count in histogram.cumulative():
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{name}_bucket{{{labels},le="{le}"}} {count}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self.histograms.clear()
+            self.requests.clear()
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(
+        '{}="{}"'.format(
+            key,
+            value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for key, value in labels.items()
+    )
+
+
+def build_model(
+    instrumentation: Optional[Instrumentation],
+    info: Optional[RequestInfo],
+    method: Method,
+    url: str,
+    model: Optional[Type[BaseModel]],
+    body: Any,
+    validate: bool,
+) -> Any:
+    """
+    Builds model from response body, returns body if model is None. Model phase is
+    recorded in info of request before it finishes, or straight into histograms when
+    response was shared by request of another caller.
+    """
+    if model is None:
+        return body
+    if instrumentation is None:
+        return decode(model, body, validate=validate)
+    started_at = time.perf_counter()
+    result = decode(model, body, validate=validate)
+    seconds = time.perf_counter() - started_at
+    if info is not None:
+        info.timings[PHASE_MODEL] = seconds
+    else:
+        instrumentation.observe_model(method, url, seconds)
+    return result
+
+
+def requests_timing_kwargs(info: RequestInfo, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Adds requests response hook which marks the end of time to first byte, response hook
+    runs before response body is read.
+    """
+
+    def response_received(r: Any, *args: Any, **hook_kwargs: Any) -> Any:
+        info.timings[PHASE_TTFB] = r.elapsed.total_seconds()
+        info._headers_at = time.perf_counter()
+        return r
+
+    return {**kwargs, "hooks": {"response": response_received}}
+
+
+def requests_timing_done(info: RequestInfo) -> None:
+    if info._headers_at is not None:
+        info.timings[PHASE_TRANSFER] = time.perf_counter() - info._headers_at
+
+
+HTTPX_TRACE_PHASES = {
+    "connection.connect_tcp": PHASE_CONNECT,
+    "connection.start_tls": PHASE_CONNECT,
+    "http11.receive_response_body": PHASE_TRANSFER,
+    "http2.receive_response_body": PHASE_TRANSFER,
+}
+
+
+def httpx_timing_kwargs(info: RequestInfo, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Adds httpx trace extension which measures connect, ttfb and transfer phases of the
+    last attempt.
+    """
+    started: Dict[str, float] = {}
+
+    async def trace(event_name: str, event_info: Dict[str, Any]) -> None:
+        now = time.perf_counter()
+        prefix, _, stage = event_name.rpartition(".")
+        if prefix.endswith("send_request_headers") and stage == "started":
+            started["ttfb"] = now
+        elif prefix.endswith("receive_response_headers") and stage == "complete":
+            if "ttfb" in started:
+                info.timings[PHASE_TTFB] = now - started["ttfb"]
+        elif prefix in HTTPX_TRACE_PHASES:
+            if stage == "started":
+                started[prefix] = now
+            elif stage == "complete" and prefix in started:
+                phase = HTTPX_TRACE_PHASES[prefix]
+                info.timings[phase] = (
+                    info.timings.get(phase, 0.0) + now - started.pop(prefix)
+                )
+
+    return {**kwargs, "extensions": {"trace": trace}}
+
+
+def opentelemetry_hook(tracer: Any = None) -> RequestHook:
+    """
+    after_request hook which records every request as OpenTelemetry span with phases
+    as attributes. Requires opentelemetry-api: pip install bugout[otel]
+    """
+    try:
+        from opentelemetry import trace  # type: ignore
+    except ImportError as e:
+        raise ImportError(
+            "opentelemetry-api is required for OpenTelemetry spans: pip install bugout[otel]"
+        ) from e
+    if tracer is None:
+        tracer = trace.get_tracer("bugout")
+
+    def record_span(info: RequestInfo) -> None:
+        attributes: Dict[str, Any] = {
+            "http.request.method": info.method,
+            "url.full": info.url,
+            "bugout.endpoint": info.endpoint,
+        }
+        if info.status_code is not None:
+            attributes["http.response.status_code"] = info.status_code
+        for phase, seconds in info.timings.items():
+            attributes[f"bugout.{phase}_seconds"] = seconds
+        span = tracer.start_span(
+            f"{info.method} {info.endpoint}",
+            kind=trace.SpanKind.CLIENT,
+            start_time=info.started_at,
+            attributes=attributes,
+        )
+        if info.error is not None:
+            span.record_exception(info.error)
+            span.set_status(trace.Status(trace.StatusCode.ERROR, str(info.error)))
+        span.end(end_time=info.finished_at)
+
+    return record_span
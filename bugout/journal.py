@@ -1,8 +1,10 @@
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type, Union
 import uuid
 
-from .calls import make_request
+from pydantic import BaseModel
+
 from .data import (
     BugoutJournal,
     BugoutJournals,
@@ -14,13 +16,17 @@ from .data import (
     BugoutJournalEntriesRequest,
     BugoutJournalEntryContent,
     BugoutJournalEntryTags,
+    BugoutSearchResult,
     BugoutSearchResults,
     HolderType,
     Method,
     JournalTypes,
 )
+from .decode import decode
 from .exceptions import InvalidUrlSpec
 from .settings import REQUESTS_TIMEOUT
+from .views import JournalEntriesView, SearchResultsView, SearchResultView
+from .transport import Transport
 
 
 class SearchOrder(Enum):
@@ -49,20 +55,59 @@ class Journal:
     """
 
     def __init__(
-        self, url: Optional[str] = None, timeout: float = REQUESTS_TIMEOUT
+        self,
+        url: Optional[str] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+        transport: Optional[Transport] = None,
+        fast_decode: bool = False,
     ) -> None:
         if url is None:
             raise InvalidUrlSpec("Invalid spire url specified")
         self.url = url
         self.timeout = timeout
+        self.transport = transport if transport is not None else Transport()
+        self.fast_decode = fast_decode
 
-    def _call(self, method: Method, path: str, **kwargs):
+    def _call(
+        self,
+        method: Method,
+        path: str,
+        timeout: Optional[float] = None,
+        model: Optional[Type[BaseModel]] = None,
+        **kwargs,
+    ):
         url = f"{self.url.rstrip('/')}/{path.rstrip('/')}"
-        result = make_request(method=method, url=url, timeout=self.timeout, **kwargs)
+        result = self.transport.request(
+            method=method,
+            url=url,
+            model=model,
+            validate=not self.fast_decode,
+            timeout=timeout if timeout is not None else self.timeout,
+            **kwargs,
+        )
         return result
 
+    def _stream(
+        self,
+        method: Method,
+        path: str,
+        key: str,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> Iterator[Any]:
+        url = f"{self.url.rstrip('/')}/{path.rstrip('/')}"
+        yield from self.transport.stream(
+            method=method,
+            url=url,
+            key=key,
+            timeout=timeout if timeout is not None else self.timeout,
+            **kwargs,
+        )
+
     # Scope module
-    def list_scopes(self, token: Union[str, uuid.UUID], api: str) -> BugoutScopes:
+    def list_scopes(
+        self, token: Union[str, uuid.UUID], api: str, timeout: Optional[float] = None
+    ) -> BugoutScopes:
         scopes_path = f"journals/scopes"
         json = {
             "api": api,
@@ -70,16 +115,21 @@ class Journal:
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.get, path=scopes_path, headers=headers, json=json
+        return self._call(
+            method=Method.get,
+            path=scopes_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
+            model=BugoutScopes,
         )
-        return BugoutScopes(**result)
 
     def get_journal_permissions(
         self,
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
         holder_ids: Optional[List[Union[str, uuid.UUID]]] = None,
+        timeout: Optional[float] = None,
     ) -> BugoutJournalPermissions:
         journal_scopes_path = f"journals/{journal_id}/permissions"
         headers = {
@@ -90,25 +140,32 @@ class Journal:
             holder_ids_string = [str(holder_id) for holder_id in holder_ids]
             holder_ids_param = ",".join(holder_ids_string)
             query_params = {"holder_ids": holder_ids_param}
-        result = self._call(
+        return self._call(
             method=Method.get,
             path=journal_scopes_path,
             params=query_params,
             headers=headers,
+            timeout=timeout,
+            model=BugoutJournalPermissions,
         )
-        return BugoutJournalPermissions(**result)
 
     def get_journal_scopes(
-        self, token: Union[str, uuid.UUID], journal_id: Union[str, uuid.UUID]
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
     ) -> BugoutJournalScopeSpecs:
         journal_scopes_path = f"journals/{journal_id}/scopes"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.get, path=journal_scopes_path, headers=headers
+        return self._call(
+            method=Method.get,
+            path=journal_scopes_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutJournalScopeSpecs,
         )
-        return BugoutJournalScopeSpecs(**result)
 
     def update_journal_scopes(
         self,
@@ -117,6 +174,7 @@ class Journal:
         holder_type: HolderType,
         holder_id: Union[str, uuid.UUID],
         permission_list: List[str],
+        timeout: Optional[float] = None,
     ) -> BugoutJournalScopeSpecs:
         journal_scopes_path = f"journals/{journal_id}/scopes"
         json = {
@@ -127,10 +185,14 @@ class Journal:
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.post, path=journal_scopes_path, headers=headers, json=json
+        return self._call(
+            method=Method.post,
+            path=journal_scopes_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
+            model=BugoutJournalScopeSpecs,
         )
-        return BugoutJournalScopeSpecs(**result)
 
     def delete_journal_scopes(
         self,
@@ -139,6 +201,7 @@ class Journal:
         holder_type: HolderType,
         holder_id: Union[str, uuid.UUID],
         permission_list: List[str],
+        timeout: Optional[float] = None,
     ) -> BugoutJournalScopeSpecs:
         journal_scopes_path = f"journals/{journal_id}/scopes"
         json = {
@@ -149,10 +212,14 @@ class Journal:
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.delete, path=journal_scopes_path, headers=headers, json=json
+        return self._call(
+            method=Method.delete,
+            path=journal_scopes_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
+            model=BugoutJournalScopeSpecs,
         )
-        return BugoutJournalScopeSpecs(**result)
 
     # Journal module
     def create_journal(
@@ -160,37 +227,80 @@ class Journal:
         token: Union[str, uuid.UUID],
         name: str,
         journal_type: JournalTypes,
+        timeout: Optional[float] = None,
     ) -> BugoutJournal:
         journal_path = "journals/"
         json = {"name": name, "journal_type": journal_type.value}
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.post, path=journal_path, headers=headers, json=json
+        return self._call(
+            method=Method.post,
+            path=journal_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
+            model=BugoutJournal,
         )
-        return BugoutJournal(**result)
 
-    def list_journals(self, token: Union[str, uuid.UUID]) -> BugoutJournals:
+    def list_journals(
+        self, token: Union[str, uuid.UUID], timeout: Optional[float] = None
+    ) -> BugoutJournals:
         journal_path = "journals/"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(method=Method.get, path=journal_path, headers=headers)
-        return BugoutJournals(**result)
+        return self._call(
+            method=Method.get,
+            path=journal_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutJournals,
+        )
+
+    def stream_journals(
+        self, token: Union[str, uuid.UUID], timeout: Optional[float] = None
+    ) -> Iterator[BugoutJournal]:
+        """
+        Same as list_journals, but decodes journals one by one as response arrives.
+        """
+        journal_path = "journals/"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        for journal in self._stream(
+            method=Method.get,
+            path=journal_path,
+            key="journals",
+            headers=headers,
+            timeout=timeout,
+        ):
+            yield decode(BugoutJournal, journal, validate=not self.fast_decode)
 
     def get_journal(
-        self, token: Union[str, uuid.UUID], journal_id: Union[str, uuid.UUID]
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
     ) -> BugoutJournal:
         journal_id_path = f"journals/{journal_id}"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(method=Method.get, path=journal_id_path, headers=headers)
-        return BugoutJournal(**result)
+        return self._call(
+            method=Method.get,
+            path=journal_id_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutJournal,
+        )
 
     def update_journal(
-        self, token: Union[str, uuid.UUID], journal_id: Union[str, uuid.UUID], name: str
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        name: str,
+        timeout: Optional[float] = None,
     ) -> BugoutJournal:
         journal_id_path = f"journals/{journal_id}"
         json = {
@@ -199,20 +309,32 @@ class Journal:
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.put, path=journal_id_path, headers=headers, json=json
+        return self._call(
+            method=Method.put,
+            path=journal_id_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
+            model=BugoutJournal,
         )
-        return BugoutJournal(**result)
 
     def delete_journal(
-        self, token: Union[str, uuid.UUID], journal_id: Union[str, uuid.UUID]
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
     ) -> BugoutJournal:
         journal_id_path = f"journals/{journal_id}"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(method=Method.delete, path=journal_id_path, headers=headers)
-        return BugoutJournal(**result)
+        return self._call(
+            method=Method.delete,
+            path=journal_id_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutJournal,
+        )
 
     # Entry module
     def create_entry(
@@ -225,6 +347,7 @@ class Journal:
         context_url: Optional[str] = None,
         context_id: Optional[str] = None,
         context_type: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> BugoutJournalEntry:
         entry_path = f"journals/{journal_id}/entries"
         json = {
@@ -238,16 +361,21 @@ class Journal:
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.post, path=entry_path, headers=headers, json=json
+        return self._call(
+            method=Method.post,
+            path=entry_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
+            model=BugoutJournalEntry,
         )
-        return BugoutJournalEntry(**result)
 
     def create_entries_pack(
         self,
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
         entries: BugoutJournalEntriesRequest,
+        timeout: Optional[float] = None,
     ) -> BugoutJournalEntries:
         entry_path = f"journals/{journal_id}/bulk"
         headers = {
@@ -266,48 +394,111 @@ class Journal:
                 for entry in entries.entries
             ]
         }
-        result = self._call(
-            method=Method.post, path=entry_path, headers=headers, json=json
+        return self._call(
+            method=Method.post,
+            path=entry_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
+            model=BugoutJournalEntries,
         )
-        return BugoutJournalEntries(**result)
 
     def get_entry(
         self,
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
         entry_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
     ) -> BugoutJournalEntry:
         entry_id_path = f"journals/{journal_id}/entries/{entry_id}"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(method=Method.get, path=entry_id_path, headers=headers)
-        return BugoutJournalEntry(**result)
+        return self._call(
+            method=Method.get,
+            path=entry_id_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutJournalEntry,
+        )
 
     def get_entries(
-        self, token: Union[str, uuid.UUID], journal_id: Union[str, uuid.UUID]
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
     ) -> BugoutJournalEntries:
         entry_path = f"journals/{journal_id}/entries"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(method=Method.get, path=entry_path, headers=headers)
-        return BugoutJournalEntries(**result)
+        return self._call(
+            method=Method.get,
+            path=entry_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutJournalEntries,
+        )
+
+    def stream_entries(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> Iterator[BugoutJournalEntry]:
+        """
+        Same as get_entries, but decodes entries one by one as response arrives, so only
+        one entry is kept in memory at a time.
+        """
+        entry_path = f"journals/{journal_id}/entries"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        for entry in self._stream(
+            method=Method.get,
+            path=entry_path,
+            key="entries",
+            headers=headers,
+            timeout=timeout,
+        ):
+            yield decode(BugoutJournalEntry, entry, validate=not self.fast_decode)
+
+    def get_entries_view(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> JournalEntriesView:
+        """
+        Same as get_entries, but returns lightweight views over response.
+        """
+        entry_path = f"journals/{journal_id}/entries"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        result = self._call(
+            method=Method.get, path=entry_path, headers=headers, timeout=timeout
+        )
+        return JournalEntriesView(result)
 
     def get_entry_content(
         self,
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
         entry_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
     ) -> BugoutJournalEntryContent:
         entry_id_content_path = f"journals/{journal_id}/entries/{entry_id}/content"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.get, path=entry_id_content_path, headers=headers
+        return self._call(
+            method=Method.get,
+            path=entry_id_content_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutJournalEntryContent,
         )
-        return BugoutJournalEntryContent(**result)
 
     def update_entry_content(
         self,
@@ -318,6 +509,7 @@ class Journal:
         content: str,
         tags: Optional[List[str]] = None,
         tags_action: TagsAction = TagsAction.merge,
+        timeout: Optional[float] = None,
     ) -> BugoutJournalEntryContent:
         entry_id_content_path = f"journals/{journal_id}/entries/{entry_id}/content"
         params: Dict[str, str] = {}
@@ -331,37 +523,49 @@ class Journal:
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
+        return self._call(
             method=Method.put,
             path=entry_id_content_path,
             headers=headers,
             json=json,
             params=params,
+            timeout=timeout,
+            model=BugoutJournalEntryContent,
         )
-        return BugoutJournalEntryContent(**result)
 
     def delete_entry(
         self,
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
         entry_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
     ) -> BugoutJournalEntry:
         entry_id_path = f"journals/{journal_id}/entries/{entry_id}"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(method=Method.delete, path=entry_id_path, headers=headers)
-        return BugoutJournalEntry(**result)
+        return self._call(
+            method=Method.delete,
+            path=entry_id_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutJournalEntry,
+        )
 
     # Tags module
     def get_most_used_tags(
-        self, token: Union[str, uuid.UUID], journal_id: Union[str, uuid.UUID]
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
     ) -> List[Any]:
         tags_path = f"journals/{journal_id}/tags"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(method=Method.get, path=tags_path, headers=headers)
+        result = self._call(
+            method=Method.get, path=tags_path, headers=headers, timeout=timeout
+        )
         return result
 
     def create_tags(
@@ -370,6 +574,7 @@ class Journal:
         journal_id: Union[str, uuid.UUID],
         entry_id: Union[str, uuid.UUID],
         tags: List[str],
+        timeout: Optional[float] = None,
     ) -> List[Any]:
         tags_path = f"journals/{journal_id}/entries/{entry_id}/tags"
         json = {"tags": tags}
@@ -377,7 +582,11 @@ class Journal:
             "Authorization": f"Bearer {token}",
         }
         result = self._call(
-            method=Method.post, path=tags_path, headers=headers, json=json
+            method=Method.post,
+            path=tags_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
         )
         return result
 
@@ -386,13 +595,19 @@ class Journal:
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
         entry_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
     ) -> BugoutJournalEntryTags:
         tags_path = f"journals/{journal_id}/entries/{entry_id}/tags"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(method=Method.get, path=tags_path, headers=headers)
-        return BugoutJournalEntryTags(**result)
+        return self._call(
+            method=Method.get,
+            path=tags_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutJournalEntryTags,
+        )
 
     def update_tags(
         self,
@@ -400,6 +615,7 @@ class Journal:
         journal_id: Union[str, uuid.UUID],
         entry_id: Union[str, uuid.UUID],
         tags: List[str],
+        timeout: Optional[float] = None,
     ) -> List[Any]:
         tags_path = f"journals/{journal_id}/entries/{entry_id}/tags"
         json = {"tags": tags}
@@ -407,7 +623,11 @@ class Journal:
             "Authorization": f"Bearer {token}",
         }
         result = self._call(
-            method=Method.put, path=tags_path, headers=headers, json=json
+            method=Method.put,
+            path=tags_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
         )
         return result
 
@@ -417,19 +637,24 @@ class Journal:
         journal_id: Union[str, uuid.UUID],
         entry_id: Union[str, uuid.UUID],
         tag: str,
+        timeout: Optional[float] = None,
     ) -> BugoutJournalEntryTags:
         tags_path = f"journals/{journal_id}/entries/{entry_id}/tags"
         json = {"tag": tag}
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.delete, path=tags_path, headers=headers, json=json
+        return self._call(
+            method=Method.delete,
+            path=tags_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
+            model=BugoutJournalEntryTags,
         )
-        return BugoutJournalEntryTags(**result)
 
     # Search module
-    def search(
+    def _search(
         self,
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
@@ -439,7 +664,8 @@ class Journal:
         offset: int = 0,
         content: bool = True,
         order: SearchOrder = SearchOrder.DESCENDING,
-    ) -> BugoutSearchResults:
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
         search_path = f"journals/{journal_id}/search"
         headers = {
             "Authorization": f"Bearer {token}",
@@ -453,13 +679,170 @@ class Journal:
             "order": order.value,
         }
         result = self._call(
-            method=Method.get, path=search_path, params=query_params, headers=headers
+            method=Method.get,
+            path=search_path,
+            params=query_params,
+            headers=headers,
+            timeout=timeout,
+        )
+        return result
+
+    def search(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        query: str,
+        filters: Optional[List[str]] = None,
+        limit: int = 10,
+        offset: int = 0,
+        content: bool = True,
+        order: SearchOrder = SearchOrder.DESCENDING,
+        timeout: Optional[float] = None,
+    ) -> BugoutSearchResults:
+        result = self._search(
+            token=token,
+            journal_id=journal_id,
+            query=query,
+            filters=filters,
+            limit=limit,
+            offset=offset,
+            content=content,
+            order=order,
+            timeout=timeout,
+        )
+        return decode(BugoutSearchResults, result, validate=not self.fast_decode)
+
+    def search_view(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        query: str,
+        filters: Optional[List[str]] = None,
+        limit: int = 10,
+        offset: int = 0,
+        content: bool = True,
+        order: SearchOrder = SearchOrder.DESCENDING,
+        timeout: Optional[float] = None,
+    ) -> SearchResultsView:
+        """
+        Same as search, but returns lightweight views over response.
+        """
+        result = self._search(
+            token=token,
+            journal_id=journal_id,
+            query=query,
+            filters=filters,
+            limit=limit,
+            offset=offset,
+            content=content,
+            order=order,
+            timeout=timeout,
         )
-        return BugoutSearchResults(**result)
+        return SearchResultsView(result)
+
+    def iter_search(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        query: str,
+        filters: Optional[List[str]] = None,
+        page_size: int = 100,
+        offset: int = 0,
+        content: bool = True,
+        order: SearchOrder = SearchOrder.DESCENDING,
+        prefetch: bool = False,
+        timeout: Optional[float] = None,
+    ) -> Iterator[BugoutSearchResult]:
+        """
+        Lazily yields search results page by page following next_offset.
+
+        With prefetch next page is requested in background thread while current page
+        is consumed, so at most two pages are kept in memory.
+        """
+
+        def fetch_page(page_offset: int) -> BugoutSearchResults:
+            return self.search(
+                token=token,
+                journal_id=journal_id,
+                query=query,
+                filters=filters,
+                limit=page_size,
+                offset=page_offset,
+                content=content,
+                order=order,
+                timeout=timeout,
+            )
+
+        return self._iter_pages(fetch_page, offset, prefetch)
+
+    def iter_search_view(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        query: str,
+        filters: Optional[List[str]] = None,
+        page_size: int = 100,
+        offset: int = 0,
+        content: bool = True,
+        order: SearchOrder = SearchOrder.DESCENDING,
+        prefetch: bool = False,
+        timeout: Optional[float] = None,
+    ) -> Iterator[SearchResultView]:
+        """
+        Same as iter_search, but yields lightweight views over search results.
+        """
+
+        def fetch_page(page_offset: int) -> SearchResultsView:
+            return self.search_view(
+                token=token,
+                journal_id=journal_id,
+                query=query,
+                filters=filters,
+                limit=page_size,
+                offset=page_offset,
+                content=content,
+                order=order,
+                timeout=timeout,
+            )
+
+        return self._iter_pages(fetch_page, offset, prefetch)
+
+    def _iter_pages(
+        self,
+        fetch_page: Callable[[int], Any],
+        offset: int,
+        prefetch: bool,
+    ) -> Iterator[Any]:
+        if not prefetch:
+            next_offset: Optional[int] = offset
+            while next_offset is not None:
+                page = fetch_page(next_offset)
+                if not page.results:
+                    return
+                next_offset = page.next_offset
+                yield from page.results
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_page: Optional["Future[Any]"] = executor.submit(fetch_page, offset)
+            try:
+                while next_page is not None:
+                    page = next_page.result()
+                    next_page = None
+                    if page.results and page.next_offset is not None:
+                        next_page = executor.submit(fetch_page, page.next_offset)
+                    yield from page.results
+            finally:
+                if next_page is not None:
+                    next_page.cancel()
 
     # Public module
-    def check_journal_public(self, journal_id: Union[str, uuid.UUID]) -> bool:
+    def check_journal_public(
+        self, journal_id: Union[str, uuid.UUID], timeout: Optional[float] = None
+    ) -> bool:
         journal_path = "public/check"
         query_params = {"journal_id": journal_id}
-        result = self._call(method=Method.get, path=journal_path, params=query_params)
+        result = self._call(
+            method=Method.get, path=journal_path, params=query_params, timeout=timeout
+        )
         return result
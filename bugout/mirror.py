@@ -0,0 +1,398 @@
+"""
+Local SQLite replica of journal answering search queries without Spire.
+"""
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Iterable, List, Optional, Tuple, Union
+import uuid
+
+from .columnar import timestamp_us
+from .data import BugoutSearchResult, BugoutSearchResults
+from .exceptions import (
+    BugoutResponseException,
+    BugoutUnexpectedResponse,
+    MirrorUnsupportedQuery,
+)
+from .incremental import ChangeKind, EntryChange, JournalSyncReport, sync_journal
+from .journal import Journal, SearchOrder
+
+logger = logging.getLogger(__name__)
+
+RANGE_TERM = re.compile(
+    r"^(?P<field>created_at|updated_at):(?P<op>>=|<=|>|<)(?P<value>\d+(\.\d+)?)$"
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    entry_id TEXT NOT NULL UNIQUE,
+    entry_url TEXT NOT NULL,
+    content_url TEXT NOT NULL,
+    title TEXT NOT NULL,
+    content TEXT,
+    tags TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    created_at_us INTEGER NOT NULL,
+    updated_at_us INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_created_at ON entries (created_at_us, id);
+CREATE TABLE IF NOT EXISTS tags (
+    tag TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    PRIMARY KEY (tag, id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS tags_id ON tags (id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _fts_available(connection: sqlite3.Connection) -> bool:
+    try:
+        connection.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(title, content)"
+        )
+    except sqlite3.OperationalError:
+        return False
+    return True
+
+
+class JournalMirror:
+    """
+    Replica of journal in SQLite database at path, kept fresh with sync_journal.
+
+    Tags are indexed in tags table, title and content in FTS5 table if SQLite is built
+    with it, otherwise words are matched with LIKE. search() accepts the same queries as
+    Journal.search for tag:<tag>, !tag:<tag>, created_at and updated_at range terms and
+    plain words. Other queries, and all queries before the first refresh, are sent to
+    Spire if fallback is True.
+
+    Mirror is refreshed before search when it is older than refresh_interval seconds,
+    set refresh_interval to None to refresh only by calling refresh(). Local results
+    have score 1.0, ordering follows order by created_at as in Spire. If refresh before
+    search fails, error is logged and kept in refresh_error, search is answered from
+    the mirror as it is and refresh is retried after refresh_interval.
+
+    Sync state is stored in database together with entries, {path}.sync file is only
+    working copy for sync_journal, so database and state can not diverge after crash.
+    """
+
+    def __init__(
+        self,
+        journal: Journal,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        path: str,
+        refresh_interval: Optional[float] = 60.0,
+        reconcile_interval: float = 24 * 60 * 60,
+        page_size: int = 100,
+        fallback: bool = True,
+        timeout: Optional[float] = None,
+    ) -> None:
+        self.journal = journal
+        self.token = token
+        self.journal_id = str(journal_id)
+        self.path = path
+        self.refresh_interval = refresh_interval
+        self.reconcile_interval = reconcile_interval
+        self.page_size = page_size
+        self.fallback = fallback
+        self.timeout = timeout
+
+        self.local_hits = 0
+        self.fallbacks = 0
+        self.refresh_errors = 0
+        self.refresh_error: Optional[Exception] = None
+
+        self._state_path = f"{path}.sync"
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.executescript(SCHEMA)
+            self._fts = _fts_available(self._connection)
+        self._refreshed_at: Optional[float] = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "JournalMirror":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self._connection.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    def _restore_sync_state(self) -> None:
+        sync_state = self._meta("sync_state")
+        if sync_state is None:
+            if os.path.exists(self._state_path):
+                os.remove(self._state_path)
+            return
+        state_tmp_path = f"{self._state_path}.tmp"
+        with open(state_tmp_path, "w") as ofp:
+            ofp.write(sync_state)
+        os.replace(state_tmp_path, self._state_path)
+
+    def _upsert(self, result: BugoutSearchResult, entry_id: str) -> None:
+        self._connection.execute(
+            """
+            INSERT INTO entries (
+                entry_id, entry_url, content_url, title, content, tags, created_at,
+                updated_at, created_at_us, updated_at_us
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (entry_id) DO UPDATE SET
+                entry_url = excluded.entry_url,
+                content_url = excluded.content_url,
+                title = excluded.title,
+                content = excluded.content,
+                tags = excluded.tags,
+                created_at = excluded.created_at,
+                updated_at = excluded.updated_at,
+                created_at_us = excluded.created_at_us,
+                updated_at_us = excluded.updated_at_us
+            """,
+            (
+                entry_id,
+                result.entry_url,
+                result.content_url,
+                result.title,
+                result.content,
+                json.dumps(result.tags),
+                result.created_at,
+                result.updated_at,
+                timestamp_us(result.created_at),
+                timestamp_us(result.updated_at),
+            ),
+        )
+        # Id is selected separately, RETURNING needs SQLite 3.35
+        (row_id,) = self._connection.execute(
+            "SELECT id FROM entries WHERE entry_id = ?", (entry_id,)
+        ).fetchone()
+        self._connection.execute("DELETE FROM tags WHERE id = ?", (row_id,))
+        self._connection.executemany(
+            "INSERT OR IGNORE INTO tags (tag, id) VALUES (?, ?)",
+            [(tag, row_id) for tag in result.tags],
+        )
+        if self._fts:
+            self._connection.execute(
+                "DELETE FROM entries_fts WHERE rowid = ?", (row_id,)
+            )
+            self._connection.execute(
+                "INSERT INTO entries_fts (rowid, title, content) VALUES (?, ?, ?)",
+                (row_id, result.title, result.content),
+            )
+
+    def _delete(self, entry_id: str) -> None:
+        row = self._connection.execute(
+            "SELECT id FROM entries WHERE entry_id = ?", (entry_id,)
+        ).fetchone()
+        if row is None:
+            return
+        self._connection.execute("DELETE FROM tags WHERE id = ?", row)
+        if self._fts:
+            self._connection.execute("DELETE FROM entries_fts WHERE rowid = ?", row)
+        self._connection.execute("DELETE FROM entries WHERE id = ?", row)
+
+    def _apply(self, change: EntryChange) -> None:
+        if change.kind == ChangeKind.deleted:
+            self._delete(change.entry_id)
+        elif change.entry is not None:
+            self._upsert(change.entry, change.entry_id)
+
+    def _known_entries(self) -> Iterable[Tuple[str, str]]:
+        return self._connection.execute("SELECT entry_id, updated_at FROM entries")
+
+    def refresh(self, reconcile: bool = False) -> JournalSyncReport:
+        """
+        Pulls changes of journal since previous refresh into mirror.
+        """
+        with self._lock:
+            self._restore_sync_state()
+            # Changes are applied as pages arrive and committed together with state
+            with self._connection:
+                report = sync_journal(
+                    self.journal,
+                    self.token,
+                    self.journal_id,
+                    self._state_path,
+                    content=True,
+                    page_size=self.page_size,
+                    reconcile_interval=self.reconcile_interval,
+                    reconcile=reconcile,
+                    on_change=self._apply,
+                    known_entries=self._known_entries,
+                    timeout=self.timeout,
+                )
+                with open(self._state_path) as ifp:
+                    sync_state = ifp.read()
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    ("sync_state", sync_state),
+                )
+            self._refreshed_at = time.monotonic()
+            return report
+
+    def _where(self, terms: List[str]) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        words: List[str] = []
+        for term in terms:
+            range_term = RANGE_TERM.match(term)
+            if range_term is not None:
+                clauses.append(f"{range_term['field']}_us {range_term['op']} ?")
+                params.append(int(float(range_term["value"]) * 1_000_000))
+            elif term.startswith("tag:"):
+                clauses.append("id IN (SELECT id FROM tags WHERE tag = ?)")
+                params.append(term[4:])
+            elif term.startswith("!tag:"):
+                clauses.append("id NOT IN (SELECT id FROM tags WHERE tag = ?)")
+                params.append(term[5:])
+            elif ":" in term:
+                raise MirrorUnsupportedQuery(f"Unsupported search term: {term}")
+            else:
+                words.append(term)
+        if words and self._fts:
+            clauses.append(
+                "id IN (SELECT rowid FROM entries_fts WHERE entries_fts MATCH ?)"
+            )
+            params.append(
+                " ".join('"{}"'.format(word.replace('"', '""')) for word in words)
+            )
+        else:
+            for word in words:
+                clauses.append("(title LIKE ? OR content LIKE ?)")
+                params.extend([f"%{word}%", f"%{word}%"])
+        return (" AND ".join(clauses) if clauses else "1"), params
+
+    def search_local(
+        self,
+        query: str,
+        filters: Optional[List[str]] = None,
+        limit: int = 10,
+        offset: int = 0,
+        content: bool = True,
+        order: SearchOrder = SearchOrder.DESCENDING,
+    ) -> BugoutSearchResults:
+        """
+        Answers query from mirror only, raises MirrorUnsupportedQuery if it can not.
+        """
+        terms = query.split() + (filters if filters is not None else [])
+        where, params = self._where(terms)
+        direction = "ASC" if order == SearchOrder.ASCENDING else "DESC"
+        with self._lock:
+            (total_results,) = self._connection.execute(
+                f"SELECT COUNT(*) FROM entries WHERE {where}", params
+            ).fetchone()
+            rows = self._connection.execute(
+                f"""
+                SELECT entry_url, content_url, title, {"content" if content else "NULL"},
+                    tags, created_at, updated_at
+                FROM entries WHERE {where}
+                ORDER BY created_at_us {direction}, id {direction}
+                LIMIT ? OFFSET ?
+                """,
+                params + [limit, offset],
+            ).fetchall()
+        results = [
+            BugoutSearchResult(
+                entry_url=entry_url,
+                content_url=content_url,
+                title=title,
+                content=entry_content,
+                tags=json.loads(tags),
+                created_at=created_at,
+                updated_at=updated_at,
+                score=1.0,
+            )
+            for (
+                entry_url,
+                content_url,
+                title,
+                entry_content,
+                tags,
+                created_at,
+                updated_at,
+            ) in rows
+        ]
+        return BugoutSearchResults(
+            total_results=total_results,
+            offset=offset,
+            next_offset=offset + limit if offset + limit < total_results else None,
+            max_score=1.0 if results else 0.0,
+            results=results,
+        )
+
+    def search(
+        self,
+        query: str,
+        filters: Optional[List[str]] = None,
+        limit: int = 10,
+        offset: int = 0,
+        content: bool = True,
+        order: SearchOrder = SearchOrder.DESCENDING,
+    ) -> BugoutSearchResults:
+        """
+        Same as Journal.search of mirrored journal, answered locally when possible.
+        """
+        with self._lock:
+            synced = self._meta("sync_state") is not None
+            if synced and self._refreshed_at is None:
+                self._refreshed_at = time.monotonic()
+            if self.refresh_interval is not None and (
+                self._refreshed_at is None
+                or time.monotonic() - self._refreshed_at >= self.refresh_interval
+            ):
+                try:
+                    self.refresh()
+                    self.refresh_error = None
+                    synced = True
+                except (BugoutResponseException, BugoutUnexpectedResponse) as e:
+                    logger.warning(
+                        "Refresh of journal mirror %s failed: %s", self.path, e
+                    )
+                    self.refresh_errors += 1
+                    self.refresh_error = e
+                    self._refreshed_at = time.monotonic()
+        try:
+            if not synced:
+                raise MirrorUnsupportedQuery("Mirror was not refreshed yet")
+            results = self.search_local(
+                query,
+                filters=filters,
+                limit=limit,
+                offset=offset,
+                content=content,
+                order=order,
+            )
+            self.local_hits += 1
+            return results
+        except MirrorUnsupportedQuery:
+            if not self.fallback:
+                raise
+        self.fallbacks += 1
+        return self.journal.search(
+            token=self.token,
+            journal_id=self.journal_id,
+            query=query,
+            filters=filters,
+            limit=limit,
+            offset=offset,
+            content=content,
+            order=order,
+            timeout=self.timeout,
+        )
@@ -0,0 +1,70 @@
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+
+class RateLimiter:
+    """
+    Base class for client side rate limiters applied by transport before each request.
+    """
+
+    def reserve(self) -> float:
+        """
+        Reserves permission for one request and returns number of seconds to wait before
+        sending it.
+        """
+        raise NotImplementedError
+
+    def acquire(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class TokenBucket(RateLimiter):
+    """
+    Allows rate requests per second on average with bursts up to burst requests.
+
+    Tokens are reserved under lock and never awaited while holding it, so one bucket
+    can be shared by threads and by coroutines of event loop. Waiting callers are
+    served in order of reservation.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None) -> None:
+        if rate <= 0:
+            raise ValueError("Rate should be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(int(rate), 1)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+def find_rate_limiter(
+    rate_limiters: Dict[str, RateLimiter], url: str
+) -> Optional[RateLimiter]:
+    """
+    Returns rate limiter registered for API base url which url belongs to.
+    """
+    for base_url, rate_limiter in rate_limiters.items():
+        if url == base_url or url.startswith(f"{base_url}/"):
+            return rate_limiter
+    return None
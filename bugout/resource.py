@@ -1,10 +1,13 @@
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterator, Optional, Type, Union
 import uuid
 
-from .calls import make_request
+from pydantic import BaseModel
+
 from .data import Method, BugoutResource, BugoutResources
+from .decode import decode
 from .exceptions import InvalidUrlSpec
 from .settings import REQUESTS_TIMEOUT
+from .transport import Transport
 
 
 class Resource:
@@ -13,23 +16,61 @@ class Resource:
     """
 
     def __init__(
-        self, url: Optional[str] = None, timeout: float = REQUESTS_TIMEOUT
+        self,
+        url: Optional[str] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+        transport: Optional[Transport] = None,
+        fast_decode: bool = False,
     ) -> None:
         if url is None:
             raise InvalidUrlSpec("Invalid brood url specified")
         self.url = url
         self.timeout = timeout
+        self.transport = transport if transport is not None else Transport()
+        self.fast_decode = fast_decode
 
-    def _call(self, method: Method, path: str, **kwargs):
+    def _call(
+        self,
+        method: Method,
+        path: str,
+        timeout: Optional[float] = None,
+        model: Optional[Type[BaseModel]] = None,
+        **kwargs,
+    ):
         url = f"{self.url.rstrip('/')}/{path}"
-        result = make_request(method=method, url=url, timeout=self.timeout, **kwargs)
+        result = self.transport.request(
+            method=method,
+            url=url,
+            model=model,
+            validate=not self.fast_decode,
+            timeout=timeout if timeout is not None else self.timeout,
+            **kwargs,
+        )
         return result
 
+    def _stream(
+        self,
+        method: Method,
+        path: str,
+        key: str,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> Iterator[Any]:
+        url = f"{self.url.rstrip('/')}/{path}"
+        yield from self.transport.stream(
+            method=method,
+            url=url,
+            key=key,
+            timeout=timeout if timeout is not None else self.timeout,
+            **kwargs,
+        )
+
     def create_resource(
         self,
         token: Union[str, uuid.UUID],
         application_id: Union[str, uuid.UUID],
         resource_data: Dict[str, Any],
+        timeout: Optional[float] = None,
     ) -> BugoutResource:
         resources_path = "resources/"
         headers = {
@@ -39,63 +80,109 @@ class Resource:
             "application_id": application_id,
             "resource_data": resource_data,
         }
-        result = self._call(
-            method=Method.post, path=resources_path, headers=headers, json=json_data
+        return self._call(
+            method=Method.post,
+            path=resources_path,
+            headers=headers,
+            json=json_data,
+            timeout=timeout,
+            model=BugoutResource,
         )
-        return BugoutResource(**result)
 
     def get_resource(
         self,
         token: Union[str, uuid.UUID],
         resource_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
     ) -> BugoutResource:
         resources_path = f"resources/{resource_id}"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(method=Method.get, path=resources_path, headers=headers)
-        return BugoutResource(**result)
+        return self._call(
+            method=Method.get,
+            path=resources_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutResource,
+        )
 
     def list_resources(
         self,
         token: Union[str, uuid.UUID],
         params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
     ) -> BugoutResources:
         resources_path = "resources/"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.get, path=resources_path, params=params, headers=headers
+        return self._call(
+            method=Method.get,
+            path=resources_path,
+            params=params,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutResources,
         )
-        return BugoutResources(**result)
+
+    def stream_resources(
+        self,
+        token: Union[str, uuid.UUID],
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[BugoutResource]:
+        """
+        Same as list_resources, but decodes resources one by one as response arrives.
+        """
+        resources_path = "resources/"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        for resource in self._stream(
+            method=Method.get,
+            path=resources_path,
+            key="resources",
+            params=params,
+            headers=headers,
+            timeout=timeout,
+        ):
+            yield decode(BugoutResource, resource, validate=not self.fast_decode)
 
     def update_resource(
         self,
         token: Union[str, uuid.UUID],
         resource_id: Union[str, uuid.UUID],
         resource_data_update: Dict[str, Any],
+        timeout: Optional[float] = None,
     ) -> BugoutResource:
         resources_path = f"resources/{resource_id}"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
+        return self._call(
             method=Method.put,
             path=resources_path,
             headers=headers,
             json=resource_data_update,
+            timeout=timeout,
+            model=BugoutResource,
         )
-        return BugoutResource(**result)
 
     def delete_resource(
         self,
         token: Union[str, uuid.UUID],
         resource_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
     ) -> BugoutResource:
         resources_path = f"resources/{resource_id}"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(method=Method.delete, path=resources_path, headers=headers)
-        return BugoutResource(**result)
+        return self._call(
+            method=Method.delete,
+            path=resources_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutResource,
+        )
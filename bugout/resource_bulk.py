@@ -0,0 +1,193 @@
+"""
+Bulk create, update and delete of resources.
+
+Brood API takes one resource per request, so bulk operations are pipelined as single
+requests over pooled connections of the resource client with bounded concurrency. Keep
+concurrency at or below pool_maxsize of transport, connections above it are not kept
+alive.
+"""
+
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+import uuid
+
+from pydantic import BaseModel, Field
+
+from .batch import BatchResult, BulkReport, run_batch
+from .resource import Resource
+
+
+class ResourceUpdate(BaseModel):
+    resource_id: Union[str, uuid.UUID]
+    update: Dict[str, Any]
+    drop_keys: List[str] = Field(default_factory=list)
+
+
+class ResourceOperationResult(BaseModel):
+    position: int
+    resource_id: Optional[str] = None
+    succeeded: bool
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+
+
+class BulkResourceReport(BulkReport):
+    # Filled only when keep_results is True
+    results: List[ResourceOperationResult] = Field(default_factory=list)
+
+
+ProgressCallback = Callable[[BulkResourceReport], None]
+
+
+def _result(item: BatchResult) -> ResourceOperationResult:
+    if item.succeeded:
+        return ResourceOperationResult(
+            position=item.position, resource_id=str(item.result.id), succeeded=True
+        )
+    resource_id = item.kwargs.get("resource_id")
+    return ResourceOperationResult(
+        position=item.position,
+        resource_id=str(resource_id) if resource_id is not None else None,
+        succeeded=False,
+        status_code=getattr(item.error, "status_code", None),
+        error=str(item.error),
+    )
+
+
+def _run(
+    fn: Callable[..., Any],
+    calls: Iterable[Dict[str, Any]],
+    concurrency: int,
+    keep_results: bool,
+    progress_every: int,
+    on_progress: Optional[ProgressCallback],
+) -> BulkResourceReport:
+    if progress_every < 1:
+        raise ValueError("progress_every should be at least 1")
+
+    report = BulkResourceReport()
+    started_at = time.monotonic()
+    for item in run_batch(fn, calls, concurrency=concurrency):
+        report.record(item.succeeded, getattr(item.error, "status_code", None))
+        if keep_results:
+            report.results.append(_result(item))
+        if on_progress is not None and report.total % progress_every == 0:
+            report.elapsed_seconds = time.monotonic() - started_at
+            on_progress(report)
+
+    report.elapsed_seconds = time.monotonic() - started_at
+    return report
+
+
+def _resource_update(update: Union[ResourceUpdate, Tuple]) -> ResourceUpdate:
+    if isinstance(update, ResourceUpdate):
+        return update
+    resource_id, data, *drop_keys = update
+    return ResourceUpdate(
+        resource_id=resource_id,
+        update=data,
+        drop_keys=drop_keys[0] if drop_keys else [],
+    )
+
+
+def bulk_create_resources(
+    resource: Resource,
+    token: Union[str, uuid.UUID],
+    application_id: Union[str, uuid.UUID],
+    resources_data: Iterable[Dict[str, Any]],
+    concurrency: int = 8,
+    keep_results: bool = False,
+    progress_every: int = 1000,
+    on_progress: Optional[ProgressCallback] = None,
+    timeout: Optional[float] = None,
+) -> BulkResourceReport:
+    """
+    Creates resource of application for each of resources_data with up to concurrency
+    requests in flight.
+
+    Failed operations do not stop the rest, failures are counted by response status.
+    With keep_results, report also holds result of each operation in order of
+    resources_data with id of created resource. on_progress is called with report
+    after every progress_every operations.
+    """
+    calls = (
+        {
+            "token": token,
+            "application_id": application_id,
+            "resource_data": resource_data,
+            "timeout": timeout,
+        }
+        for resource_data in resources_data
+    )
+    return _run(
+        resource.create_resource,
+        calls,
+        concurrency,
+        keep_results,
+        progress_every,
+        on_progress,
+    )
+
+
+def bulk_update_resources(
+    resource: Resource,
+    token: Union[str, uuid.UUID],
+    updates: Iterable[Union[ResourceUpdate, Tuple]],
+    concurrency: int = 8,
+    keep_results: bool = False,
+    progress_every: int = 1000,
+    on_progress: Optional[ProgressCallback] = None,
+    timeout: Optional[float] = None,
+) -> BulkResourceReport:
+    """
+    Applies updates (resource_id, update, drop_keys) to resources, update is merged into
+    resource data and drop_keys are removed from it. Reports the same way as
+    bulk_create_resources.
+    """
+    calls = (
+        {
+            "token": token,
+            "resource_id": update.resource_id,
+            "resource_data_update": {
+                "update": update.update,
+                "drop_keys": update.drop_keys,
+            },
+            "timeout": timeout,
+        }
+        for update in (_resource_update(update) for update in updates)
+    )
+    return _run(
+        resource.update_resource,
+        calls,
+        concurrency,
+        keep_results,
+        progress_every,
+        on_progress,
+    )
+
+
+def bulk_delete_resources(
+    resource: Resource,
+    token: Union[str, uuid.UUID],
+    resource_ids: Iterable[Union[str, uuid.UUID]],
+    concurrency: int = 8,
+    keep_results: bool = False,
+    progress_every: int = 1000,
+    on_progress: Optional[ProgressCallback] = None,
+    timeout: Optional[float] = None,
+) -> BulkResourceReport:
+    """
+    Deletes resources by id. Reports the same way as bulk_create_resources.
+    """
+    calls = (
+        {"token": token, "resource_id": resource_id, "timeout": timeout}
+        for resource_id in resource_ids
+    )
+    return _run(
+        resource.delete_resource,
+        calls,
+        concurrency,
+        keep_results,
+        progress_every,
+        on_progress,
+    )
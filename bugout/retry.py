@@ -0,0 +1,100 @@
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import random
+import threading
+from typing import Dict, Iterable, Optional
+
+from .data import Method
+
+RETRY_STATUSES = (429, 502, 503, 504)
+IDEMPOTENT_METHODS = (Method.get, Method.put, Method.delete)
+
+
+class RetryPolicy:
+    """
+    Decides which failed requests are retried and how long to wait before next attempt.
+
+    Requests are retried on connection errors and on responses with status from
+    statuses, only for idempotent methods by default. Delay grows exponentially
+    from backoff_factor up to backoff_max with full jitter, Retry-After header of
+    response is used instead when present.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.5,
+        backoff_max: float = 30.0,
+        jitter: bool = True,
+        statuses: Iterable[int] = RETRY_STATUSES,
+        methods: Iterable[Method] = IDEMPOTENT_METHODS,
+        respect_retry_after: bool = True,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts should be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(methods)
+        self.respect_retry_after = respect_retry_after
+
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.exhausted = 0
+        self.retries_by_reason: Dict[str, int] = {}
+
+    def should_retry(
+        self, method: Method, attempt: int, status_code: Optional[int] = None
+    ) -> bool:
+        """
+        Checks if request should be repeated after attempt (counted from 0) failed with
+        status_code, or with connection error if status_code is None.
+        """
+        if method not in self.methods:
+            return False
+        if status_code is not None and status_code not in self.statuses:
+            return False
+        reason = str(status_code) if status_code is not None else "connection_error"
+        with self._lock:
+            if attempt + 1 >= self.max_attempts:
+                self.exhausted += 1
+                return False
+            self.retries += 1
+            self.retries_by_reason[reason] = self.retries_by_reason.get(reason, 0) + 1
+        return True
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        if self.respect_retry_after and retry_after is not None:
+            retry_after_seconds = parse_retry_after(retry_after)
+            if retry_after_seconds is not None:
+                return min(retry_after_seconds, self.backoff_max)
+        backoff = min(self.backoff_factor * (2**attempt), self.backoff_max)
+        if self.jitter:
+            return random.uniform(0, backoff)
+        return backoff
+
+    def metrics(self) -> Dict[str, int]:
+        with self._lock:
+            metrics = {"retries": self.retries, "exhausted": self.exhausted}
+            for reason, count in self.retries_by_reason.items():
+                metrics[f"retries_{reason}"] = count
+        return metrics
+
+
+def parse_retry_after(retry_after: str) -> Optional[float]:
+    """
+    Parses Retry-After header value, either delay in seconds or HTTP date.
+    """
+    try:
+        return max(float(retry_after), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
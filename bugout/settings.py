@@ -12,3 +12,13 @@ except:
     raise Exception(
         f"Could not parse BUGOUT_REQUESTS_TIMEOUT environment variable as int: {REQUESTS_TIMEOUT_RAW}"
     )
+
+REQUESTS_POOL_MAXSIZE = 10
+REQUESTS_POOL_MAXSIZE_RAW = os.environ.get("BUGOUT_POOL_MAXSIZE")
+try:
+    if REQUESTS_POOL_MAXSIZE_RAW is not None:
+        REQUESTS_POOL_MAXSIZE = int(REQUESTS_POOL_MAXSIZE_RAW)
+except:
+    raise Exception(
+        f"Could not parse BUGOUT_POOL_MAXSIZE environment variable as int: {REQUESTS_POOL_MAXSIZE_RAW}"
+    )
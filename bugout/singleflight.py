@@ -0,0 +1,83 @@
+import json
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from .data import Method
+
+# Requests with body are never coalesced
+COALESCED_KWARGS = frozenset({"params", "headers", "timeout"})
+
+
+def request_key(method: Method, url: str, kwargs: Dict[str, Any]) -> Optional[str]:
+    """
+    Key of identical requests: same url, params, headers (including authorization) and
+    timeout, so caller never waits for request with longer timeout than its own.
+    Returns None for requests which should not be coalesced.
+    """
+    if method != Method.get or not COALESCED_KWARGS.issuperset(kwargs):
+        return None
+    return json.dumps(
+        [url, kwargs.get("params"), kwargs.get("headers"), kwargs.get("timeout")],
+        sort_keys=True,
+        default=str,
+    )
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Runs one call at a time per key, concurrent callers with the same key wait for it and
+    get its result or exception.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.shared = 0
+
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                self.calls += 1
+                leader = True
+            else:
+                self.shared += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def metrics(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "calls": self.calls,
+                "shared": self.shared,
+            }
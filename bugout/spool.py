@@ -0,0 +1,395 @@
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple, Union
+import uuid
+
+from .data import BugoutJournalEntriesRequest, BugoutJournalEntryRequest
+from .exceptions import BugoutResponseException
+from .journal import Journal
+
+logger = logging.getLogger(__name__)
+
+SpoolErrorCallback = Callable[[Exception, str, List[Dict[str, Any]]], None]
+
+FSYNC_ALWAYS = "always"
+FSYNC_INTERVAL = "interval"
+FSYNC_NEVER = "never"
+
+SEGMENT_SUFFIX = ".segment"
+CURSOR_FILE = "cursor"
+
+# Rejections which will not succeed on retry, such batches are dropped
+NON_RETRIABLE_STATUSES = frozenset(range(400, 500)) - {408, 429}
+
+
+def _segment_seq(filename: str) -> Optional[int]:
+    if not filename.endswith(SEGMENT_SUFFIX):
+        return None
+    try:
+        return int(filename[: -len(SEGMENT_SUFFIX)])
+    except ValueError:
+        return None
+
+
+class JournalEntrySpool:
+    """
+    Durable write-ahead spool of journal entries shipped to Spire in background.
+
+    write() appends entry as JSON line to active segment file in directory, which takes
+    microseconds and does not depend on Spire availability. Background shipper reads
+    segments in order, sends entries with journals/{journal_id}/bulk requests and keeps
+    its position in cursor file, so entries not shipped before exit or crash are sent
+    after restart. Failed requests are retried with exponential backoff, batches
+    rejected by Spire with 4xx status are dropped and reported to on_error.
+
+    Delivery is at least once: entries of batch interrupted by crash may be sent twice.
+    Only one spool should use directory at a time.
+
+    fsync policy:
+        always - fsync after every write, survives power loss
+        interval - fsync at most every fsync_interval seconds
+        never - leave it to OS, survives process crash but not power loss
+    """
+
+    def __init__(
+        self,
+        journal: Journal,
+        token: Union[str, uuid.UUID],
+        directory: str,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        segment_size: int = 64 * 1024 * 1024,
+        fsync: str = FSYNC_INTERVAL,
+        fsync_interval: float = 1.0,
+        retry_interval: float = 1.0,
+        retry_interval_max: float = 60.0,
+        on_error: Optional[SpoolErrorCallback] = None,
+        close_on_exit: bool = True,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size should be at least 1")
+        if fsync not in (FSYNC_ALWAYS, FSYNC_INTERVAL, FSYNC_NEVER):
+            raise ValueError(f"Unknown fsync policy: {fsync}")
+        self.journal = journal
+        self.token = token
+        self.directory = directory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.segment_size = segment_size
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.retry_interval = retry_interval
+        self.retry_interval_max = retry_interval_max
+        self.on_error = on_error
+
+        self.written = 0
+        self.sent = 0
+        self.failed = 0
+        self.retries = 0
+        self.corrupted = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._cursor_path = os.path.join(directory, CURSOR_FILE)
+        self._cursor_seq, self._cursor_offset = self._load_cursor()
+
+        # Writes always go to new segment, tail of previous run segment may be torn
+        segments = self._segments()
+        self._active_seq = max(segments[-1] if segments else 0, self._cursor_seq) + 1
+        self._active: BinaryIO = self._open_segment(self._active_seq)
+        self._active_size = 0
+        self._synced_at = time.monotonic()
+        self._dirty = False
+
+        self._reader: Optional[BinaryIO] = None
+        self._reader_seq = self._cursor_seq
+        self._reader_offset = self._cursor_offset
+
+        # Entries written since shipper last checked, backlog of previous run is unknown
+        self._unread = batch_size if segments else 0
+        self._caught_up = not segments
+        self._flush_requested = False
+        self._closed = False
+        self._condition = threading.Condition()
+
+        self._thread = threading.Thread(
+            target=self._run, name="bugout-journal-entry-spool", daemon=True
+        )
+        self._thread.start()
+
+        self._close_on_exit = close_on_exit
+        if close_on_exit:
+            atexit.register(self.close)
+
+    def write(
+        self,
+        journal_id: Union[str, uuid.UUID],
+        title: str,
+        content: str,
+        tags: Optional[List[str]] = None,
+        context_url: Optional[str] = None,
+        context_id: Optional[str] = None,
+        context_type: Optional[str] = None,
+    ) -> None:
+        """
+        Append entry to spool.
+        """
+        record = {
+            "journal_id": str(journal_id),
+            "entry": {
+                "title": title,
+                "content": content,
+                "tags": tags if tags is not None else [],
+                "context_url": context_url,
+                "context_id": context_id,
+                "context_type": context_type,
+            },
+        }
+        line = (json.dumps(record) + "\n").encode()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Journal entry spool is closed")
+            if self._active_size + len(line) > self.segment_size and self._active_size:
+                self._rotate()
+            self._active.write(line)
+            self._active_size += len(line)
+            self._dirty = True
+            if self.fsync == FSYNC_ALWAYS or (
+                self.fsync == FSYNC_INTERVAL
+                and time.monotonic() - self._synced_at >= self.fsync_interval
+            ):
+                self._sync()
+            self.written += 1
+            self._unread += 1
+            self._caught_up = False
+            if self._unread == 1 or self._unread >= self.batch_size:
+                self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Ship all spooled entries and wait until they are sent or dropped.
+        """
+        with self._condition:
+            self._flush_requested = True
+            self._condition.notify_all()
+            return self._condition.wait_for(lambda: self._caught_up, timeout=timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop accepting entries and try to ship the rest. Entries left unshipped because
+        Spire is unavailable stay on disk until spool is opened again.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout=timeout)
+        with self._condition:
+            if self.fsync != FSYNC_NEVER:
+                self._sync()
+            self._active.close()
+        if self._close_on_exit:
+            atexit.unregister(self.close)
+
+    def __enter__(self) -> "JournalEntrySpool":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    # Segments
+    def _segments(self) -> List[int]:
+        seqs = [_segment_seq(filename) for filename in os.listdir(self.directory)]
+        return sorted(seq for seq in seqs if seq is not None)
+
+    def _segment_path(self, seq: int) -> str:
+        return os.path.join(self.directory, f"{seq:020d}{SEGMENT_SUFFIX}")
+
+    def _open_segment(self, seq: int) -> BinaryIO:
+        # Unbuffered, so every line reaches OS in one write call
+        return open(self._segment_path(seq), "ab", buffering=0)
+
+    def _sync(self) -> None:
+        if self._dirty:
+            os.fsync(self._active.fileno())
+            self._dirty = False
+        self._synced_at = time.monotonic()
+
+    def _rotate(self) -> None:
+        if self.fsync != FSYNC_NEVER:
+            self._sync()
+        self._active.close()
+        self._active_seq += 1
+        self._active = self._open_segment(self._active_seq)
+        self._active_size = 0
+
+    # Cursor
+    def _load_cursor(self) -> Tuple[int, int]:
+        if not os.path.exists(self._cursor_path):
+            return 0, 0
+        with open(self._cursor_path) as ifp:
+            cursor = json.load(ifp)
+        return cursor["segment"], cursor["offset"]
+
+    def _save_cursor(self) -> None:
+        cursor_tmp_path = f"{self._cursor_path}.tmp"
+        with open(cursor_tmp_path, "w") as ofp:
+            json.dump({"segment": self._cursor_seq, "offset": self._cursor_offset}, ofp)
+            ofp.flush()
+            os.fsync(ofp.fileno())
+        os.replace(cursor_tmp_path, self._cursor_path)
+
+    def _commit(self) -> None:
+        """
+        Move cursor to reader position and remove fully shipped segments.
+        """
+        if (self._cursor_seq, self._cursor_offset) == (
+            self._reader_seq,
+            self._reader_offset,
+        ):
+            return
+        self._cursor_seq, self._cursor_offset = self._reader_seq, self._reader_offset
+        self._save_cursor()
+        for seq in self._segments():
+            if seq >= self._cursor_seq:
+                break
+            os.remove(self._segment_path(seq))
+
+    # Shipper
+    def _read_records(self) -> List[Dict[str, Any]]:
+        """
+        Reads up to batch_size complete records starting from reader position.
+        """
+        records: List[Dict[str, Any]] = []
+        while len(records) < self.batch_size:
+            with self._condition:
+                active_seq = self._active_seq
+            if self._reader is None:
+                if self._reader_seq > active_seq:
+                    break
+                if not os.path.exists(self._segment_path(self._reader_seq)):
+                    self._next_segment()
+                    continue
+                self._reader = open(self._segment_path(self._reader_seq), "rb")
+                self._reader.seek(self._reader_offset)
+
+            line = self._reader.readline()
+            if line.endswith(b"\n"):
+                self._reader_offset += len(line)
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    self.corrupted += 1
+                continue
+
+            if self._reader_seq == active_seq:
+                # Wait for writer to finish the line
+                self._reader.seek(self._reader_offset)
+                break
+            # Segment is complete, partial line could be only a torn write of crash
+            if line:
+                self.corrupted += 1
+            self._next_segment()
+        return records
+
+    def _next_segment(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        later_segments = [seq for seq in self._segments() if seq > self._reader_seq]
+        self._reader_seq = later_segments[0] if later_segments else self._reader_seq + 1
+        self._reader_offset = 0
+
+    def _group(self, records: List[Dict[str, Any]]) -> List[Tuple[str, List[Any]]]:
+        groups: Dict[str, List[Any]] = {}
+        for record in records:
+            groups.setdefault(record["journal_id"], []).append(record["entry"])
+        return list(groups.items())
+
+    def _send(self, journal_key: str, entries: List[Dict[str, Any]]) -> bool:
+        """
+        Returns False if batch should be retried.
+        """
+        try:
+            self.journal.create_entries_pack(
+                token=self.token,
+                journal_id=journal_key,
+                entries=BugoutJournalEntriesRequest(
+                    entries=[BugoutJournalEntryRequest(**entry) for entry in entries]
+                ),
+            )
+            self.sent += len(entries)
+            return True
+        except Exception as e:
+            if self.on_error is not None:
+                try:
+                    self.on_error(e, journal_key, entries)
+                except Exception:
+                    logger.exception("on_error callback of journal entry spool failed")
+            if isinstance(e, ValueError) or (
+                isinstance(e, BugoutResponseException)
+                and e.status_code in NON_RETRIABLE_STATUSES
+            ):
+                self.failed += len(entries)
+                return True
+            return False
+
+    def _run(self) -> None:
+        groups: List[Tuple[str, List[Any]]] = []
+        backlog = False
+        retry_interval = self.retry_interval
+        while True:
+            with self._condition:
+                if (
+                    not groups
+                    and not backlog
+                    and self._unread < self.batch_size
+                    and not (self._flush_requested or self._closed)
+                ):
+                    self._condition.wait(timeout=self.flush_interval)
+                if (
+                    self.fsync == FSYNC_INTERVAL
+                    and time.monotonic() - self._synced_at >= self.fsync_interval
+                ):
+                    self._sync()
+                self._unread = 0
+
+            if not groups:
+                records = self._read_records()
+                backlog = len(records) == self.batch_size
+                groups = self._group(records)
+
+            while groups:
+                journal_key, entries = groups[0]
+                if not self._send(journal_key, entries):
+                    break
+                groups.pop(0)
+                retry_interval = self.retry_interval
+
+            if groups:
+                self.retries += 1
+                with self._condition:
+                    if self._closed:
+                        return
+                    self._condition.wait(timeout=retry_interval)
+                retry_interval = min(retry_interval * 2, self.retry_interval_max)
+                continue
+
+            self._commit()
+            with self._condition:
+                if (
+                    self._reader_seq == self._active_seq
+                    and self._reader_offset >= self._active_size
+                    and self._unread == 0
+                ):
+                    self._caught_up = True
+                    self._flush_requested = False
+                    self._condition.notify_all()
+                    if self._closed:
+                        if self._reader is not None:
+                            self._reader.close()
+                        return
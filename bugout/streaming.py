@@ -0,0 +1,278 @@
+"""
+Incremental decoding of list responses.
+
+Response body is fed to JSONArrayDecoder chunk by chunk as it arrives from the socket and
+items of the list under key are returned as soon as each of them is complete. Only the
+unconsumed tail of the body is buffered, so memory stays proportional to one item (and
+one chunk) instead of the whole response. Chunks of item which spans many of them are
+only scanned for its end and joined once, so decoding stays linear in item size.
+"""
+
+import codecs
+import json
+from json.decoder import WHITESPACE  # type: ignore
+import re
+from typing import Any, List, Optional
+
+from .exceptions import BugoutUnexpectedResponse
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Consumed part of buffer is dropped once it is longer than this
+_COMPACT_ABOVE = 64 * 1024
+
+_START = "start"
+_KEY = "key"
+# Key or item after comma, closing bracket is not allowed there
+_NEXT_KEY = "next_key"
+_COLON = "colon"
+_VALUE = "value"
+_AFTER_VALUE = "after_value"
+_ITEMS = "items"
+_NEXT_ITEM = "next_item"
+_AFTER_ITEM = "after_item"
+_END = "end"
+
+# Returned by _decode_value when value continues in next chunk
+_incomplete = object()
+
+# Number followed by one of these may continue in next chunk
+_NUMBER_CONTINUATION = frozenset(".eE+-0123456789")
+
+# Characters which change nesting of object, list or string
+_SCAN_SPECIAL = re.compile(r'["\[\]{}]')
+_SCAN_STRING = re.compile(r'["\\]')
+
+
+class JSONArrayDecoder:
+    """
+    Push decoder of array under key of top level JSON object, or of top level array
+    when key is None. Other members of object are decoded and discarded.
+    """
+
+    def __init__(self, key: Optional[str]) -> None:
+        self.key = key
+        self.found = False
+
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        self._current_key: Optional[str] = None
+        self._final = False
+
+        # Chunks of incomplete object, list or string at _pos, kept apart from buffer
+        # until its end arrives
+        self._waiting = False
+        self._chunks: List[str] = []
+        self._scan_depth = 0
+        self._scan_in_string = False
+        self._scan_escape = False
+
+    def feed(self, data: bytes) -> List[Any]:
+        """
+        Adds chunk of response body, returns items completed by it.
+        """
+        if not self._append(self._text.decode(data)):
+            return []
+        return self._drain()
+
+    def close(self) -> List[Any]:
+        """
+        Marks end of response body, returns remaining items and raises if body is
+        truncated or is not valid JSON.
+        """
+        self._final = True
+        self._append(self._text.decode(b"", final=True))
+        items = self._drain()
+        if self._state != _END:
+            raise BugoutUnexpectedResponse("Response body ended before end of JSON")
+        if not self.found:
+            raise BugoutUnexpectedResponse(f"Response has no list under {self.key}")
+        return items
+
+    def _append(self, text: str) -> bool:
+        """
+        Adds text to buffer, returns False while incomplete value waits for its end.
+        """
+        if not self._waiting:
+            self._buffer += text
+            return True
+        self._chunks.append(text)
+        if not self._scan(text, 0) and not self._final:
+            return False
+        self._buffer = self._buffer[self._pos :] + "".join(self._chunks)
+        self._pos = 0
+        self._chunks = []
+        self._waiting = False
+        return True
+
+    def _scan(self, text: str, pos: int) -> bool:
+        """
+        Advances scan of incomplete value over text, returns True if value ends in it.
+        """
+        while True:
+            if self._scan_escape:
+                if pos >= len(text):
+                    return False
+                pos += 1
+                self._scan_escape = False
+            if self._scan_in_string:
+                match = _SCAN_STRING.search(text, pos)
+                if match is None:
+                    return False
+                pos = match.end()
+                if match.group() == "\\":
+                    self._scan_escape = True
+                    continue
+                self._scan_in_string = False
+                if self._scan_depth == 0:
+                    return True
+                continue
+            match = _SCAN_SPECIAL.search(text, pos)
+            if match is None:
+                return False
+            pos = match.end()
+            char = match.group()
+            if char == '"':
+                self._scan_in_string = True
+            elif char in "[{":
+                self._scan_depth += 1
+            else:
+                self._scan_depth -= 1
+                if self._scan_depth <= 0:
+                    return True
+
+    def _drain(self) -> List[Any]:
+        items: List[Any] = []
+        while self._step(items):
+            pass
+        if self._pos > _COMPACT_ABOVE:
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+        return items
+
+    def _next_char(self) -> Optional[str]:
+        self._pos = WHITESPACE.match(self._buffer, self._pos).end()
+        if self._pos >= len(self._buffer):
+            return None
+        return self._buffer[self._pos]
+
+    def _decode_value(self) -> Any:
+        """
+        Decodes value at current position, returns _incomplete when more data is needed.
+        """
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError as e:
+            if self._final:
+                raise BugoutUnexpectedResponse(f"Invalid JSON in response: {e}")
+            if self._buffer[self._pos] in '{["':
+                self._scan_depth = 0
+                self._scan_in_string = False
+                self._scan_escape = False
+                if self._scan(self._buffer, self._pos):
+                    # Value is complete but does not decode
+                    raise BugoutUnexpectedResponse(f"Invalid JSON in response: {e}")
+                self._waiting = True
+            return _incomplete
+        # Number, true, false or null is complete only when delimiter follows it, number
+        # cut after "." or "e" decodes as its shorter prefix
+        if (
+            not self._final
+            and not isinstance(value, (dict, list, str))
+            and (end >= len(self._buffer) or self._buffer[end] in _NUMBER_CONTINUATION)
+        ):
+            return _incomplete
+        self._pos = end
+        return value
+
+    def _expect(self, char: str, expected: str) -> None:
+        raise BugoutUnexpectedResponse(
+            f"Invalid JSON in response: expected {expected} at position {self._pos}, "
+            f"got {char!r}"
+        )
+
+    def _step(self, items: List[Any]) -> bool:
+        """
+        Advances by one token, returns False when more data is needed.
+        """
+        state = self._state
+        if state == _END:
+            char = self._next_char()
+            if char is not None:
+                self._expect(char, "end of response")
+            return False
+        char = self._next_char()
+        if char is None:
+            return False
+
+        if state == _START:
+            if self.key is None:
+                if char != "[":
+                    self._expect(char, "[")
+                self.found = True
+                self._state = _ITEMS
+            else:
+                if char != "{":
+                    self._expect(char, "{")
+                self._state = _KEY
+            self._pos += 1
+        elif state == _KEY or state == _NEXT_KEY:
+            if char == "}" and state == _KEY:
+                self._pos += 1
+                self._state = _END
+                return True
+            if char != '"':
+                self._expect(char, "object key")
+            key = self._decode_value()
+            if key is _incomplete:
+                return False
+            self._current_key = key
+            self._state = _COLON
+        elif state == _COLON:
+            if char != ":":
+                self._expect(char, ":")
+            self._pos += 1
+            self._state = _VALUE
+        elif state == _VALUE:
+            if self._current_key == self.key and not self.found:
+                if char != "[":
+                    self._expect(char, f"list under {self.key}")
+                self.found = True
+                self._pos += 1
+                self._state = _ITEMS
+            else:
+                if self._decode_value() is _incomplete:
+                    return False
+                self._state = _AFTER_VALUE
+        elif state == _AFTER_VALUE:
+            if char == ",":
+                self._state = _NEXT_KEY
+            elif char == "}":
+                self._state = _END
+            else:
+                self._expect(char, ", or }")
+            self._pos += 1
+        elif state == _ITEMS or state == _NEXT_ITEM:
+            if char == "]":
+                if state == _NEXT_ITEM:
+                    self._expect(char, "list item")
+                self._pos += 1
+                self._state = _END if self.key is None else _AFTER_VALUE
+                return True
+            item = self._decode_value()
+            if item is _incomplete:
+                return False
+            items.append(item)
+            self._state = _AFTER_ITEM
+        elif state == _AFTER_ITEM:
+            if char == ",":
+                self._state = _NEXT_ITEM
+            elif char == "]":
+                self._state = _END if self.key is None else _AFTER_VALUE
+            else:
+                self._expect(char, ", or ]")
+            self._pos += 1
+        return True
@@ -0,0 +1,119 @@
+from enum import Enum
+import time
+from typing import Iterable, List, NamedTuple, Optional, Tuple, Union
+import uuid
+
+from pydantic import BaseModel, Field
+
+from .batch import BATCH_ERRORS, BulkReport, run_batch
+from .journal import Journal
+
+
+class TagAction(Enum):
+    add = "add"
+    replace = "replace"
+    remove = "remove"
+
+
+class TagOperation(NamedTuple):
+    entry_id: Union[str, uuid.UUID]
+    tags: List[str]
+    action: Union[str, TagAction] = TagAction.add
+
+
+class TagOperationResult(BaseModel):
+    entry_id: str
+    action: TagAction
+    tags: List[str]
+    succeeded: bool
+    # Tags changed on entry and tags whose request failed
+    applied_tags: List[str] = Field(default_factory=list)
+    failed_tags: List[str] = Field(default_factory=list)
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+
+
+class BulkTagReport(BulkReport):
+    results: List[TagOperationResult] = Field(default_factory=list)
+
+
+def bulk_tag(
+    journal: Journal,
+    token: Union[str, uuid.UUID],
+    journal_id: Union[str, uuid.UUID],
+    operations: Iterable[Union[TagOperation, Tuple]],
+    concurrency: int = 8,
+    timeout: Optional[float] = None,
+) -> BulkTagReport:
+    """
+    Applies tag operations (entry_id, tags, action) to entries of journal with up to
+    concurrency requests in flight.
+
+    add merges tags into entry tags, replace sets entry tags, remove deletes each of tags
+    from entry. Failed operations do not stop the rest, results are returned in order
+    of operations with failures counted by response status, applied_tags and
+    failed_tags of result tell which tags were changed. API errors are reported,
+    other exceptions stop bulk_tag.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency should be at least 1")
+
+    def apply(operation: TagOperation) -> TagOperationResult:
+        action = TagAction(operation.action)
+        entry_id = str(operation.entry_id)
+        result = TagOperationResult(
+            entry_id=entry_id, action=action, tags=operation.tags, succeeded=True
+        )
+
+        def failed(tags: List[str], e: Exception) -> None:
+            result.succeeded = False
+            result.failed_tags.extend(tags)
+            if result.error is None:
+                result.status_code = getattr(e, "status_code", None)
+                result.error = str(e)
+
+        if action == TagAction.remove:
+            # One request per tag, every tag is tried so the report tells exactly
+            # which of them are still on entry
+            for tag in operation.tags:
+                try:
+                    journal.delete_tag(
+                        token=token,
+                        journal_id=journal_id,
+                        entry_id=entry_id,
+                        tag=tag,
+                        timeout=timeout,
+                    )
+                except BATCH_ERRORS as e:
+                    failed([tag], e)
+                    continue
+                result.applied_tags.append(tag)
+            return result
+
+        tag_entry = (
+            journal.create_tags if action == TagAction.add else journal.update_tags
+        )
+        try:
+            tag_entry(
+                token=token,
+                journal_id=journal_id,
+                entry_id=entry_id,
+                tags=operation.tags,
+                timeout=timeout,
+            )
+        except BATCH_ERRORS as e:
+            failed(operation.tags, e)
+            return result
+        result.applied_tags.extend(operation.tags)
+        return result
+
+    report = BulkTagReport()
+    started_at = time.monotonic()
+    calls = ({"operation": TagOperation(*operation)} for operation in operations)
+    for item in run_batch(apply, calls, concurrency=concurrency):
+        result: TagOperationResult = item.result
+        report.results.append(result)
+        report.record(result.succeeded, result.status_code)
+
+    report.elapsed_seconds = time.monotonic() - started_at
+    return report
@@ -0,0 +1,271 @@
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional, Tuple, Type
+from urllib.parse import urlsplit
+
+from pydantic import BaseModel
+import requests
+from requests.adapters import HTTPAdapter
+
+from .calls import iter_response_items, make_request, parse_response, send_request
+from .compression import compress_json_body
+from .data import Method
+from .httpcache import (
+    CachedResponse,
+    ResponseCache,
+    cache_key,
+    conditional_kwargs,
+    validators,
+)
+from .instrumentation import (
+    PHASE_DECODE,
+    PHASE_REQUEST,
+    Instrumentation,
+    RequestInfo,
+    build_model,
+    requests_timing_kwargs,
+    requests_timing_done,
+)
+from .ratelimit import RateLimiter, find_rate_limiter
+from .retry import RetryPolicy
+from .settings import REQUESTS_POOL_MAXSIZE
+from .singleflight import SingleFlight, request_key
+
+
+class Transport:
+    """
+    Pool of keep-alive HTTP sessions shared by Bugout sub-clients.
+
+    One requests.Session is kept per scheme and host, so Brood and Spire calls reuse
+    already established TCP and TLS connections instead of opening a new one per call.
+
+    With coalesce_gets, concurrent identical GET requests (same url, params and
+    headers) share one request and its decoded response body, so callers should not
+    mutate results decoded with fast_decode or views.
+
+    With response_cache, GET responses carrying ETag or Last-Modified are stored and
+    revalidated with conditional requests, body of 304 response is taken from cache.
+
+    With instrumentation, phases of every request are measured and request hooks are
+    called, see bugout.instrumentation.
+
+    JSON request bodies of compress_requests_above bytes or more are sent gzip compressed
+    with Content-Encoding header, server should accept compressed bodies. Responses are
+    decoded according to their Content-Encoding, accept_encoding overrides encodings
+    advertised by default (see bugout.compression).
+
+    stream decodes list responses item by item as they arrive, see bugout.streaming.
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int = REQUESTS_POOL_MAXSIZE,
+        retry_policy: Optional[RetryPolicy] = None,
+        coalesce_gets: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        compress_requests_above: Optional[int] = None,
+        accept_encoding: Optional[str] = None,
+    ) -> None:
+        self.pool_maxsize = pool_maxsize
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.rate_limiters: Dict[str, RateLimiter] = {}
+        self.single_flight: Optional[SingleFlight] = (
+            SingleFlight() if coalesce_gets else None
+        )
+        self.response_cache = response_cache
+        self.instrumentation = instrumentation
+        self.compress_requests_above = compress_requests_above
+        self.accept_encoding = accept_encoding
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def session(self, url: str) -> requests.Session:
+        url_parts = urlsplit(url)
+        host = f"{url_parts.scheme}://{url_parts.netloc}"
+        session = self._sessions.get(host)
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(host)
+                if session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=1, pool_maxsize=self.pool_maxsize
+                    )
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    if self.accept_encoding is not None:
+                        session.headers["Accept-Encoding"] = self.accept_encoding
+                    self._sessions[host] = session
+        return session
+
+    def set_rate_limiter(self, base_url: str, rate_limiter: RateLimiter) -> None:
+        self.rate_limiters[base_url.rstrip("/")] = rate_limiter
+
+    def request(
+        self,
+        method: Method,
+        url: str,
+        model: Optional[Type[BaseModel]] = None,
+        validate: bool = True,
+        **kwargs,
+    ) -> Any:
+        """
+        Returns response body, or model built from it when model is given. Model is
+        built before request finishes, so its phase is seen by after_request hooks.
+        """
+        if self.single_flight is not None:
+            key = request_key(method, url, kwargs)
+            if key is not None:
+                led = False
+
+                def lead() -> Tuple[Any, Any]:
+                    nonlocal led
+                    led = True
+                    return self._request(method, url, model, validate, kwargs)
+
+                # Coalesced callers share response body, each of them builds own model
+                body, result = self.single_flight.do(key, lead)
+                if led:
+                    return result
+                return build_model(
+                    self.instrumentation, None, method, url, model, body, validate
+                )
+        return self._request(method, url, model, validate, kwargs)[1]
+
+    def _request(
+        self,
+        method: Method,
+        url: str,
+        model: Optional[Type[BaseModel]],
+        validate: bool,
+        kwargs: Dict[str, Any],
+    ) -> Tuple[Any, Any]:
+        """
+        Returns response body and model built from it.
+        """
+        rate_limiter = find_rate_limiter(self.rate_limiters, url)
+        if self.compress_requests_above is not None:
+            kwargs = compress_json_body(
+                kwargs, self.compress_requests_above, body_kwarg="data"
+            )
+        key = (
+            cache_key(method, url, kwargs) if self.response_cache is not None else None
+        )
+        if key is None and self.instrumentation is None:
+            body = make_request(
+                method=method,
+                url=url,
+                session=self.session(url),
+                retry_policy=self.retry_policy,
+                rate_limiter=rate_limiter,
+                **kwargs,
+            )
+            return body, build_model(None, None, method, url, model, body, validate)
+        return self._observed_request(
+            method, url, model, validate, key, rate_limiter, kwargs
+        )
+
+    def _observed_request(
+        self,
+        method: Method,
+        url: str,
+        model: Optional[Type[BaseModel]],
+        validate: bool,
+        key: Optional[str],
+        rate_limiter: Optional[RateLimiter],
+        kwargs: Dict[str, Any],
+    ) -> Tuple[Any, Any]:
+        """
+        Request through response cache or with instrumentation.
+        """
+        response_cache = self.response_cache if key is not None else None
+        cached: Optional[CachedResponse] = None
+        if response_cache is not None and key is not None:
+            cached = response_cache.get(key)
+            if cached is not None:
+                kwargs = conditional_kwargs(kwargs, cached)
+        instrumentation = self.instrumentation
+        info: Optional[RequestInfo] = None
+        if instrumentation is not None:
+            info = instrumentation.start(method, url)
+            kwargs = requests_timing_kwargs(info, kwargs)
+
+        started_at = time.perf_counter()
+        try:
+            r = send_request(
+                method=method,
+                url=url,
+                session=self.session(url),
+                retry_policy=self.retry_policy,
+                rate_limiter=rate_limiter,
+                **kwargs,
+            )
+            if info is not None:
+                requests_timing_done(info)
+                info.timings[PHASE_REQUEST] = time.perf_counter() - started_at
+                info.status_code = r.status_code
+            if r.status_code == 304 and cached is not None:
+                assert response_cache is not None
+                response_cache.record_hit()
+                body = cached.body
+            else:
+                decode_started_at = time.perf_counter()
+                body = parse_response(r)
+                if info is not None:
+                    info.timings[PHASE_DECODE] = time.perf_counter() - decode_started_at
+                etag, last_modified = validators(r.headers)
+                if (
+                    response_cache is not None
+                    and key is not None
+                    and (etag is not None or last_modified is not None)
+                ):
+                    response_cache.set(
+                        key, CachedResponse(etag, last_modified, body, len(r.content))
+                    )
+            result = build_model(
+                instrumentation, info, method, url, model, body, validate
+            )
+        except Exception as e:
+            if instrumentation is not None and info is not None:
+                info.error = e
+                instrumentation.finish(info)
+            raise
+        if instrumentation is not None and info is not None:
+            instrumentation.finish(info)
+        return body, result
+
+    def stream(
+        self, method: Method, url: str, key: Optional[str], **kwargs
+    ) -> Iterator[Any]:
+        """
+        Lazily yields items of list under key of response body. Streamed requests are
+        never coalesced, cached or instrumented.
+        """
+        rate_limiter = find_rate_limiter(self.rate_limiters, url)
+        if self.compress_requests_above is not None:
+            kwargs = compress_json_body(
+                kwargs, self.compress_requests_above, body_kwarg="data"
+            )
+        r = send_request(
+            method=method,
+            url=url,
+            session=self.session(url),
+            retry_policy=self.retry_policy,
+            rate_limiter=rate_limiter,
+            stream=True,
+            **kwargs,
+        )
+        yield from iter_response_items(r, key)
+
+    def close(self) -> None:
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions = {}
+
+    def __enter__(self) -> "Transport":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
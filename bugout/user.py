@@ -1,10 +1,12 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Type, Union
 import uuid
 
-from .calls import make_request
+from pydantic import BaseModel
+
 from .data import Method, TokenType, BugoutUser, BugoutToken, BugoutUserTokens
 from .exceptions import InvalidUrlSpec, TokenInvalidParameters
 from .settings import REQUESTS_TIMEOUT
+from .transport import Transport
 
 
 class User:
@@ -13,16 +15,36 @@ class User:
     """
 
     def __init__(
-        self, url: Optional[str] = None, timeout: float = REQUESTS_TIMEOUT
+        self,
+        url: Optional[str] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+        transport: Optional[Transport] = None,
+        fast_decode: bool = False,
     ) -> None:
         if url is None:
             raise InvalidUrlSpec("Invalid brood url specified")
         self.url = url
         self.timeout = timeout
+        self.transport = transport if transport is not None else Transport()
+        self.fast_decode = fast_decode
 
-    def _call(self, method: Method, path: str, **kwargs):
+    def _call(
+        self,
+        method: Method,
+        path: str,
+        timeout: Optional[float] = None,
+        model: Optional[Type[BaseModel]] = None,
+        **kwargs,
+    ):
         url = f"{self.url.rstrip('/')}/{path.rstrip('/')}"
-        result = make_request(method=method, url=url, timeout=self.timeout, **kwargs)
+        result = self.transport.request(
+            method=method,
+            url=url,
+            model=model,
+            validate=not self.fast_decode,
+            timeout=timeout if timeout is not None else self.timeout,
+            **kwargs,
+        )
         return result
 
     # User module
@@ -32,6 +54,7 @@ class User:
         email: str,
         password: str,
         application_id: Optional[Union[str, uuid.UUID]] = None,
+        timeout: Optional[float] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutUser:
         create_user_path = "user"
@@ -44,35 +67,53 @@ class User:
         headers = {}
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
-        result = self._call(
-            method=Method.post, path=create_user_path, headers=headers, data=data
+        return self._call(
+            method=Method.post,
+            path=create_user_path,
+            headers=headers,
+            data=data,
+            timeout=timeout,
+            model=BugoutUser,
         )
-        return BugoutUser(**result)
 
-    def get_user(self, token: Union[str, uuid.UUID]) -> BugoutUser:
+    def get_user(
+        self, token: Union[str, uuid.UUID], timeout: Optional[float] = None
+    ) -> BugoutUser:
         get_user_path = "user"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(method=Method.get, path=get_user_path, headers=headers)
-        return BugoutUser(**result)
+        return self._call(
+            method=Method.get,
+            path=get_user_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutUser,
+        )
 
     def get_user_by_id(
-        self, token: Union[str, uuid.UUID], user_id: Union[str, uuid.UUID]
+        self,
+        token: Union[str, uuid.UUID],
+        user_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
     ) -> BugoutUser:
         get_user_by_id_path = f"user/{user_id}"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.get, path=get_user_by_id_path, headers=headers
+        return self._call(
+            method=Method.get,
+            path=get_user_by_id_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutUser,
         )
-        return BugoutUser(**result)
 
     def find_user(
         self,
         username: str,
-        token: Union[str, uuid.UUID] = None,
+        token: Optional[Union[str, uuid.UUID]] = None,
+        timeout: Optional[float] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutUser:
         find_user_path = f"user/find?username={username}"
@@ -81,11 +122,19 @@ class User:
             headers.update({"Authorization": f"Bearer {token}"})
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
-        result = self._call(method=Method.get, path=find_user_path, headers=headers)
-        return BugoutUser(**result)
+        return self._call(
+            method=Method.get,
+            path=find_user_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutUser,
+        )
 
     def confirm_email(
-        self, token: Union[str, uuid.UUID], verification_code: str
+        self,
+        token: Union[str, uuid.UUID],
+        verification_code: str,
+        timeout: Optional[float] = None,
     ) -> BugoutUser:
         confirm_user_email_path = "confirm"
         data = {
@@ -94,32 +143,52 @@ class User:
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.post, path=confirm_user_email_path, headers=headers, data=data
+        return self._call(
+            method=Method.post,
+            path=confirm_user_email_path,
+            headers=headers,
+            data=data,
+            timeout=timeout,
+            model=BugoutUser,
         )
-        return BugoutUser(**result)
 
-    def restore_password(self, email: str) -> Dict[str, str]:
+    def restore_password(
+        self, email: str, timeout: Optional[float] = None
+    ) -> Dict[str, str]:
         restore_password_path = "password/restore"
         data = {
             "email": email,
         }
-        result = self._call(method=Method.post, path=restore_password_path, data=data)
+        result = self._call(
+            method=Method.post, path=restore_password_path, data=data, timeout=timeout
+        )
         return result
 
     def reset_password(
-        self, reset_id: Union[str, uuid.UUID], new_password: str
+        self,
+        reset_id: Union[str, uuid.UUID],
+        new_password: str,
+        timeout: Optional[float] = None,
     ) -> BugoutUser:
         reset_password_path = "password/reset"
         data = {
             "reset_id": reset_id,
             "new_password": new_password,
         }
-        result = self._call(method=Method.post, path=reset_password_path, data=data)
-        return BugoutUser(**result)
+        return self._call(
+            method=Method.post,
+            path=reset_password_path,
+            data=data,
+            timeout=timeout,
+            model=BugoutUser,
+        )
 
     def change_password(
-        self, token: Union[str, uuid.UUID], current_password: str, new_password: str
+        self,
+        token: Union[str, uuid.UUID],
+        current_password: str,
+        new_password: str,
+        timeout: Optional[float] = None,
     ) -> BugoutUser:
         change_password_path = "password/change"
         data = {
@@ -129,16 +198,21 @@ class User:
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.post, path=change_password_path, headers=headers, data=data
+        return self._call(
+            method=Method.post,
+            path=change_password_path,
+            headers=headers,
+            data=data,
+            timeout=timeout,
+            model=BugoutUser,
         )
-        return BugoutUser(**result)
 
     def delete_user(
         self,
         token: Union[str, uuid.UUID],
         user_id: Union[str, uuid.UUID],
         password: Optional[str] = None,
+        timeout: Optional[float] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutUser:
         delete_user_path = f"user/{user_id}"
@@ -150,10 +224,14 @@ class User:
         }
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
-        result = self._call(
-            method=Method.delete, path=delete_user_path, headers=headers, data=data
+        return self._call(
+            method=Method.delete,
+            path=delete_user_path,
+            headers=headers,
+            data=data,
+            timeout=timeout,
+            model=BugoutUser,
         )
-        return BugoutUser(**result)
 
     # Token module
     def create_token(
@@ -162,6 +240,7 @@ class User:
         password: str,
         application_id: Optional[Union[str, uuid.UUID]] = None,
         token_note: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> BugoutToken:
         create_token_path = "token"
         data = {
@@ -170,21 +249,34 @@ class User:
             "application_id": application_id,
             "token_note": token_note,
         }
-        result = self._call(method=Method.post, path=create_token_path, data=data)
-        return BugoutToken(**result)
+        return self._call(
+            method=Method.post,
+            path=create_token_path,
+            data=data,
+            timeout=timeout,
+            model=BugoutToken,
+        )
 
-    def create_token_restricted(self, token: Union[str, uuid.UUID]) -> BugoutToken:
+    def create_token_restricted(
+        self, token: Union[str, uuid.UUID], timeout: Optional[float] = None
+    ) -> BugoutToken:
         create_token_path = "token/restricted"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(method=Method.post, path=create_token_path, headers=headers)
-        return BugoutToken(**result)
+        return self._call(
+            method=Method.post,
+            path=create_token_path,
+            headers=headers,
+            timeout=timeout,
+            model=BugoutToken,
+        )
 
     def revoke_token(
         self,
         token: Union[str, uuid.UUID],
         target_token: Optional[Union[str, uuid.UUID]] = None,
+        timeout: Optional[float] = None,
     ) -> uuid.UUID:
         revoke_token_path = "token"
         headers = {
@@ -194,13 +286,21 @@ class User:
         if target_token is not None:
             data.update({"target_token": target_token})
         result = self._call(
-            method=Method.delete, path=revoke_token_path, headers=headers, data=data
+            method=Method.delete,
+            path=revoke_token_path,
+            headers=headers,
+            data=data,
+            timeout=timeout,
         )
         return result
 
-    def revoke_token_by_id(self, token: Union[str, uuid.UUID]) -> uuid.UUID:
+    def revoke_token_by_id(
+        self, token: Union[str, uuid.UUID], timeout: Optional[float] = None
+    ) -> uuid.UUID:
         revoke_token_path = f"token/{token}"
-        result = self._call(method=Method.delete, path=revoke_token_path)
+        result = self._call(
+            method=Method.delete, path=revoke_token_path, timeout=timeout
+        )
         return result
 
     def update_token(
@@ -208,6 +308,7 @@ class User:
         token: Union[str, uuid.UUID],
         token_type: Optional[TokenType] = None,
         token_note: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> BugoutToken:
         update_token_path = "token"
 
@@ -221,16 +322,26 @@ class User:
         if token_note is not None:
             data.update({"token_note": token_note})
 
-        result = self._call(method=Method.put, path=update_token_path, data=data)
-        return BugoutToken(**result)
+        return self._call(
+            method=Method.put,
+            path=update_token_path,
+            data=data,
+            timeout=timeout,
+            model=BugoutToken,
+        )
 
-    def get_token_types(self, token: Union[str, uuid.UUID]) -> List[str]:
+    def get_token_types(
+        self, token: Union[str, uuid.UUID], timeout: Optional[float] = None
+    ) -> List[str]:
         get_token_types_path = "token/types"
         headers = {
             "Authorization": f"Bearer {token}",
         }
         result = self._call(
-            method=Method.get, path=get_token_types_path, headers=headers
+            method=Method.get,
+            path=get_token_types_path,
+            headers=headers,
+            timeout=timeout,
         )
         return result
 
@@ -240,6 +351,7 @@ class User:
         active: Optional[bool] = None,
         token_type: Optional[TokenType] = None,
         restricted: Optional[bool] = None,
+        timeout: Optional[float] = None,
     ) -> BugoutUserTokens:
         get_user_tokens_path = "tokens"
         headers = {
@@ -252,10 +364,11 @@ class User:
             query_params.update({"token_type": token_type.value})
         if restricted is not None:
             query_params.update({"restricted": str(int(restricted))})
-        result = self._call(
+        return self._call(
             method=Method.get,
             path=get_user_tokens_path,
             params=query_params,
             headers=headers,
+            timeout=timeout,
+            model=BugoutUserTokens,
         )
-        return BugoutUserTokens(**result)
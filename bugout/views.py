@@ -0,0 +1,230 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import uuid
+
+try:
+    from pydantic.v1.datetime_parse import parse_datetime
+except ImportError:
+    # pydantic before 1.10.17 has no v1 namespace
+    from pydantic.datetime_parse import parse_datetime  # type: ignore
+
+from .data import (
+    BugoutJournalEntries,
+    BugoutJournalEntry,
+    BugoutSearchResult,
+    BugoutSearchResults,
+)
+
+_UNSET: Any = object()
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    return parse_datetime(value) if value is not None else None
+
+
+class SearchResultView:
+    """
+    Lightweight read-only view over search result from Spire response.
+
+    Keeps decoded JSON as is, fields are read from it and timestamps are parsed
+    only on first access.
+    """
+
+    __slots__ = ("_raw", "_created_at", "_updated_at")
+
+    def __init__(self, raw: Dict[str, Any]) -> None:
+        self._raw = raw
+        self._created_at: Optional[datetime] = _UNSET
+        self._updated_at: Optional[datetime] = _UNSET
+
+    def __repr__(self) -> str:
+        return f"SearchResultView(entry_url={self.entry_url!r})"
+
+    @property
+    def entry_url(self) -> str:
+        return self._raw["entry_url"]
+
+    @property
+    def content_url(self) -> str:
+        return self._raw["content_url"]
+
+    @property
+    def title(self) -> str:
+        return self._raw["title"]
+
+    @property
+    def content(self) -> Optional[str]:
+        return self._raw.get("content")
+
+    @property
+    def tags(self) -> List[str]:
+        return self._raw["tags"]
+
+    @property
+    def score(self) -> float:
+        return self._raw["score"]
+
+    @property
+    def created_at(self) -> Optional[datetime]:
+        if self._created_at is _UNSET:
+            self._created_at = _parse_datetime(self._raw.get("created_at"))
+        return self._created_at
+
+    @property
+    def updated_at(self) -> Optional[datetime]:
+        if self._updated_at is _UNSET:
+            self._updated_at = _parse_datetime(self._raw.get("updated_at"))
+        return self._updated_at
+
+    def raw(self) -> Dict[str, Any]:
+        return self._raw
+
+    def to_model(self) -> BugoutSearchResult:
+        return BugoutSearchResult(**self._raw)
+
+
+class SearchResultsView:
+    """
+    Page of search results, results are wrapped into SearchResultView on first access.
+    """
+
+    __slots__ = (
+        "total_results",
+        "offset",
+        "next_offset",
+        "max_score",
+        "_raw_results",
+        "_results",
+    )
+
+    def __init__(self, raw: Dict[str, Any]) -> None:
+        self.total_results: int = raw["total_results"]
+        self.offset: int = raw["offset"]
+        self.next_offset: Optional[int] = raw.get("next_offset")
+        self.max_score: float = raw["max_score"]
+        self._raw_results: List[Dict[str, Any]] = raw["results"]
+        self._results: Optional[List[SearchResultView]] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"SearchResultsView(total_results={self.total_results}, "
+            f"offset={self.offset}, results={len(self._raw_results)})"
+        )
+
+    @property
+    def results(self) -> List[SearchResultView]:
+        if self._results is None:
+            self._results = [SearchResultView(result) for result in self._raw_results]
+        return self._results
+
+    def raw_results(self) -> List[Dict[str, Any]]:
+        return self._raw_results
+
+    def to_model(self) -> BugoutSearchResults:
+        return BugoutSearchResults(
+            total_results=self.total_results,
+            offset=self.offset,
+            next_offset=self.next_offset,
+            max_score=self.max_score,
+            results=[result.to_model() for result in self.results],
+        )
+
+
+class JournalEntryView:
+    """
+    Lightweight read-only view over journal entry from Spire response.
+
+    Keeps decoded JSON as is, id and timestamps are parsed only on first access.
+    """
+
+    __slots__ = ("_raw", "_id", "_created_at", "_updated_at")
+
+    def __init__(self, raw: Dict[str, Any]) -> None:
+        self._raw = raw
+        self._id: uuid.UUID = _UNSET
+        self._created_at: Optional[datetime] = _UNSET
+        self._updated_at: Optional[datetime] = _UNSET
+
+    def __repr__(self) -> str:
+        return f"JournalEntryView(id={self._raw['id']!r})"
+
+    @property
+    def id(self) -> uuid.UUID:
+        if self._id is _UNSET:
+            self._id = uuid.UUID(self._raw["id"])
+        return self._id
+
+    @property
+    def journal_url(self) -> Optional[str]:
+        return self._raw.get("journal_url")
+
+    @property
+    def content_url(self) -> Optional[str]:
+        return self._raw.get("content_url")
+
+    @property
+    def title(self) -> Optional[str]:
+        return self._raw.get("title")
+
+    @property
+    def content(self) -> Optional[str]:
+        return self._raw.get("content")
+
+    @property
+    def tags(self) -> List[str]:
+        return self._raw.get("tags") or []
+
+    @property
+    def context_url(self) -> Optional[str]:
+        return self._raw.get("context_url")
+
+    @property
+    def context_type(self) -> Optional[str]:
+        return self._raw.get("context_type")
+
+    @property
+    def created_at(self) -> Optional[datetime]:
+        if self._created_at is _UNSET:
+            self._created_at = _parse_datetime(self._raw.get("created_at"))
+        return self._created_at
+
+    @property
+    def updated_at(self) -> Optional[datetime]:
+        if self._updated_at is _UNSET:
+            self._updated_at = _parse_datetime(self._raw.get("updated_at"))
+        return self._updated_at
+
+    def raw(self) -> Dict[str, Any]:
+        return self._raw
+
+    def to_model(self) -> BugoutJournalEntry:
+        return BugoutJournalEntry(**self._raw)
+
+
+class JournalEntriesView:
+    """
+    List of journal entries, wrapped into JournalEntryView on first access.
+    """
+
+    __slots__ = ("_raw_entries", "_entries")
+
+    def __init__(self, raw: Dict[str, Any]) -> None:
+        self._raw_entries: List[Dict[str, Any]] = raw["entries"]
+        self._entries: Optional[List[JournalEntryView]] = None
+
+    def __repr__(self) -> str:
+        return f"JournalEntriesView(entries={len(self._raw_entries)})"
+
+    @property
+    def entries(self) -> List[JournalEntryView]:
+        if self._entries is None:
+            self._entries = [JournalEntryView(entry) for entry in self._raw_entries]
+        return self._entries
+
+    def raw_entries(self) -> List[Dict[str, Any]]:
+        return self._raw_entries
+
+    def to_model(self) -> BugoutJournalEntries:
+        return BugoutJournalEntries(
+            entries=[entry.to_model() for entry in self.entries]
+        )
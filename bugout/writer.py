@@ -0,0 +1,204 @@
+import atexit
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Union
+import uuid
+
+from .data import BugoutJournalEntriesRequest, BugoutJournalEntryRequest
+from .journal import Journal
+
+logger = logging.getLogger(__name__)
+
+ErrorCallback = Callable[[Exception, str, List[BugoutJournalEntryRequest]], None]
+
+
+class JournalEntryWriter:
+    """
+    Buffers journal entries in memory and sends them to Spire in background
+    with journals/{journal_id}/bulk requests.
+
+    Buffer of journal is flushed when it reaches batch_size entries or when its oldest
+    entry waits flush_interval seconds. At most max_pending entries are kept in memory,
+    after that write() blocks (block=True) or drops entry and returns False.
+    """
+
+    def __init__(
+        self,
+        journal: Journal,
+        token: Union[str, uuid.UUID],
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        max_pending: int = 10000,
+        block: bool = True,
+        on_error: Optional[ErrorCallback] = None,
+        flush_on_exit: bool = True,
+    ) -> None:
+        if batch_size < 1 or max_pending < batch_size:
+            raise ValueError("Expected 1 <= batch_size <= max_pending")
+        self.journal = journal
+        self.token = token
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.block = block
+        self.on_error = on_error
+
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+
+        self._buffers: Dict[str, List[BugoutJournalEntryRequest]] = {}
+        self._buffer_started_at: Dict[str, float] = {}
+        self._pending = 0
+        self._flush_requested = False
+        self._closed = False
+        self._condition = threading.Condition()
+
+        self._thread = threading.Thread(
+            target=self._run, name="bugout-journal-entry-writer", daemon=True
+        )
+        self._thread.start()
+
+        self._flush_on_exit = flush_on_exit
+        if flush_on_exit:
+            atexit.register(self.close)
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def write(
+        self,
+        journal_id: Union[str, uuid.UUID],
+        title: str,
+        content: str,
+        tags: Optional[List[str]] = None,
+        context_url: Optional[str] = None,
+        context_id: Optional[str] = None,
+        context_type: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        Add entry to journal buffer. Returns False if entry was dropped because
+        buffer is full.
+        """
+        entry = BugoutJournalEntryRequest(
+            title=title,
+            content=content,
+            tags=tags if tags is not None else [],
+            context_url=context_url,
+            context_id=context_id,
+            context_type=context_type,
+        )
+        journal_key = str(journal_id)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Journal entry writer is closed")
+            if self._pending >= self.max_pending:
+                if self.block:
+                    self._condition.wait_for(
+                        lambda: self._pending < self.max_pending or self._closed,
+                        timeout=timeout,
+                    )
+                if self._pending >= self.max_pending or self._closed:
+                    self.dropped += 1
+                    return False
+
+            buffer = self._buffers.setdefault(journal_key, [])
+            if not buffer:
+                self._buffer_started_at[journal_key] = time.monotonic()
+            buffer.append(entry)
+            self._pending += 1
+            if len(buffer) == 1 or len(buffer) >= self.batch_size:
+                self._condition.notify_all()
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Send all buffered entries and wait until they are processed.
+        """
+        with self._condition:
+            self._flush_requested = True
+            self._condition.notify_all()
+            return self._condition.wait_for(lambda: self._pending == 0, timeout=timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout=timeout)
+        if self._flush_on_exit:
+            atexit.unregister(self.close)
+
+    def __enter__(self) -> "JournalEntryWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _ready_batches(
+        self, force: bool
+    ) -> List[Tuple[str, List[BugoutJournalEntryRequest]]]:
+        now = time.monotonic()
+        batches: List[Tuple[str, List[BugoutJournalEntryRequest]]] = []
+        for journal_key, buffer in self._buffers.items():
+            if not buffer:
+                continue
+            expired = now - self._buffer_started_at[journal_key] >= self.flush_interval
+            if force or expired or len(buffer) >= self.batch_size:
+                batches.append((journal_key, buffer[: self.batch_size]))
+                del buffer[: self.batch_size]
+                self._buffer_started_at[journal_key] = now
+        return batches
+
+    def _next_deadline(self) -> Optional[float]:
+        started_at = [
+            self._buffer_started_at[journal_key]
+            for journal_key, buffer in self._buffers.items()
+            if buffer
+        ]
+        if not started_at:
+            return None
+        return min(started_at) + self.flush_interval - time.monotonic()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                batches = self._ready_batches(
+                    force=self._flush_requested or self._closed
+                )
+                if not batches:
+                    if self._pending == 0:
+                        self._flush_requested = False
+                        if self._closed:
+                            return
+                    self._condition.wait(timeout=self._next_deadline())
+                    continue
+
+            for journal_key, batch in batches:
+                self._send(journal_key, batch)
+
+            with self._condition:
+                self._pending -= sum(len(batch) for _, batch in batches)
+                self._condition.notify_all()
+
+    def _send(self, journal_key: str, batch: List[BugoutJournalEntryRequest]) -> None:
+        try:
+            self.journal.create_entries_pack(
+                token=self.token,
+                journal_id=journal_key,
+                entries=BugoutJournalEntriesRequest(entries=batch),
+            )
+            self.sent += len(batch)
+        except Exception as e:
+            self.failed += len(batch)
+            if self.on_error is not None:
+                # Exception of callback must not stop the thread, flush() and close()
+                # would wait for pending entries forever
+                try:
+                    self.on_error(e, journal_key, batch)
+                except Exception:
+                    logger.exception("on_error callback of journal entry writer failed")
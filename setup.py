@@ -34,14 +34,18 @@ setup(
         "Topic :: Software Development :: Libraries",
         "Topic :: Software Development :: Libraries :: Python Modules",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     packages=find_packages(),
     package_data={"bugout": ["py.typed"]},
     zip_safe=False,
     install_requires=["pydantic>=1.6", "requests"],
     extras_require={
-        "dev": ["black", "mypy", "types-requests"],
+        "arrow": ["pyarrow"],
+        "async": ["httpx"],
+        "compression": ["brotli", "zstandard"],
+        "dev": ["black", "httpx", "mypy", "types-requests"],
         "distribute": ["setuptools", "twine", "wheel"],
+        "otel": ["opentelemetry-api"],
     },
     entry_points={
         "console_scripts": ["{0}-py = {0}.__main__:main".format(MODULE_NAME)]
@@ -0,0 +1,103 @@
+import json
+import unittest
+
+from bugout.exceptions import BugoutUnexpectedResponse
+from bugout.streaming import JSONArrayDecoder
+
+PAYLOAD = json.dumps(
+    {
+        "total_results": 1500,
+        "max_score": 15e3,
+        "entries": [
+            1500.0,
+            -0.25,
+            15e3,
+            1.5e-7,
+            0,
+            True,
+            False,
+            None,
+            "plain",
+            'brackets ] } [ { and "quotes" \\ escaped',
+            "unicode é中\U0001f600",
+            {"id": "1", "tags": ["a", "b"], "nested": {"list": [[], {}], "n": 12.5}},
+            [1, [2, [3]]],
+            {},
+            [],
+        ],
+        "next_offset": None,
+        "offset": 0.0,
+    },
+    ensure_ascii=False,
+    indent=1,
+).encode()
+
+
+def decode(chunks, key="entries"):
+    decoder = JSONArrayDecoder(key)
+    items = []
+    for chunk in chunks:
+        items.extend(decoder.feed(chunk))
+    items.extend(decoder.close())
+    return items
+
+
+def splits(payload):
+    for split in range(len(payload) + 1):
+        yield [payload[:split], payload[split:]]
+
+
+class TestJSONArrayDecoder(unittest.TestCase):
+    def test_every_split_point(self):
+        expected = json.loads(PAYLOAD)["entries"]
+        for chunks in splits(PAYLOAD):
+            with self.subTest(split=len(chunks[0])):
+                self.assertEqual(decode(chunks), expected)
+
+    def test_byte_by_byte(self):
+        chunks = [PAYLOAD[i : i + 1] for i in range(len(PAYLOAD))]
+        self.assertEqual(decode(chunks), json.loads(PAYLOAD)["entries"])
+
+    def test_top_level_array(self):
+        payload = b'[1500.0, 15e3, {"a": [1, "]"]}, "x"]'
+        for chunks in splits(payload):
+            with self.subTest(split=len(chunks[0])):
+                self.assertEqual(decode(chunks, key=None), json.loads(payload))
+
+    def test_numbers_cut_at_chunk_boundary(self):
+        self.assertEqual(decode([b'{"entries":[1500.', b"0]}"]), [1500.0])
+        self.assertEqual(decode([b'{"entries":[15e', b"3]}"]), [15e3])
+        self.assertEqual(decode([b'{"total_results":15', b'00,"entries":[]}']), [])
+
+    def test_item_spanning_many_chunks(self):
+        item = {"content": "x" * 100000, "tags": ["]" * 10, "{"]}
+        payload = json.dumps({"entries": [item, item]}).encode()
+        chunks = [payload[i : i + 1000] for i in range(0, len(payload), 1000)]
+        self.assertEqual(decode(chunks), [item, item])
+
+    def test_items_returned_as_they_complete(self):
+        decoder = JSONArrayDecoder("entries")
+        self.assertEqual(decoder.feed(b'{"entries":[{"a":1},{"b"'), [{"a": 1}])
+        self.assertEqual(decoder.feed(b":2}]}"), [{"b": 2}])
+        self.assertEqual(decoder.close(), [])
+
+    def test_invalid_json_raises_at_every_split_point(self):
+        for payload in (
+            b'{"entries":[1,]}',
+            b'{"entries":[1],}',
+            b'{"entries":[,1]}',
+            b'{"entries":[1 2]}',
+            b'{"entries":[1500.x]}',
+            b'{"entries":[{"a":1,}]}',
+            b'{"entries":[1]',
+            b'{"items":[1]}',
+            b'{"entries":[1]} 2',
+        ):
+            for chunks in splits(payload):
+                with self.subTest(payload=payload, split=len(chunks[0])):
+                    with self.assertRaises(BugoutUnexpectedResponse):
+                        decode(chunks)
+
+
+if __name__ == "__main__":
+    unittest.main()